@@ -0,0 +1,12 @@
+"""
+Benchmarks of mpltern for airspeed velocity (asv).
+
+Each benchmark has a ``time_`` and a ``peakmem_`` variant so that both the
+speed and the peak memory are tracked. Run e.g.::
+
+    asv run
+    asv continuous main HEAD
+    asv run --quick --bench Binning
+
+from the root of the repository.
+"""
@@ -0,0 +1,41 @@
+"""Benchmarks of drawing and of setting the limits of `TernaryAxes`."""
+import matplotlib.ticker as mticker
+
+from .common import TernaryAxesBenchmark
+
+
+class Draw(TernaryAxesBenchmark):
+    """Full draw with the Agg backend."""
+    params = [['default', 'dense']]
+    param_names = ['ticks']
+
+    def setup(self, ticks):
+        super().setup()
+        ax = self.ax
+        if ticks == 'dense':
+            for axis in (ax.taxis, ax.laxis, ax.raxis):
+                axis.set_major_locator(mticker.MultipleLocator(0.05))
+                axis.set_minor_locator(mticker.MultipleLocator(0.01))
+            ax.grid()
+        ax.set_tlabel('Top')
+        ax.set_llabel('Left')
+        ax.set_rlabel('Right')
+        # The first draw includes, e.g., caching of the fonts.
+        self.fig.canvas.draw()
+
+    def time_draw(self, ticks):
+        self.fig.canvas.draw()
+
+    def peakmem_draw(self, ticks):
+        self.fig.canvas.draw()
+
+
+class TernaryLim(TernaryAxesBenchmark):
+    params = [['rectangle', 'triangle', 'none']]
+    param_names = ['fit']
+
+    def time_set_ternary_lim(self, fit):
+        self.ax.set_ternary_lim(0.1, 0.5, 0.2, 0.6, 0.3, 0.7, fit=fit)
+
+    def peakmem_set_ternary_lim(self, fit):
+        self.ax.set_ternary_lim(0.1, 0.5, 0.2, 0.6, 0.3, 0.7, fit=fit)
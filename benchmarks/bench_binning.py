@@ -0,0 +1,27 @@
+"""Benchmarks of `hexbin` and `tribin`."""
+from .common import TernaryAxesBenchmark, get_points
+
+
+class Binning(TernaryAxesBenchmark):
+    params = (
+        ['hexbin', 'tribin'],
+        [1_000, 100_000],
+        [10, 100],
+        [False, True],
+    )
+    param_names = ['method', 'n', 'gridsize', 'C']
+
+    def setup(self, method, n, gridsize, C):
+        super().setup()
+        self.tlr = get_points(n)
+        self.C = self.tlr[0] if C else None
+
+    def _bin(self, method, gridsize):
+        f = getattr(self.ax, method)
+        f(*self.tlr, C=self.C, gridsize=gridsize).remove()
+
+    def time_binning(self, method, n, gridsize, C):
+        self._bin(method, gridsize)
+
+    def peakmem_binning(self, method, n, gridsize, C):
+        self._bin(method, gridsize)
@@ -0,0 +1,13 @@
+"""Benchmarks of `mpltern.datasets`."""
+from mpltern.datasets import get_triangular_grid
+
+
+class TriangularGrid:
+    params = [[11, 51, 101]]
+    param_names = ['n']
+
+    def time_get_triangular_grid(self, n):
+        get_triangular_grid(n)
+
+    def peakmem_get_triangular_grid(self, n):
+        get_triangular_grid(n)
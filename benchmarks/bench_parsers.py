@@ -0,0 +1,25 @@
+"""Benchmarks of the projection of ternary data in `_ternary_parsers`."""
+from mpltern._ternary_parsers import _get_xy
+
+from .common import TernaryAxesBenchmark, get_points
+
+
+class Parsers(TernaryAxesBenchmark):
+    params = [[100, 10_000, 1_000_000]]
+    param_names = ['n']
+
+    def setup(self, n):
+        super().setup()
+        self.tlr = get_points(n)
+
+    def time_get_xy(self, n):
+        _get_xy(self.ax, self.tlr, None)
+
+    def peakmem_get_xy(self, n):
+        _get_xy(self.ax, self.tlr, None)
+
+    def time_plot(self, n):
+        self.ax.plot(*self.tlr)[0].remove()
+
+    def peakmem_plot(self, n):
+        self.ax.plot(*self.tlr)[0].remove()
@@ -0,0 +1,81 @@
+"""Benchmarks of the transforms in `mpltern.ternary.transforms`."""
+from mpltern.ternary.transforms import (
+    TernaryLinearTransform,
+    TernaryAxisTransform, InvertedTernaryAxisTransform,
+    TernaryTickLabelShift,
+    BarycentricTransform, InvertedBarycentricTransform,
+    H2THeightTransform, T2HHeightTransform,
+    H2TWidthTransform, T2HWidthTransform,
+)
+
+from .common import TernaryAxesBenchmark, get_points
+
+
+class Transforms(TernaryAxesBenchmark):
+    """Non-affine transforms applied to *n* points."""
+    params = (
+        [
+            'TernaryLinearTransform',
+            'TernaryAxisTransform',
+            'InvertedTernaryAxisTransform',
+            'BarycentricTransform',
+            'InvertedBarycentricTransform',
+            'H2THeightTransform',
+            'T2HHeightTransform',
+            'H2TWidthTransform',
+            'T2HWidthTransform',
+        ],
+        [1_000, 1_000_000],
+    )
+    param_names = ['transform', 'n']
+
+    def setup(self, transform, n):
+        super().setup()
+        ax = self.ax
+        corners = ax.corners_axes
+        lims = [ax.viewTLim, ax.viewLLim, ax.viewRLim]
+        self.trans = {
+            'TernaryLinearTransform': TernaryLinearTransform(1.0),
+            'TernaryAxisTransform': TernaryAxisTransform(corners, 0),
+            'InvertedTernaryAxisTransform':
+                InvertedTernaryAxisTransform(corners, 0),
+            'BarycentricTransform': BarycentricTransform(corners),
+            'InvertedBarycentricTransform':
+                InvertedBarycentricTransform(corners),
+            'H2THeightTransform': H2THeightTransform(1.0, lims, 0),
+            'T2HHeightTransform': T2HHeightTransform(1.0, lims, 0),
+            'H2TWidthTransform': H2TWidthTransform(1.0, lims, 0),
+            'T2HWidthTransform': T2HWidthTransform(1.0, lims, 0),
+        }[transform]
+        self.values = get_points(n).T[:, :self.trans.input_dims].copy()
+
+    def time_transform(self, transform, n):
+        self.trans.transform(self.values)
+
+    def peakmem_transform(self, transform, n):
+        self.trans.transform(self.values)
+
+
+class AffineTransforms(TernaryAxesBenchmark):
+    """Affine transforms computing their matrices on the fly."""
+    params = [[
+        'TernaryTickLabelShift',
+        'TernaryAxisLabelSTransform',
+        'TernaryAxisLabelCTransform',
+    ]]
+    param_names = ['transform']
+
+    def setup(self, transform):
+        super().setup()
+        ax = self.ax
+        self.trans = {
+            'TernaryTickLabelShift': TernaryTickLabelShift(ax, 4.0, [1, 2]),
+            'TernaryAxisLabelSTransform': ax._tlabel_s_transform,
+            'TernaryAxisLabelCTransform': ax._tlabel_c_transform,
+        }[transform]
+
+    def time_get_matrix(self, transform):
+        self.trans.get_matrix()
+
+    def peakmem_get_matrix(self, transform):
+        self.trans.get_matrix()
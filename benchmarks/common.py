@@ -0,0 +1,24 @@
+import numpy as np
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+
+import mpltern  # noqa: E402, F401
+
+
+def get_points(n, seed=19680801):
+    """Return ``(3, n)`` random ternary points."""
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(alpha=(2.0, 4.0, 8.0), size=n).T
+
+
+class TernaryAxesBenchmark:
+    """Base class creating a figure with a `TernaryAxes` in `setup`."""
+
+    def setup(self, *args):
+        self.fig = plt.figure()
+        self.ax = self.fig.add_subplot(projection='ternary')
+
+    def teardown(self, *args):
+        plt.close(self.fig)
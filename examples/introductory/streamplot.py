@@ -0,0 +1,45 @@
+"""
+==========
+Streamplot
+==========
+
+Streamlines of a vector field can be plotted using ``ax.streamplot``.
+The field is given either on points like ``ax.quiver`` or as a function of
+``t``, ``l``, ``r``.
+"""
+import numpy as np
+
+import matplotlib.pyplot as plt
+from mpltern.datasets import get_triangular_grid
+
+
+def replicator(t, l, r):
+    """Replicator dynamics of the rock-paper-scissors game."""
+    x = np.stack((t, l, r))
+    payoff_matrix = np.array([
+        [0.0, -1.0, 2.0],
+        [2.0, 0.0, -1.0],
+        [-1.0, 2.0, 0.0],
+    ])
+    fitness = payoff_matrix @ x
+    return (fitness - np.sum(fitness * x, axis=0)) * x
+
+
+t, l, r = get_triangular_grid(25)
+dt, dl, dr = replicator(t, l, r)
+speed = np.sqrt(dt ** 2 + dl ** 2 + dr ** 2)
+
+fig = plt.figure(figsize=(10.8, 4.8))
+fig.subplots_adjust(left=0.075, right=0.85, wspace=0.3)
+
+ax = fig.add_subplot(121, projection='ternary')
+ax.streamplot(replicator)
+
+ax = fig.add_subplot(122, projection='ternary')
+sc = ax.streamplot(t, l, r, dt, dl, dr, color=speed, cmap='viridis')
+
+cax = ax.inset_axes([1.05, 0.1, 0.05, 0.9], transform=ax.transAxes)
+colorbar = fig.colorbar(sc.lines, cax=cax)
+colorbar.set_label('Speed', rotation=270, va='baseline')
+
+plt.show()
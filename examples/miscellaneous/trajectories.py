@@ -0,0 +1,44 @@
+"""
+============
+Trajectories
+============
+
+Many trajectories, e.g., of the
+`replicator equation <https://en.wikipedia.org/wiki/Replicator_equation>`__
+from many initial states, can be plotted at once by ``trajectories`` as a
+single ``LineCollection``, which is much faster than calling ``plot`` for
+each trajectory.
+"""
+import matplotlib.pyplot as plt
+import numpy as np
+import mpltern  # noqa: F401
+
+payoff_matrix = np.array([
+    [0.0, -1.0, 2.0],
+    [2.0, 0.0, -1.0],
+    [-1.0, 2.0, 0.0],
+])
+
+np.random.seed(19680801)
+x = np.random.dirichlet(alpha=(1.0, 1.0, 1.0), size=100)
+
+# (K, N, 3) array of K trajectories with N points
+dt = 0.02
+tlrs = np.empty((len(x), 200, 3))
+for i in range(tlrs.shape[1]):
+    tlrs[:, i] = x
+    fitness = x @ payoff_matrix.T
+    x = x + dt * x * (fitness - np.sum(fitness * x, axis=1)[:, None])
+
+ax = plt.subplot(projection="ternary")
+
+lc = ax.trajectories(tlrs, C=tlrs[:, 0, 0], cmap="viridis", linewidth=0.5)
+
+ax.set_tlabel("$x_0$")
+ax.set_llabel("$x_1$")
+ax.set_rlabel("$x_2$")
+
+colorbar = plt.colorbar(lc, ax=ax)
+colorbar.set_label("Initial $x_0$", rotation=270, va="baseline")
+
+plt.show()
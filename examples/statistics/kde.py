@@ -0,0 +1,26 @@
+"""
+=======================
+Kernel density estimate
+=======================
+
+`mpltern.kde.ternary_kde` gives a kernel density estimate on the nodes of the
+triangular lattice. The points are binned to the lattice and convolved with a
+Gaussian kernel, which is fast even for millions of points.
+The result can be given directly to `ax.tricontourf`.
+"""
+import numpy as np
+
+import matplotlib.pyplot as plt
+import mpltern
+from mpltern.kde import ternary_kde
+
+np.random.seed(19680801)
+t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000000).T
+
+# %%
+ax = plt.subplot(projection="ternary")
+
+t, l, r, densities = ternary_kde(t, l, r, gridsize=100)
+ax.tricontourf(t, l, r, densities)
+
+plt.show()
@@ -0,0 +1,35 @@
+"""
+========
+PixelBin
+========
+
+`ax.pixelbin` aggregates data points directly into the pixels of the Axes and
+shows the result as an image clipped to the triangle.
+This is suitable for a huge number of points, for which `ax.scatter` is slow
+to draw and heavy in vector formats.
+The aggregation is redone when the figure is resized or the ternary limits are
+changed.
+"""
+import numpy as np
+
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+import mpltern
+
+np.random.seed(19680801)
+t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000000).T
+
+# %%
+ax = plt.subplot(projection="ternary")
+
+ax.pixelbin(t, l, r, norm=LogNorm())
+
+plt.show()
+
+# %%
+ax = plt.subplot(projection="ternary")
+
+# Mean of values in each bin of 4x4 pixels
+ax.pixelbin(t, l, r, C=t, reduce_C_function="mean", pixelsize=4.0)
+
+plt.show()
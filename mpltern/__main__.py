@@ -0,0 +1,72 @@
+"""
+Render ternary figures of many datasets in parallel.
+
+Examples
+--------
+::
+
+    python -m mpltern data/ -o figures --method hexbin --grid -j 8
+    python -m mpltern manifest.txt -o figures --spec spec.json --format pdf
+"""
+import argparse
+import json
+import logging
+import sys
+
+from mpltern.batch import DEFAULT_SPEC, FORMATS, METHODS, render_batch
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m mpltern',
+        description=(
+            'Render ternary figures of datasets (CSV/NPY/NPZ) in parallel.'),
+    )
+    parser.add_argument(
+        'datasets', nargs='+',
+        help='dataset files, directories, or manifests listing the files')
+    parser.add_argument(
+        '-o', '--outdir', default='.', help='output directory')
+    parser.add_argument(
+        '--spec',
+        help='JSON file of the plot specification; overridden by the options')
+    parser.add_argument('--method', choices=METHODS)
+    for name in ('tlim', 'llim', 'rlim'):
+        parser.add_argument(
+            f'--{name}', nargs=2, type=float, metavar=('MIN', 'MAX'))
+    for name in ('tlabel', 'llabel', 'rlabel', 'title'):
+        parser.add_argument(f'--{name}')
+    parser.add_argument(
+        '--grid', action='store_true', default=None, help='draw the grid')
+    parser.add_argument('--dpi', type=float)
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument(
+        '-q', '--quiet', action='store_true', help='do not report progress')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    spec = {}
+    if args.spec is not None:
+        with open(args.spec, encoding='utf-8') as f:
+            spec.update(json.load(f))
+    for key in DEFAULT_SPEC:
+        value = getattr(args, key, None)
+        if value is not None:
+            spec[key] = value
+
+    if not args.quiet:
+        logging.basicConfig(format='%(message)s')
+        logging.getLogger('mpltern.batch').setLevel(logging.INFO)
+
+    render_batch(
+        args.datasets, args.outdir, spec, fmt=args.format, jobs=args.jobs)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
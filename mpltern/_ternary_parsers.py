@@ -1,13 +1,17 @@
 import functools
+import hashlib
 from collections.abc import Iterable
 
 import numpy as np
 import matplotlib as mpl
+import matplotlib.tri as mtri
+from mpltern.ternary.profiling import profiled_axes_method
 
 
+@profiled_axes_method('parse')
 def _get_xy(ax, this, trans):
     t, l, r = this
-    tlr = np.column_stack((t, l, r))
+    tlr = np.column_stack((t, l, r)).astype(ax._get_float_dtype(), copy=False)
     if trans == ax.transTernaryAxes:
         trans_xy = ax.transOuterAxes
         x, y = ax.transAxesProjection.transform(tlr).T
@@ -23,6 +27,34 @@ def _get_xy(ax, this, trans):
     return x, y, trans_xy
 
 
+@profiled_axes_method('parse.triangulation')
+def _get_triangulation(ax, this, trans):
+    """Get the `Triangulation` of ternary data, reusing the one cached.
+
+    The cache key is the content of ``(t, l, r)`` together with the projection
+    to Cartesian coordinates and the precision of the Axes, so the same
+    compositions plotted repeatedly with different scalar fields are projected
+    and triangulated only once.
+    """
+    tlr = np.ascontiguousarray(np.column_stack(this))
+    key = (
+        hashlib.blake2b(tlr.tobytes(), digest_size=16).digest(),
+        tlr.shape,
+        tlr.dtype.str,
+        trans == ax.transTernaryAxes,
+        ax._precision,
+    )
+    cache = ax._triangulation_cache
+    if key in cache:
+        return cache[key]
+    x, y, trans_xy = _get_xy(ax, this, trans)
+    value = mtri.Triangulation(x, y), trans_xy
+    if len(cache) >= ax._triangulation_cache_size:
+        del cache[next(iter(cache))]  # drop the oldest entry
+    cache[key] = value
+    return value
+
+
 def parse_ternary_single(f):
     """
     Parse ternary data from the first 3 arguments.
@@ -44,6 +76,34 @@ def parse_ternary_single(f):
     return parse
 
 
+def parse_ternary_triangulation(f):
+    """
+    Parse ternary data from the first 3 arguments into a `Triangulation`.
+
+    The `Triangulation` is cached in the Axes, and therefore the same ternary
+    data given to e.g. ``tricontour`` and ``tripcolor`` is triangulated only
+    once. If ``triangles`` or ``mask`` are given, the data are parsed in the
+    same way as `parse_ternary_single`.
+    """
+    single = parse_ternary_single(f)
+
+    @functools.wraps(f)
+    def parse(ax, *args, **kwargs):
+        trans = kwargs.get('transform', None)
+        if (len(args) < 3 or (trans is not None and trans.input_dims == 2)
+                or 'triangles' in kwargs or 'mask' in kwargs
+                or (len(args) > 3 and np.ndim(args[3]) == 2)):
+            return single(ax, *args, **kwargs)
+
+        kwargs.pop('transform', None)
+        this, args = args[:3], args[3:]
+        triangulation, kwargs['transform'] = _get_triangulation(
+            ax, this, trans)
+        return f(ax, triangulation, *args, **kwargs)
+
+    return parse
+
+
 def parse_ternary_multiple(f):
     """
     Parse ternary data from each set of 3 (or 4 for format strings) arguments.
@@ -0,0 +1,293 @@
+"""
+Batch rendering of ternary figures of many datasets in a process pool.
+
+Each worker process builds the ternary frame once according to the plot
+specification and renders the datasets assigned to it by reusing the frame
+with `mpltern.rendering.TernaryTemplate`.
+
+The datasets are given as files of the following formats.
+
+- ``.csv``: Columns of *t*, *l*, *r*, and optionally *C*, separated by
+  commas. A header line, if any, is skipped.
+- ``.npy``: Array of shape ``(N, 3)`` or ``(N, 4)`` with the same columns.
+- ``.npz``: Arrays named ``t``, ``l``, ``r``, and optionally ``C``.
+
+The command-line interface is ``python -m mpltern``.
+"""
+import concurrent.futures
+import logging
+import os
+import pathlib
+import time
+
+import numpy as np
+
+from matplotlib import _api
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from mpltern.rendering import TernaryTemplate
+
+_log = logging.getLogger(__name__)
+
+SUFFIXES = ('.csv', '.npy', '.npz')
+
+METHODS = ('scatter', 'hexbin', 'tribin', 'tricontourf')
+
+FORMATS = ('png', 'pdf')
+
+# Default plot specification
+DEFAULT_SPEC = {
+    'method': 'scatter',  # One of `METHODS`
+    'kwargs': {},  # Keyword arguments for the method
+    'ternary_sum': 1.0,
+    'tlim': None,  # (tmin, tmax)
+    'llim': None,  # (lmin, lmax)
+    'rlim': None,  # (rmin, rmax)
+    'tlabel': None,
+    'llabel': None,
+    'rlabel': None,
+    'title': None,
+    'grid': False,
+    'figsize': None,  # (width, height) in inches
+    'dpi': None,
+}
+
+
+def find_datasets(paths):
+    """Find the dataset files.
+
+    Parameters
+    ----------
+    paths : str or path-like or list thereof
+        Dataset files, directories containing dataset files, or manifests,
+        i.e., text files listing the dataset files line by line. Relative
+        paths in a manifest are relative to the manifest. Empty lines and
+        lines starting with ``#`` in a manifest are ignored.
+
+    Returns
+    -------
+    list of `pathlib.Path`
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    datasets = []
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            datasets.extend(sorted(
+                _ for _ in path.iterdir() if _.suffix in SUFFIXES))
+        elif path.suffix in SUFFIXES:
+            datasets.append(path)
+        else:
+            with open(path, encoding='utf-8') as f:
+                lines = [_.strip() for _ in f]
+            datasets.extend(
+                path.parent / _ for _ in lines if _ and not _.startswith('#'))
+    return datasets
+
+
+def load_dataset(path):
+    """Load a dataset.
+
+    Parameters
+    ----------
+    path : str or path-like
+        ``.csv``, ``.npy``, or ``.npz`` file.
+
+    Returns
+    -------
+    t, l, r : ndarray
+    C : ndarray or None
+    """
+    path = pathlib.Path(path)
+    _api.check_in_list(SUFFIXES, suffix=path.suffix)
+    if path.suffix == '.npz':
+        with np.load(path) as data:
+            C = data['C'] if 'C' in data else None
+            return data['t'], data['l'], data['r'], C
+    if path.suffix == '.npy':
+        values = np.load(path)
+    else:
+        with open(path, encoding='utf-8') as f:
+            first = f.readline()
+        try:
+            [float(_) for _ in first.split(',')]
+            skiprows = 0
+        except ValueError:
+            skiprows = 1
+        values = np.loadtxt(path, delimiter=',', skiprows=skiprows, ndmin=2)
+    if values.ndim != 2 or values.shape[1] not in (3, 4):
+        raise ValueError(
+            f"'{path}' must have 3 or 4 columns (t, l, r, and optionally C)")
+    C = values[:, 3] if values.shape[1] == 4 else None
+    return values[:, 0], values[:, 1], values[:, 2], C
+
+
+def _get_spec(spec):
+    if spec is None:
+        spec = {}
+    unknown = set(spec) - set(DEFAULT_SPEC)
+    if unknown:
+        raise ValueError(f"Unknown keys in 'spec': {sorted(unknown)}")
+    spec = {**DEFAULT_SPEC, **spec}
+    _api.check_in_list(METHODS, method=spec['method'])
+    return spec
+
+
+def create_frame(spec=None):
+    """Create the figure with the ternary frame of the plot specification.
+
+    Parameters
+    ----------
+    spec : dict, optional
+        Plot specification. See `DEFAULT_SPEC` for the keys.
+
+    Returns
+    -------
+    fig : `~matplotlib.figure.Figure`
+    ax : `~mpltern.ternary.TernaryAxes`
+    """
+    spec = _get_spec(spec)
+    fig = Figure(figsize=spec['figsize'], dpi=spec['dpi'])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection='ternary', ternary_sum=spec['ternary_sum'])
+    for name in ('tlim', 'llim', 'rlim'):
+        if spec[name] is not None:
+            getattr(ax, f'set_{name}')(*spec[name])
+    for name in ('tlabel', 'llabel', 'rlabel', 'title'):
+        if spec[name] is not None:
+            getattr(ax, f'set_{name}')(spec[name])
+    if spec['grid']:
+        ax.grid()
+    return fig, ax
+
+
+def plot_dataset(ax, t, l, r, C=None, spec=None):
+    """Plot a dataset according to the plot specification.
+
+    Parameters
+    ----------
+    ax : `~mpltern.ternary.TernaryAxes`
+    t, l, r : array-like
+    C : array-like, optional
+        Values for the colors. Required for ``'tricontourf'``.
+    spec : dict, optional
+        Plot specification. See `DEFAULT_SPEC` for the keys.
+    """
+    spec = _get_spec(spec)
+    method = spec['method']
+    kwargs = dict(spec['kwargs'])
+    if method == 'scatter':
+        if C is not None:
+            kwargs['c'] = C
+        return ax.scatter(t, l, r, **kwargs)
+    if method in ('hexbin', 'tribin'):
+        return getattr(ax, method)(t, l, r, C=C, **kwargs)
+    if C is None:
+        raise ValueError("'tricontourf' requires the column C")
+    return ax.tricontourf(t, l, r, C, **kwargs)
+
+
+# Frame of the worker process, created by `_init_worker`
+_worker = {}
+
+
+def _init_worker(spec):
+    fig, ax = create_frame(spec)
+    _worker['spec'] = spec
+    _worker['template'] = TernaryTemplate(fig, ax)
+
+
+def _render(path, fname, fmt):
+    start = time.perf_counter()
+    t, l, r, C = load_dataset(path)
+    template = _worker['template']
+
+    def plot(ax):
+        plot_dataset(ax, t, l, r, C, _worker['spec'])
+
+    if fmt == 'png':
+        template.render(plot, fname)
+    else:
+        template.savefig(plot, fname, format=fmt)
+    return os.getpid(), time.perf_counter() - start
+
+
+def render_batch(datasets, outdir, spec=None, fmt='png', jobs=None,
+                 callback=None):
+    """Render the ternary figures of the datasets in a process pool.
+
+    Parameters
+    ----------
+    datasets : str or path-like or list thereof
+        Dataset files, directories, or manifests; see `find_datasets`.
+    outdir : str or path-like
+        Directory for the output files, which are named after the datasets
+        with the suffix of *fmt*. It is created if not existing. Datasets
+        that would give the same output file, e.g., ``a.csv`` and ``a.npy``,
+        raise `ValueError`.
+    spec : dict, optional
+        Plot specification. See `DEFAULT_SPEC` for the keys.
+    fmt : {'png', 'pdf'}, default: 'png'
+        Format of the output files.
+    jobs : int, optional
+        Number of worker processes. By default the number of CPUs. If 1,
+        the datasets are rendered in the current process.
+    callback : callable, optional
+        ``callback(done, total, path, elapsed)`` called when each dataset is
+        rendered, e.g., to report the progress.
+
+    Returns
+    -------
+    dict
+        Statistics with the keys ``'count'`` (number of datasets),
+        ``'wall_time'`` and ``'render_time'`` (sum over the datasets) in
+        seconds, ``'throughput'`` (datasets per second), and ``'workers'``
+        (number of datasets rendered by each worker process ID).
+    """
+    spec = _get_spec(spec)
+    _api.check_in_list(FORMATS, fmt=fmt)
+    paths = find_datasets(datasets)
+    outdir = pathlib.Path(outdir)
+    tasks = [(path, outdir / f'{path.stem}.{fmt}', fmt) for path in paths]
+    sources = {}
+    for path, fname, _ in tasks:
+        sources.setdefault(fname, []).append(str(path))
+    duplicates = {k: v for k, v in sources.items() if len(v) > 1}
+    if duplicates:
+        raise ValueError(
+            "Datasets would overwrite the same output files: " + "; ".join(
+                f"{', '.join(v)} -> {k}" for k, v in duplicates.items()))
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    stats = {'count': len(tasks), 'render_time': 0.0, 'workers': {}}
+
+    def done(path, pid, elapsed):
+        stats['render_time'] += elapsed
+        stats['workers'][pid] = stats['workers'].get(pid, 0) + 1
+        count = sum(stats['workers'].values())
+        _log.info('[%d/%d] %s (%.3f s)', count, len(tasks), path, elapsed)
+        if callback is not None:
+            callback(count, len(tasks), path, elapsed)
+
+    start = time.perf_counter()
+    if jobs == 1:
+        _init_worker(spec)
+        for task in tasks:
+            done(task[0], *_render(*task))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(spec,)) as executor:
+            futures = {executor.submit(_render, *_): _[0] for _ in tasks}
+            for future in concurrent.futures.as_completed(futures):
+                done(futures[future], *future.result())
+    stats['wall_time'] = time.perf_counter() - start
+    stats['throughput'] = (
+        stats['count'] / stats['wall_time'] if stats['wall_time'] else 0.0)
+    _log.info(
+        '%d datasets in %.3f s (%.1f datasets/s); %.3f s of rendering over '
+        '%d workers', stats['count'], stats['wall_time'],
+        stats['throughput'], stats['render_time'], len(stats['workers']))
+    return stats
@@ -0,0 +1,117 @@
+"""
+Conversions between ternary and Cartesian coordinates without Axes.
+
+The functions give the same coordinates as ``ax.transProjection`` and its
+inverse of a `TernaryAxes` created with the same *corners*, *rotation*, and
+*ternary_sum*, i.e., the data coordinates of the Axes, but need no Figure.
+They are vectorized over the leading dimensions of the inputs, write into
+``out`` if given, and keep ``float32`` inputs in ``float32``.
+"""
+import numpy as np
+
+import matplotlib.transforms as mtransforms
+
+
+def get_corners(corners=None, rotation=None):
+    """Return the corners of the triangle in the data coordinates.
+
+    Parameters
+    ----------
+    corners : (3, 2) array_like, optional
+        Corners of the triangle. By default, the regular upward triangle
+        with the bottom at ``y = 0``, the top at ``y = 1``, and the
+        horizontal center at ``x = 0``.
+    rotation : float, optional
+        Rotation angle of the triangle in degrees around its centroid. The
+        rotated triangle is shifted to be centered at ``(0, 0.5)``.
+
+    Returns
+    -------
+    (3, 2) np.ndarray
+        Corners for the top, left, and right axes.
+    """
+    if corners is None:
+        # By default, regular upward triangle is created.
+        # The bottom and the top of the triangle have 0.0 and 1.0,
+        # respectively, as the *y* coordinate in the original `Axes`
+        # coordinates.
+        # The horizontal center of the triangle has 0.0 as the *x*
+        # coordinate in the original `Axes` coordinates.
+        # The other coordinates are given to make the regular triangle.
+        xmin = -1.0 / np.sqrt(3.0)
+        xmax = +1.0 / np.sqrt(3.0)
+        corners = ((0.0, 1.0), (xmin, 0.0), (xmax, 0.0))
+    corners = np.asarray(corners, float)
+    if rotation is not None:
+        # The rotation is done around the centroid of the given triangle.
+        cx, cy = np.average(corners, axis=0)
+        trans = mtransforms.Affine2D().rotate_deg_around(cx, cy, rotation)
+        corners = trans.transform(corners)
+        # The following shift places the triangle inside the original
+        # square `Axes` as much as possible.
+        tmp = (np.min(corners, axis=0) + np.max(corners, axis=0)) * 0.5
+        corners += (np.array([0.0, 0.5]) - tmp)
+    return corners
+
+
+def _get_dtype(values, out):
+    if out is not None:
+        return out.dtype
+    # float32 (and float16) give float32, and integers give float64.
+    return np.result_type(values.dtype, np.float32)
+
+
+def ternary_to_cartesian(tlr, corners=None, rotation=None, out=None):
+    """Convert ternary coordinates to Cartesian coordinates.
+
+    Parameters
+    ----------
+    tlr : (..., 3) array_like
+        Ternary coordinates. They need not be normalized; each point is
+        divided by its sum, and therefore *ternary_sum* does not matter.
+    corners, rotation
+        Triangle as in `get_corners`.
+    out : (..., 2) np.ndarray, optional
+        Array to write the result to.
+
+    Returns
+    -------
+    (..., 2) np.ndarray
+        Cartesian coordinates.
+    """
+    tlr = np.asarray(tlr)
+    dtype = _get_dtype(tlr, out)
+    corners = get_corners(corners, rotation).astype(dtype)
+    s = np.sum(tlr, axis=-1, dtype=dtype)[..., None]
+    out = np.matmul(tlr, corners, out=out)
+    out /= s
+    return out
+
+
+def cartesian_to_ternary(xy, corners=None, rotation=None,
+                         ternary_sum: float = 1.0, out=None):
+    """Convert Cartesian coordinates to ternary coordinates.
+
+    Parameters
+    ----------
+    xy : (..., 2) array_like
+        Cartesian coordinates.
+    corners, rotation
+        Triangle as in `get_corners`.
+    ternary_sum : float, default: 1.0
+        Constant to which ``t + l + r`` is normalized.
+    out : (..., 3) np.ndarray, optional
+        Array to write the result to.
+
+    Returns
+    -------
+    (..., 3) np.ndarray
+        Ternary coordinates.
+    """
+    xy = np.asarray(xy)
+    dtype = _get_dtype(xy, out)
+    v = np.column_stack((get_corners(corners, rotation), np.ones(3)))
+    m = (np.linalg.inv(v) * ternary_sum).astype(dtype)
+    out = np.matmul(xy, m[:2], out=out)
+    out += m[2]
+    return out
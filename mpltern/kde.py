@@ -0,0 +1,130 @@
+import numpy as np
+
+from mpltern import hexbin_helpers
+from mpltern import tribin_helpers
+
+
+def ternary_kde(t, l, r, weights=None, gridsize: int = 100, bandwidth=None):
+    """Kernel density estimate on the triangular lattice
+
+    The points are first distributed to the three nodes of the triangle of the
+    lattice (the bins of `tribin`) enclosing each point with the weights
+    given by the barycentric coordinates inside the triangle (linear binning).
+    The binned values are then convolved with a Gaussian kernel in the lattice
+    space using FFT. The cost is therefore O(N + G**2 log G) for N points and
+    the gridsize G, instead of O(N G**2) for the direct evaluation.
+
+    Parameters
+    ----------
+    t, l, r : array_like
+        Ternary coordinates of the points, normalized inside to sum to 1.
+    weights : array_like, optional
+        Weights of the points, by default equal.
+    gridsize : int, optional
+        Number of lattice intervals along one ternary axis, by default 100
+    bandwidth : float, optional
+        Standard deviation of the Gaussian kernel in the length unit where the
+        edges of the triangle are 1. By default, Scott's rule is applied.
+
+    Returns
+    -------
+    (t, l, r, densities) : tuple[np.ndarray]
+        Ternary coordinates of the lattice nodes and the densities there,
+        which can be given directly to e.g. ``tricontourf``.
+        The densities are normalized with respect to the area on the
+        (t, l) plane like `get_dirichlet_pdfs`.
+        The kernel mass that leaks out of the triangle is not corrected.
+    """
+    t = np.asarray(t, float)
+    l = np.asarray(l, float)
+    r = np.asarray(r, float)
+    s = t + l + r
+    t = t / s
+    l = l / s
+    r = r / s
+    if weights is None:
+        weights = np.ones_like(t)
+    weights = np.asarray(weights, float)
+
+    g = gridsize
+    n = (g + 1) * (g + 2) // 2
+
+    # linear binning to the lattice nodes
+    extent = (0.0, 1.0, 0.0, 1.0, 0.0, 1.0)
+    _, _, _, it, il, ir = tribin_helpers.calc_ternary_indices(
+        t, l, r, g, extent)
+    base = np.stack((it, il, ir))
+    # Points on the lattice nodes are put in an upward triangle having the
+    # node as a vertex, so that their whole weights go to the node.
+    on_node = np.flatnonzero(base.sum(axis=0) == g)
+    base[np.argmax(base[:, on_node], axis=0), on_node] -= 1
+    is_inside = tribin_helpers.ternary_to_serial(g, *base) >= 0
+    base = base[:, is_inside]
+    fractions = np.stack((t, l, r))[:, is_inside] * g - base
+    upward = base.sum(axis=0) == g - 1
+    fractions = np.where(upward, fractions, 1.0 - fractions)
+    fractions *= weights[is_inside]
+    # vertices of upward triangles: base + e
+    # vertices of downward triangles: base + 1 - e
+    base[:, ~upward] += 1
+    shift = np.where(upward, 1, -1)
+    masses = np.zeros(n)
+    for j in range(3):
+        base[j] += shift
+        i = hexbin_helpers.ternary_to_serial(g, *base)
+        masses += np.bincount(i, weights=fractions[j], minlength=n)
+        base[j] -= shift
+
+    if bandwidth is None:
+        bandwidth = _get_scott_bandwidth(t, l, r, weights)
+    h = bandwidth * g  # in the unit of the lattice interval
+
+    # nodes as a 2D array indexed by (it, ir)
+    it, il, ir = hexbin_helpers.serial_to_ternary(g, np.arange(n))
+    grid = np.zeros((g + 1, g + 1))
+    grid[it, ir] = masses
+
+    densities = _convolve_gaussian(grid, h)[it, ir]
+    # Each node represents the area of 1 / g**2 on the (t, l) plane.
+    densities *= g ** 2 / np.sum(weights)
+
+    return it / g, il / g, ir / g, densities
+
+
+def _get_scott_bandwidth(t, l, r, weights):
+    """Bandwidth by Scott's rule for the two-dimensional data."""
+    def var(x):
+        mean = np.average(x, weights=weights)
+        return np.average((x - mean) ** 2, weights=weights)
+
+    # effective number of the points
+    neff = np.sum(weights) ** 2 / np.sum(weights ** 2)
+    # standard deviation along one Cartesian axis
+    sigma = np.sqrt((var(t) + var(l) + var(r)) / 4.0)
+    return sigma * neff ** (-1.0 / 6.0)
+
+
+def _convolve_gaussian(grid, h, truncate: float = 4.0):
+    """Convolve values on the triangular lattice with the Gaussian kernel.
+
+    Parameters
+    ----------
+    grid : (M, M) np.ndarray
+        Values at the nodes indexed by two of the ternary indices.
+    h : float
+        Standard deviation of the kernel in the unit of the lattice interval.
+    truncate : float
+        The kernel is truncated at this many standard deviations.
+    """
+    m = grid.shape[0]
+    radius = max(int(np.ceil(truncate * h)), 1)
+    a = np.arange(-radius, radius + 1)
+    da, db = np.meshgrid(a, a, indexing='ij')
+    # squared distance between nodes on the triangular lattice
+    kernel = np.exp(-0.5 * (da ** 2 + db ** 2 + da * db) / h ** 2)
+    kernel /= kernel.sum()
+
+    shape = (m + 2 * radius,) * 2
+    values = np.fft.irfft2(
+        np.fft.rfft2(grid, shape) * np.fft.rfft2(kernel, shape), shape)
+    return values[radius:radius + m, radius:radius + m]
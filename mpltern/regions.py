@@ -0,0 +1,145 @@
+import numpy as np
+
+import matplotlib.path as mpath
+
+from mpltern import tribin_helpers
+
+
+class TernaryRegionIndex:
+    """Index to classify points in ternary coordinates into regions.
+
+    The triangle is divided into the triangular bins of `tribin`. The bins
+    that do not intersect with any boundary of the regions are assigned to a
+    region (or to none) beforehand, and points in such bins are classified by
+    a lookup. Only points in the bins on the boundaries are tested exactly
+    against the polygons.
+
+    Parameters
+    ----------
+    regions : dict[str, (M, 3) array_like]
+        Vertices of the polygon of each region in ternary coordinates like
+        `mpltern.datasets.soil_texture_classes`. The vertices are normalized
+        to sum to 1 inside. If regions overlap, the first one has priority.
+    gridsize : int, optional
+        Number of triangular bins in one direction, by default 128.
+
+    Examples
+    --------
+    >>> from mpltern.datasets import soil_texture_classes
+    >>> index = TernaryRegionIndex(soil_texture_classes)
+    >>> ids = index.classify(clay, sand, silt)
+    >>> counts = index.count(clay, sand, silt)
+    """
+    def __init__(self, regions, gridsize: int = 128):
+        self.names = list(regions)
+        self.gridsize = gridsize
+
+        polygons = []
+        for vertices in regions.values():
+            vertices = np.asarray(vertices, float)
+            polygons.append(vertices / np.sum(vertices, axis=1)[:, None])
+
+        # Polygons are tested on the (t, l) plane.
+        self._paths = [mpath.Path(_[:, :2]) for _ in polygons]
+
+        self._bin_ids = self._classify_bins(polygons)
+
+    def _classify_bins(self, polygons):
+        """Classify the triangular bins.
+
+        Returns
+        -------
+        ids : (gridsize ** 2,) np.ndarray
+            Index of the region for each bin, -1 for no region, and -2 for
+            bins intersecting with boundaries.
+        """
+        g = self.gridsize
+        n = g ** 2
+        nup = g * (g + 1) // 2
+        it, il, ir = tribin_helpers.serial_to_ternary(g, np.arange(n))
+        centroids = np.column_stack((it, il, ir)).astype(float)
+        centroids[:nup] += 1.0 / 3.0
+        centroids[nup:] += 2.0 / 3.0
+        centroids /= g
+
+        # circumradius of the bins, in the same metric as ternary coordinates
+        radius = np.sqrt(2.0) / np.sqrt(3.0) / g
+
+        is_boundary = np.zeros(n, dtype=bool)
+        for vertices in polygons:
+            for p0, p1 in zip(vertices, np.roll(vertices, -1, axis=0)):
+                distances = _get_distances_to_segment(centroids, p0, p1)
+                is_boundary |= distances <= radius * (1.0 + 1e-9)
+
+        ids = self._classify_exactly(centroids[:, :2])
+        ids[is_boundary] = -2
+        return ids
+
+    def _classify_exactly(self, points):
+        """Classify (t, l) points by testing the polygons one by one."""
+        ids = np.full(len(points), -1)
+        for i, path in enumerate(self._paths):
+            is_unassigned = ids == -1
+            is_inside = path.contains_points(points[is_unassigned])
+            ids[np.flatnonzero(is_unassigned)[is_inside]] = i
+        return ids
+
+    def classify(self, t, l, r):
+        """Classify points into the regions.
+
+        Parameters
+        ----------
+        t, l, r : array_like
+            Ternary coordinates of the points, broadcast to the same shape.
+
+        Returns
+        -------
+        ids : int or np.ndarray
+            Index of the region in `names` for each point, or -1 if the point
+            is in none of the regions, in the broadcast shape of the input.
+            A scalar is returned for scalar input.
+        """
+        t, l, r = np.broadcast_arrays(
+            np.asarray(t, float), np.asarray(l, float), np.asarray(r, float))
+        shape = t.shape
+        t, l, r = t.ravel(), l.ravel(), r.ravel()
+        s = t + l + r
+        t = t / s
+        l = l / s
+        r = r / s
+
+        g = self.gridsize
+        extent = (0.0, 1.0, 0.0, 1.0, 0.0, 1.0)
+        _, _, _, it, il, ir = tribin_helpers.calc_ternary_indices(
+            t, l, r, g, extent)
+        i = tribin_helpers.ternary_to_serial(g, it, il, ir)
+        # Points on the nodes of the lattice (and out of the triangle) are not
+        # assigned to any bin, which are given to the exact tests.
+        s = it + il + ir
+        is_valid = (i >= 0) & ((s == g - 1) | (s == g - 2))
+        ids = np.full(len(t), -2)
+        ids[is_valid] = self._bin_ids[i[is_valid]]
+
+        # exact tests only for points on boundaries or out of the bins
+        is_boundary = ids == -2
+        points = np.column_stack((t[is_boundary], l[is_boundary]))
+        ids[is_boundary] = self._classify_exactly(points)
+        return ids.reshape(shape)[()]
+
+    def count(self, t, l, r):
+        """Count the number of points in each region.
+
+        Returns
+        -------
+        counts : np.ndarray
+            Number of points in each region in the order of `names`.
+        """
+        ids = np.ravel(self.classify(t, l, r))
+        return np.bincount(ids[ids >= 0], minlength=len(self.names))
+
+
+def _get_distances_to_segment(points, p0, p1):
+    """Get the distances from points to the segment between p0 and p1."""
+    v = p1 - p0
+    u = np.clip((points - p0) @ v / np.dot(v, v), 0.0, 1.0)
+    return np.linalg.norm(points - (p0 + u[:, None] * v), axis=1)
@@ -0,0 +1,187 @@
+"""
+Rendering of many ternary plots sharing the same frame.
+"""
+import contextlib
+from operator import attrgetter
+
+import numpy as np
+
+import matplotlib.axis as maxis
+import matplotlib.image as mimage
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from mpltern.ternary import TernaryAxes
+
+
+class TernaryTemplate:
+    """Frame of ternary plots rendered once and reused for many datasets.
+
+    The figure is styled beforehand, e.g., with the ternary limits, the
+    ticks, the grid and the labels, but without any data. For each dataset,
+    `render` adds the data artists, restores the cached rendering of the
+    frame, draws the data artists and the frame artists above them in the
+    same order as `Axes.draw`, and removes the data artists again. The
+    Axes are therefore constructed and laid out only once, and the pixels
+    are identical to those of a fresh figure with the same frame and data.
+
+    The cached rendering depends on the lowest zorder of the data artists,
+    and one is kept for each zorder. Call `invalidate` after modifying the
+    frame.
+
+    Parameters
+    ----------
+    fig : `~matplotlib.figure.Figure`
+        Figure with the frame. Its canvas is replaced with an Agg canvas if
+        it is not one.
+    ax : `~mpltern.ternary.TernaryAxes`, optional
+        Axes to which the data are plotted. By default the first
+        `TernaryAxes` in *fig*.
+    prop_cycle : `~cycler.Cycler`, optional
+        Property cycle set to the Axes before each dataset is plotted, so
+        that every dataset gets the same colors as in a fresh figure.
+        By default, :rc:`axes.prop_cycle`.
+
+    Notes
+    -----
+    Only the artists of *ax* are redrawn. Other artists of the figure over
+    *ax*, e.g., an inset Axes, are in the cached rendering below the data.
+
+    Examples
+    --------
+    >>> fig = plt.figure()
+    >>> ax = fig.add_subplot(projection='ternary')
+    >>> ax.grid()
+    >>> template = TernaryTemplate(fig)
+    >>> for i, (t, l, r) in enumerate(datasets):
+    ...     template.render(lambda ax: ax.scatter(t, l, r), f'{i}.png')
+    """
+    def __init__(self, fig, ax=None, prop_cycle=None):
+        if ax is None:
+            for ax in fig.axes:
+                if isinstance(ax, TernaryAxes):
+                    break
+            else:
+                raise ValueError("'fig' has no TernaryAxes")
+        if not isinstance(fig.canvas, FigureCanvasAgg):
+            FigureCanvasAgg(fig)
+        self.figure = fig
+        self.axes = ax
+        self.prop_cycle = prop_cycle
+        self._backgrounds = {}
+
+    def invalidate(self):
+        """Discard the cached renderings of the frame."""
+        self._backgrounds.clear()
+
+    def _get_view(self):
+        ax = self.axes
+        return (
+            ax.get_tlim(), ax.get_llim(), ax.get_rlim(),
+            tuple(ax.viewLim.bounds),
+            tuple(self.figure.bbox.bounds),
+        )
+
+    def _get_draw_list(self, zorder):
+        """Artists of the Axes drawn in `Axes.draw` at or above *zorder*."""
+        ax = self.axes
+        artists = ax.get_children()
+        artists.remove(ax.patch)
+        excluded = set()
+        if not (ax.axison and ax.get_frame_on()):
+            excluded.update(ax.spines.values())
+        if not ax.axison:
+            excluded.update(_ for _ in artists if isinstance(_, maxis.Axis))
+        artists = [
+            _ for _ in artists
+            if _ not in excluded and not _.get_animated()
+            and _.get_zorder() >= zorder
+        ]
+        return sorted(artists, key=attrgetter('zorder'))
+
+    def _get_background(self, zorder, artists):
+        """Get the rendering without *artists*, drawing it if not cached."""
+        key = (zorder, tuple(self.figure.bbox.bounds))
+        if key not in self._backgrounds:
+            for artist in artists:
+                artist.set_animated(True)
+            try:
+                self.figure.canvas.draw()
+            finally:
+                for artist in artists:
+                    artist.set_animated(False)
+            self._backgrounds[key] = self.figure.canvas.copy_from_bbox(
+                self.figure.bbox)
+        return self._backgrounds[key]
+
+    @contextlib.contextmanager
+    def _plotted(self, plot):
+        """Plot the data by *plot* and yield them, removing them at exit."""
+        ax = self.axes
+        view = self._get_view()
+        children = set(ax.get_children())
+        # Every dataset starts from the beginning of the property cycle.
+        ax.set_prop_cycle(self.prop_cycle)
+        try:
+            plot(ax)
+            if self._get_view() != view:
+                raise ValueError(
+                    "'plot' must not change the limits of the Axes or the "
+                    "figure size")
+            yield [_ for _ in ax.get_children() if _ not in children]
+        finally:
+            for artist in ax.get_children():
+                if artist not in children:
+                    artist.remove()
+
+    def render(self, plot, fname=None):
+        """Render the frame with the data plotted by *plot*.
+
+        Parameters
+        ----------
+        plot : callable
+            ``plot(ax)`` adding the data artists to the `TernaryAxes`. It
+            must not change the limits of the Axes or the figure size.
+        fname : str or path-like, optional
+            If given, the image is saved as PNG.
+
+        Returns
+        -------
+        (H, W, 4) ndarray of uint8
+            RGBA pixels of the figure.
+        """
+        ax = self.axes
+        canvas = self.figure.canvas
+        with self._plotted(plot) as data:
+            # Animated artists are not drawn as in `Axes.draw`.
+            zorder = min(
+                (_.get_zorder() for _ in data if not _.get_animated()),
+                default=np.inf)
+            artists = self._get_draw_list(zorder)
+            canvas.restore_region(self._get_background(zorder, artists))
+            renderer = canvas.get_renderer()
+            with ax._gridlines_gathered():
+                for artist in artists:
+                    ax._get_draw_proxy(artist).draw(renderer)
+        rgba = np.asarray(canvas.buffer_rgba()).copy()
+        if fname is not None:
+            mimage.imsave(
+                fname, rgba, format='png', origin='upper',
+                dpi=self.figure.dpi)
+        return rgba
+
+    def savefig(self, plot, fname, **kwargs):
+        """Save the figure with the data plotted by *plot*.
+
+        Unlike `render`, the whole figure is drawn by `.Figure.savefig`,
+        e.g., for vector formats, but the Axes are still reused.
+
+        Parameters
+        ----------
+        plot : callable
+            ``plot(ax)`` adding the data artists to the `TernaryAxes`. It
+            must not change the limits of the Axes or the figure size.
+        fname : str or path-like
+            Passed to `.Figure.savefig` together with *kwargs*.
+        """
+        with self._plotted(plot):
+            self.figure.savefig(fname, **kwargs)
@@ -0,0 +1,356 @@
+"""
+Spatial indices of points for nearest-point, range, and per-bin queries.
+"""
+import warnings
+
+import numpy as np
+
+import matplotlib.path as mpath
+from matplotlib import _api
+
+
+def _gather(a, b):
+    """Concatenate ``np.arange(a[i], b[i])`` for all ``i``."""
+    lengths = b - a
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(np.sum(lengths)) + np.repeat(a - offsets, lengths)
+
+
+class GridIndex:
+    """Uniform grid over 2D points for nearest-point and range queries.
+
+    The points are sorted by the cells of the grid, and the cells are stored
+    in the compressed sparse row (CSR) format; i.e., the points in the cell
+    ``i`` are those from ``starts[i]`` to ``starts[i + 1]`` in the sorted
+    order. A query therefore visits only the cells around it.
+
+    Parameters
+    ----------
+    xy : (N, 2) array_like
+        Points. Non-finite points are ignored.
+    points_per_cell : float, default: 2.0
+        Average number of points per cell, determining the grid size.
+    """
+    def __init__(self, xy, points_per_cell: float = 2.0):
+        xy = np.asarray(xy, float).reshape(-1, 2)
+        finite = np.flatnonzero(np.all(np.isfinite(xy), axis=1))
+        xy = xy[finite]
+        if len(xy) == 0:
+            xy = np.zeros((0, 2))
+            lower = upper = np.zeros(2)
+        else:
+            lower = xy.min(axis=0)
+            upper = xy.max(axis=0)
+        extent = upper - lower
+        ncells = max(len(xy) / points_per_cell, 1.0)
+        if np.all(extent > 0.0):
+            cellsize = np.sqrt(extent[0] * extent[1] / ncells)
+        else:
+            cellsize = np.max(extent) / ncells
+        if not cellsize > 0.0:  # all the points at the same position
+            cellsize = 1.0
+        nx, ny = (extent // cellsize).astype(int) + 1
+
+        ix, iy = ((xy - lower) // cellsize).astype(int).T
+        cells = np.minimum(iy, ny - 1) * nx + np.minimum(ix, nx - 1)
+        order = np.argsort(cells, kind='stable')
+
+        self.cellsize = cellsize
+        self.shape = ny, nx
+        self._lower = lower
+        self._upper = upper
+        self._indices = finite[order]
+        self._xy = xy[order]
+        self._starts = np.searchsorted(cells[order], np.arange(nx * ny + 1))
+
+    def _get_cell_range(self, lower, upper):
+        """Return the cell range ``(ix0, ix1, iy0, iy1)`` of the box.
+
+        None is returned if the box does not overlap with the grid.
+        """
+        if np.any(upper < self._lower) or np.any(lower > self._upper):
+            return None
+        ny, nx = self.shape
+        ix0, iy0 = np.maximum((lower - self._lower) // self.cellsize, 0)
+        ix1, iy1 = (upper - self._lower) // self.cellsize
+        return int(ix0), int(min(ix1, nx - 1)), int(iy0), int(min(iy1, ny - 1))
+
+    def _get_positions_in_box(self, lower, upper):
+        """Return the positions in the sorted order of points in the box."""
+        cell_range = self._get_cell_range(lower, upper)
+        if cell_range is None:
+            return np.zeros(0, int)
+        ix0, ix1, iy0, iy1 = cell_range
+        # The cells of each row in the box are contiguous.
+        rows = np.arange(iy0, iy1 + 1) * self.shape[1]
+        return _gather(self._starts[rows + ix0], self._starts[rows + ix1 + 1])
+
+    def within(self, xy, radius: float):
+        """Return the indices of the points within *radius* of *xy*.
+
+        Parameters
+        ----------
+        xy : (2,) array_like
+        radius : float
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the points in the ascending order.
+        """
+        xy = np.asarray(xy, float)
+        positions = self._get_positions_in_box(xy - radius, xy + radius)
+        d2 = np.sum((self._xy[positions] - xy) ** 2, axis=1)
+        return np.sort(self._indices[positions[d2 <= radius ** 2]])
+
+    def within_polygon(self, vertices):
+        """Return the indices of the points inside the polygon.
+
+        The cells entirely inside the polygon are accepted as a whole, and
+        only the points in the cells crossed by the edges are tested.
+
+        Parameters
+        ----------
+        vertices : (M, 2) array_like
+            Vertices of the polygon, which is closed implicitly.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the points in the ascending order.
+        """
+        vertices = np.asarray(vertices, float).reshape(-1, 2)
+        if len(vertices) < 3:
+            return np.zeros(0, int)
+        cell_range = self._get_cell_range(
+            vertices.min(axis=0), vertices.max(axis=0))
+        if cell_range is None:
+            return np.zeros(0, int)
+        ix0, ix1, iy0, iy1 = cell_range
+        nx = ix1 - ix0 + 1
+        ny = iy1 - iy0 + 1
+
+        # Mark the cells crossed by the edges. The edges are split into
+        # pieces not longer than a cell, and the cells of the bounding box of
+        # each piece, at most 2x2, are marked.
+        v0 = vertices
+        v1 = np.roll(vertices, -1, axis=0)
+        npieces = (np.hypot(*(v1 - v0).T) // self.cellsize).astype(int) + 1
+        edges = np.repeat(np.arange(len(v0)), npieces + 1)
+        steps = _gather(np.zeros_like(npieces), npieces + 1)
+        fractions = (steps / np.repeat(npieces, npieces + 1))[:, None]
+        points = v0[edges] + (v1 - v0)[edges] * fractions
+        ix, iy = ((points - self._lower) // self.cellsize).astype(int).T
+        is_edge = np.zeros((ny + 2, nx + 2), dtype=bool)
+        is_next = (edges[1:] == edges[:-1])  # pairs in the same edge
+        for jx, jy in [(ix[:-1], iy[:-1]), (ix[1:], iy[1:]),
+                       (ix[:-1], iy[1:]), (ix[1:], iy[:-1])]:
+            # Cells outside the window are gathered in the margins.
+            jx = np.clip(jx[is_next] - ix0 + 1, 0, nx + 1)
+            jy = np.clip(jy[is_next] - iy0 + 1, 0, ny + 1)
+            is_edge[jy, jx] = True
+        is_edge = is_edge[1:-1, 1:-1]
+
+        # The other cells are entirely inside or outside the polygon.
+        path = mpath.Path(vertices, closed=False)
+        cx = self._lower[0] + (np.arange(ix0, ix1 + 1) + 0.5) * self.cellsize
+        cy = self._lower[1] + (np.arange(iy0, iy1 + 1) + 0.5) * self.cellsize
+        centers = np.stack(np.meshgrid(cx, cy), axis=-1).reshape(-1, 2)
+        cells = (np.arange(iy0, iy1 + 1)[:, None] * self.shape[1]
+                 + np.arange(ix0, ix1 + 1)).ravel()
+        others = np.flatnonzero(~is_edge.ravel())
+        inside = cells[others[path.contains_points(centers[others])]]
+        inside = _gather(self._starts[inside], self._starts[inside + 1])
+        crossed = cells[is_edge.ravel()]
+        crossed = _gather(self._starts[crossed], self._starts[crossed + 1])
+        crossed = crossed[path.contains_points(self._xy[crossed])]
+        positions = np.concatenate((inside, crossed))
+        return np.sort(self._indices[positions])
+
+    def _nearest(self, xy, max_distance):
+        half = self.cellsize
+        while True:
+            positions = self._get_positions_in_box(xy - half, xy + half)
+            if len(positions):
+                d2 = np.sum((self._xy[positions] - xy) ** 2, axis=1)
+                i = np.argmin(d2)
+                distance = np.sqrt(d2[i])
+                # All the points closer than `half` are in the box.
+                if distance <= half:
+                    break
+            covered = (np.all(xy - half <= self._lower)
+                       and np.all(xy + half >= self._upper))
+            if covered or half > max_distance:
+                if not len(positions):
+                    return -1, np.inf
+                break
+            half *= 2.0
+        if distance > max_distance:
+            return -1, np.inf
+        return int(self._indices[positions[i]]), float(distance)
+
+    def nearest(self, xy, max_distance: float = np.inf):
+        """Find the nearest points.
+
+        Parameters
+        ----------
+        xy : (2,) or (M, 2) array_like
+            Query points.
+        max_distance : float, default: inf
+            Points farther than this are not found.
+
+        Returns
+        -------
+        indices : int or (M,) np.ndarray
+            Indices of the nearest points, or -1 if not found.
+        distances : float or (M,) np.ndarray
+            Distances to the nearest points, or inf if not found.
+        """
+        xy = np.asarray(xy, float)
+        if xy.ndim == 1:
+            return self._nearest(xy, max_distance)
+        indices = np.empty(len(xy), int)
+        distances = np.empty(len(xy))
+        for k, _ in enumerate(xy):
+            indices[k], distances[k] = self._nearest(_, max_distance)
+        return indices, distances
+
+
+class BinIndex:
+    """Rows of the data in each bin, stored in the CSR format.
+
+    The rows are sorted by the serial indices of the bins, and the rows in
+    the bin ``i`` are those from ``starts[i]`` to ``starts[i + 1]`` in the
+    sorted order. The rows in a bin are therefore obtained in O(k) time.
+
+    Parameters
+    ----------
+    indices : (N,) array_like of int
+        Serial index of the bin of each point, or -1 if out of the bins.
+    nbins : int
+        Number of the bins.
+    rows : (N,) array_like of int, optional
+        Rows of the points in the original data. By default, the positions
+        of the points in *indices*.
+
+    Attributes
+    ----------
+    counts : (nbins,) np.ndarray
+        Number of the points in each bin.
+    serials : np.ndarray
+        Serial indices of the bins drawn as the cells of the collection.
+    """
+    def __init__(self, indices, nbins: int, rows=None):
+        indices = np.asarray(indices)
+        counts = np.bincount(indices + 1, minlength=nbins + 1)
+        # [counts[0]:] drops out-of-range points.
+        order = np.argsort(indices, kind='stable')[counts[0]:]
+        self._order = order
+        self._rows = order if rows is None else np.asarray(rows)[order]
+        self._starts = np.concatenate(([0], np.cumsum(counts[1:])))
+        self.counts = counts[1:]
+        self.serials = np.arange(nbins)
+
+    def get_rows(self, serial: int):
+        """Return the rows of the points in the bin of *serial*."""
+        return self._rows[self._starts[serial]:self._starts[serial + 1]]
+
+    def get_cell_rows(self, cell: int):
+        """Return the rows of the points in the *cell*-th cell.
+
+        *cell* is the index of the cells of the collection, e.g., ``ind`` of
+        the `.PickEvent`.
+        """
+        return self.get_rows(self.serials[cell])
+
+    def reduce(self, C, reduce_C_function, mincnt: int = 0):
+        """Reduce the values of *C* in each bin.
+
+        Bins with less than *mincnt* points are NaN. Empty bins with
+        ``mincnt <= 0`` have ``reduce_C_function`` of an empty array.
+        """
+        values = np.asarray(C)[self._order]
+        starts = self._starts
+        accum = np.full(len(self.counts), np.nan)
+        for i in np.flatnonzero(self.counts >= max(mincnt, 1)):
+            accum[i] = reduce_C_function(values[starts[i]:starts[i + 1]])
+        if mincnt <= 0:
+            with warnings.catch_warnings():  # e.g., mean of empty slice
+                warnings.simplefilter('ignore', RuntimeWarning)
+                accum[self.counts == 0] = reduce_C_function(values[:0])
+        return accum
+
+    def bootstrap(self, C=None, reduce=None, replicates: int = 200,
+                  confidence: float = 0.95, method='poisson', seed=None):
+        """Estimate the confidence intervals of the values of the bins.
+
+        The replicates of the data are made by weighting the points by
+        Poisson(1) random numbers or by resampling the points with
+        replacement. The values of all the bins for a chunk of the
+        replicates are given at once by a `numpy.bincount` over the pairs of
+        the replicate and the bin.
+
+        Parameters
+        ----------
+        C : (N,) array_like, optional
+            Values of the points in the original order.
+        reduce : {'count', 'sum', 'mean'}, optional
+            Value of the bins. By default, 'count' if *C* is None, otherwise
+            'mean'.
+        replicates : int, default: 200
+            Number of the replicates.
+        confidence : float, default: 0.95
+            Confidence level of the percentile intervals.
+        method : {'poisson', 'resample'}, default: 'poisson'
+            How to make the replicates.
+        seed : int or `numpy.random.Generator`, optional
+            Seed of the random numbers.
+
+        Returns
+        -------
+        lower, upper : (nbins,) np.ndarray
+            Bounds of the intervals. NaN for 'mean' of empty bins.
+        """
+        if reduce is None:
+            reduce = 'count' if C is None else 'mean'
+        _api.check_in_list(['count', 'sum', 'mean'], reduce=reduce)
+        _api.check_in_list(['poisson', 'resample'], method=method)
+        if C is None and reduce != 'count':
+            raise ValueError(f"C is required for reduce={reduce!r}")
+
+        nbins = len(self.counts)
+        bins = np.repeat(np.arange(nbins), self.counts)  # in sorted order
+        if reduce != 'count':
+            values = np.asarray(C, float)[self._order]
+        size = len(bins)
+        rng = np.random.default_rng(seed)
+        # replicates per chunk, limiting the memory to ~4M points
+        chunk = max(1, 2 ** 22 // max(size, 1))
+        stats = np.empty((replicates, nbins))
+        for start in range(0, replicates, chunk):
+            nr = min(chunk, replicates - start)
+            if method == 'poisson' or size == 0:
+                weights = rng.poisson(1.0, size=(nr, size))
+            else:  # 'resample'
+                picks = rng.integers(size, size=(nr, size))
+                keys = np.arange(nr)[:, None] * size + picks
+                weights = np.bincount(np.ravel(keys), minlength=nr * size)
+                weights = weights.reshape(nr, size)
+            keys = np.ravel(np.arange(nr)[:, None] * nbins + bins)
+            stat = np.bincount(
+                keys, weights=np.ravel(weights), minlength=nr * nbins)
+            if reduce != 'count':
+                sums = np.bincount(keys, weights=np.ravel(weights * values),
+                                   minlength=nr * nbins)
+                if reduce == 'sum':
+                    stat = sums
+                else:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        stat = sums / stat
+            stats[start:start + nr] = stat.reshape(nr, nbins)
+
+        q = 50.0 * (1.0 - confidence)
+        with warnings.catch_warnings():  # all-NaN slices of empty bins
+            warnings.simplefilter('ignore', RuntimeWarning)
+            lower, upper = np.nanpercentile(stats, [q, 100.0 - q], axis=0)
+        return lower, upper
@@ -10,11 +10,16 @@ from matplotlib import _api
 from mpltern._ternary_parsers import (
     parse_ternary_single,
     parse_ternary_multiple,
+    parse_ternary_triangulation,
     parse_ternary_vector,
 )
 from mpltern import hexbin_helpers
 from mpltern import tribin_helpers
+from mpltern.spatial import BinIndex
 from mpltern.ternary._base import TernaryAxesBase
+from mpltern.ternary.image import TernaryDensityImage
+import mpltern.ternary.streamplot as mstream
+from mpltern.ternary import profiling
 
 
 class TernaryAxes(TernaryAxesBase):
@@ -304,14 +309,214 @@ class TernaryAxes(TernaryAxesBase):
         self.add_patch(p)
         return p
 
+    def axtlines(self, x, ymin=0, ymax=1, **kwargs):
+        """
+        Add equi-t lines across the axes as a single collection.
+
+        Parameters
+        ----------
+        x : float or array-like
+            x positions in data coordinates of the equi-t lines.
+
+        ymin, ymax : float or array-like, default: 0, 1
+            Should be between 0 and 1, 0 being one end of the plot, 1 the
+            other of the plot. Broadcast against *x*.
+
+        Returns
+        -------
+        `~matplotlib.collections.LineCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.LineCollection` properties,
+            except for 'transform'
+
+        See Also
+        --------
+        axtline : Add a equi-t line across the axes.
+        """
+        trans = self.get_taxis_transform(which='grid')
+        return self._axlines('axtlines', trans, x, ymin, ymax, **kwargs)
+
+    def axllines(self, x, ymin=0, ymax=1, **kwargs):
+        """
+        Add equi-l lines across the axes as a single collection.
+
+        Parameters
+        ----------
+        x : float or array-like
+            x positions in data coordinates of the equi-l lines.
+
+        ymin, ymax : float or array-like, default: 0, 1
+            Should be between 0 and 1, 0 being one end of the plot, 1 the
+            other of the plot. Broadcast against *x*.
+
+        Returns
+        -------
+        `~matplotlib.collections.LineCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.LineCollection` properties,
+            except for 'transform'
+
+        See Also
+        --------
+        axlline : Add a equi-l line across the axes.
+        """
+        trans = self.get_laxis_transform(which='grid')
+        return self._axlines('axllines', trans, x, ymin, ymax, **kwargs)
+
+    def axrlines(self, x, ymin=0, ymax=1, **kwargs):
+        """
+        Add equi-r lines across the axes as a single collection.
+
+        Parameters
+        ----------
+        x : float or array-like
+            x positions in data coordinates of the equi-r lines.
+
+        ymin, ymax : float or array-like, default: 0, 1
+            Should be between 0 and 1, 0 being one end of the plot, 1 the
+            other of the plot. Broadcast against *x*.
+
+        Returns
+        -------
+        `~matplotlib.collections.LineCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.LineCollection` properties,
+            except for 'transform'
+
+        See Also
+        --------
+        axrline : Add a equi-r line across the axes.
+        """
+        trans = self.get_raxis_transform(which='grid')
+        return self._axlines('axrlines', trans, x, ymin, ymax, **kwargs)
+
+    def _axlines(self, name, trans, x, ymin, ymax, **kwargs):
+        if "transform" in kwargs:
+            raise ValueError(
+                "'transform' is not allowed as a kwarg;"
+                + f"{name} generates its own transform.")
+        x, ymin, ymax = np.broadcast_arrays(
+            np.ravel(x), np.ravel(ymin), np.ravel(ymax))
+        segments = np.stack((
+            np.column_stack((x, ymin)),
+            np.column_stack((x, ymax)),
+        ), axis=1)
+        collection = mcoll.LineCollection(
+            segments, transform=trans, **kwargs)
+        self.add_collection(collection, autolim=False)
+        return collection
+
+    def axtspans(self, xmin, xmax, ymin=0, ymax=1, **kwargs):
+        """
+        Add spans for the top coordinate as a single collection.
+
+        Parameters
+        ----------
+        xmin, xmax : float or array-like
+            Lower and upper limits of the top spans in data units.
+        ymin, ymax : float or array-like, default: 0, 1
+            Lower and upper limits of the spans from end to end in relative
+            (0-1) units. Broadcast against *xmin* and *xmax*.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+
+        See Also
+        --------
+        axtspan : Add a span for the top coordinate.
+        """
+        trans = self.get_taxis_transform(which='grid')
+        return self._axspans(trans, xmin, xmax, ymin, ymax, **kwargs)
+
+    def axlspans(self, xmin, xmax, ymin=0, ymax=1, **kwargs):
+        """
+        Add spans for the left coordinate as a single collection.
+
+        Parameters
+        ----------
+        xmin, xmax : float or array-like
+            Lower and upper limits of the left spans in data units.
+        ymin, ymax : float or array-like, default: 0, 1
+            Lower and upper limits of the spans from end to end in relative
+            (0-1) units. Broadcast against *xmin* and *xmax*.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+
+        See Also
+        --------
+        axlspan : Add a span for the left coordinate.
+        """
+        trans = self.get_laxis_transform(which='grid')
+        return self._axspans(trans, xmin, xmax, ymin, ymax, **kwargs)
+
+    def axrspans(self, xmin, xmax, ymin=0, ymax=1, **kwargs):
+        """
+        Add spans for the right coordinate as a single collection.
+
+        Parameters
+        ----------
+        xmin, xmax : float or array-like
+            Lower and upper limits of the right spans in data units.
+        ymin, ymax : float or array-like, default: 0, 1
+            Lower and upper limits of the spans from end to end in relative
+            (0-1) units. Broadcast against *xmin* and *xmax*.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+
+        Other Parameters
+        ----------------
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+
+        See Also
+        --------
+        axrspan : Add a span for the right coordinate.
+        """
+        trans = self.get_raxis_transform(which='grid')
+        return self._axspans(trans, xmin, xmax, ymin, ymax, **kwargs)
+
+    def _axspans(self, trans, xmin, xmax, ymin, ymax, **kwargs):
+        xmin, xmax, ymin, ymax = np.broadcast_arrays(
+            np.ravel(xmin), np.ravel(xmax), np.ravel(ymin), np.ravel(ymax))
+        verts = np.stack((
+            np.column_stack((xmin, ymin)),
+            np.column_stack((xmin, ymax)),
+            np.column_stack((xmax, ymax)),
+            np.column_stack((xmax, ymin)),
+        ), axis=1)
+        collection = mcoll.PolyCollection(verts, **kwargs)
+        collection.set_transform(trans)
+        self.add_collection(collection, autolim=False)
+        return collection
+
     plot = parse_ternary_multiple(TernaryAxesBase.plot)
     scatter = parse_ternary_multiple(TernaryAxesBase.scatter)
 
+    @profiling.profiled_axes_method('hexbin')
     def hexbin(self, t, l, r, C=None, gridsize=100, bins=None,
                xscale='linear', yscale='linear', extent=None,
                cmap=None, norm=None, vmin=None, vmax=None,
                alpha=None, linewidths=None, edgecolors='face',
                reduce_C_function=np.mean, mincnt=None, marginals=False,
+               keep_index=False, bootstrap=None, bootstrap_seed=None,
                **kwargs):
         """
         Make a 2D hexagonal binning plot of points *t*, *l*, *r*.
@@ -361,6 +566,25 @@ class TernaryAxes(TernaryAxesBase):
         marginals : bool, default: *False*
             Ignored in mpltern.
 
+        keep_index : bool, default: *False*
+            If True, the rows of the data in each hexagon are kept as
+            ``bin_index`` of the returned collection, a `.BinIndex`.
+            ``collection.bin_index.get_cell_rows(ind)`` gives the rows in the
+            ``ind``-th hexagon of the collection, e.g., picked by a click.
+
+        bootstrap : int, default: *None*
+            If given, the number of the replicates to estimate the 95%
+            confidence intervals of the hexagon values by the Poisson
+            bootstrap; see `.BinIndex.bootstrap`. The widths of the intervals
+            are kept as ``interval_widths`` of the returned collection, e.g.,
+            to be shown as ``collection.set_alpha(1 - widths / widths.max())``.
+            Only the counts and *reduce_C_function* of `numpy.sum` or
+            `numpy.mean` are supported.
+
+        bootstrap_seed : int or `numpy.random.Generator`, default: *None*
+            Seed of the replicates of *bootstrap*, to reproduce the
+            ``interval_widths``. By default they differ at every call.
+
         extent : 6-tuple of float, default: *None*
             The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
             The default assigns the limits based on *tlim*, *llim*, *rlim*.
@@ -410,6 +634,16 @@ class TernaryAxes(TernaryAxesBase):
             - `numpy.sum`: integral of the point values
             - `numpy.amax`: value taken from the largest point
 
+            If *C* are class labels of the points, the following strings are
+            also accepted, with which the classes are counted in all the bins
+            in one pass:
+
+            - 'majority': most frequent class, given as the index in
+              ``categories`` of the returned collection, i.e., the sorted
+              unique labels; ties go to the first one
+            - 'purity': fraction of the points of the most frequent class
+            - 'entropy': Shannon entropy of the classes in nats
+
         data : indexable object, optional
             DATA_PARAMETER_PLACEHOLDER
 
@@ -425,12 +659,15 @@ class TernaryAxes(TernaryAxesBase):
         self._process_unit_info(
             [("t", t), ("l", l), ("r", r)], kwargs, convert=False)
 
-        t, l, r, C = cbook.delete_masked_points(t, l, r, C)
+        # rows of the points, kept through the deletion of masked points
+        rows = np.arange(len(t)) if keep_index else None
+        t, l, r, C, rows = cbook.delete_masked_points(t, l, r, C, rows)
 
         # Count the number of data in each hexagon
-        t = np.asarray(t, float)
-        l = np.asarray(l, float)
-        r = np.asarray(r, float)
+        dtype = self._get_float_dtype()
+        t = np.asarray(t, dtype)
+        l = np.asarray(l, dtype)
+        r = np.asarray(r, dtype)
 
         t, l, r = _normalize_tlr(t, l, r, self.ternary_sum)
 
@@ -444,117 +681,72 @@ class TernaryAxes(TernaryAxesBase):
         # number of hexagons
         n = (gridsize + 1) * (gridsize + 2) // 2
 
-        st, sl, sr, it, il, ir = hexbin_helpers.calc_ternary_indices(
-            t, l, r, gridsize, (tmin, tmax, lmin, lmax, rmin, rmax))
-
-        # flat indices, plus one so that out-of-range points go to position 0.
-        indices = hexbin_helpers.ternary_to_serial(gridsize, it, il, ir) + 1
-
-        if C is None:  # [1:] drops out-of-range points.
-            counts = np.bincount(indices, minlength=1 + n)[1:]
-            accum = counts.astype(float)
-            if mincnt is not None:
-                accum[accum < mincnt] = np.nan
-        else:
-            # store the C values in a list per hexagon index
-            Cs = [[] for _ in range(1 + n)]
-            for i in range(len(C)):
-                Cs[indices[i]].append(C[i])
-            if mincnt is None:
-                mincnt = 0
-            accum = np.array(
-                [reduce_C_function(acc) if len(acc) >= mincnt else np.nan
-                 for acc in Cs[1:]],  # [1:] drops out-of-range points.
-                float)
-
-        good_idxs = ~np.isnan(accum)
-
-        _ = hexbin_helpers.serial_to_ternary(gridsize, np.arange(n))
-        offsets = np.array(_).T.astype(float)
-
-        # remove accumulation bins with no data
-        offsets = offsets[good_idxs, :]
-        accum = accum[good_idxs]
-
-        # scale into [0, 1]
-        offsets /= gridsize
-
-        # scale into the given extent
-        offsets_c = 1.0 - offsets
-        offsets[..., 0] = offsets_c[..., 0] * tmin + offsets[..., 0] * tmax
-        offsets[..., 1] = offsets_c[..., 1] * lmin + offsets[..., 1] * lmax
-        offsets[..., 2] = offsets_c[..., 2] * rmin + offsets[..., 2] * rmax
-
-        polygon = [st, sl, sr] * np.array([
-            [-1.0 / 3, -1.0 / 3, +2.0 / 3],
-            [+1.0 / 3, -2.0 / 3, +1.0 / 3],
-            [+2.0 / 3, -1.0 / 3, -1.0 / 3],
-            [+1.0 / 3, +1.0 / 3, -2.0 / 3],
-            [-1.0 / 3, +2.0 / 3, -1.0 / 3],
-            [-2.0 / 3, +1.0 / 3, +1.0 / 3],
-        ]) + (tmax, lmin, rmin)
-
-        if linewidths is None:
-            linewidths = [1.0]
-
-        polygon = self.transProjection.transform(polygon)
-        offsets = self.transProjection.transform(offsets)
-
-        # shift the reference polygon at (tmax, lmin, rmin) to the origin
-        polygon -= offsets[0]
-
-        if True:
-            # While `offset_transform` is introduced since `matplotlib>=3.6.0`,
-            # here an alias `transOffset` is used for backword compatibility.
-            # see matplotlib/matplotlib#21965
-            collection = mcoll.PolyCollection(
-                [polygon],
-                edgecolors=edgecolors,
-                linewidths=linewidths,
-                offsets=offsets,
-                transform=mtransforms.AffineDeltaTransform(self.transData),
-                transOffset=self.transData,
-            )
-
-        # Set normalizer if bins is 'log'
-        if bins == 'log':
-            if norm is not None:
-                _api.warn_external("Only one of 'bins' and 'norm' arguments "
-                                   f"can be supplied, ignoring bins={bins}")
+        with profiling.phase('hexbin.binning'):
+            _, _, _, it, il, ir = hexbin_helpers.calc_ternary_indices(
+                t, l, r, gridsize, (tmin, tmax, lmin, lmax, rmin, rmax))
+
+            # flat indices plus one; out-of-range points go to position 0.
+            indices = hexbin_helpers.ternary_to_serial(
+                gridsize, it, il, ir) + 1
+
+            categorical = C is not None and isinstance(reduce_C_function, str)
+
+            if bootstrap is not None:
+                reduce = 'count' if C is None else _reduce_names.get(
+                    reduce_C_function, reduce_C_function)
+                _api.check_in_list(
+                    ['count', 'sum', 'mean'], reduce_C_function=reduce)
+
+            bin_index = None
+            if keep_index or bootstrap is not None or (
+                    C is not None and not categorical):
+                bin_index = BinIndex(indices - 1, n, rows)
+
+            if C is None:  # [1:] drops out-of-range points.
+                counts = np.bincount(indices, minlength=1 + n)[1:]
+                accum = counts.astype(float)
+                if mincnt is not None:
+                    accum[accum < mincnt] = np.nan
+            elif categorical:
+                _api.check_in_list(
+                    ['majority', 'purity', 'entropy'],
+                    reduce_C_function=reduce_C_function)
+                categories, counts, accum = _reduce_labels(
+                    indices, C, n, reduce_C_function)
+                if mincnt is not None:
+                    accum[counts < mincnt] = np.nan
+                if reduce_C_function == 'majority' and norm is None:
+                    # Each class has the same color regardless of the bins.
+                    vmin = -0.5 if vmin is None else vmin
+                    vmax = len(categories) - 0.5 if vmax is None else vmax
             else:
-                norm = mcolors.LogNorm(vmin=vmin, vmax=vmax)
-                vmin = vmax = None
-            bins = None
-
-        # autoscale the norm with current accum values if it hasn't been set
-        if norm is not None:
-            if norm.vmin is None and norm.vmax is None:
-                norm.autoscale(accum)
-
-        if bins is not None:
-            if not np.iterable(bins):
-                minimum, maximum = min(accum), max(accum)
-                bins -= 1  # one less edge than bins
-                bins = minimum + (maximum - minimum) * np.arange(bins) / bins
-            bins = np.sort(bins)
-            accum = bins.searchsorted(accum)
-
-        collection.set_array(accum)
-        collection.set_cmap(cmap)
-        collection.set_norm(norm)
-        collection.set_alpha(alpha)
-        collection.update(kwargs)  # matplotlib/matplotlib#22451
-        collection._scale_norm(norm, vmin, vmax)
-
-        # add the collection last
-        self.add_collection(collection, autolim=False)
+                if mincnt is None:
+                    mincnt = 0
+                accum = bin_index.reduce(C, reduce_C_function, mincnt)
+
+        serials = np.flatnonzero(~np.isnan(accum))
+        collection = self._hexbin(
+            serials, accum[serials], gridsize,
+            (tmin, tmax, lmin, lmax, rmin, rmax), bins, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+        if keep_index:
+            bin_index.serials = serials
+            collection.bin_index = bin_index
+        if bootstrap is not None:
+            lower, upper = bin_index.bootstrap(
+                C, reduce, bootstrap, seed=bootstrap_seed)
+            collection.interval_widths = (upper - lower)[serials]
+        if categorical:
+            collection.categories = categories
         return collection
 
+    @profiling.profiled_axes_method('tribin')
     def tribin(self, t, l, r, C=None, gridsize=100, bins=None,
                xscale='linear', yscale='linear', extent=None,
                cmap=None, norm=None, vmin=None, vmax=None,
                alpha=None, linewidths=None, edgecolors='face',
                reduce_C_function=np.mean, mincnt=None, marginals=False,
+               keep_index=False, bootstrap=None, bootstrap_seed=None,
                **kwargs):
         """
         Make a 2D triangular binning plot of points *t*, *l*, *r*.
@@ -604,6 +796,25 @@ class TernaryAxes(TernaryAxesBase):
         marginals : bool, default: *False*
             Ignored in mpltern.
 
+        keep_index : bool, default: *False*
+            If True, the rows of the data in each triangle are kept as
+            ``bin_index`` of the returned collection, a `.BinIndex`.
+            ``collection.bin_index.get_cell_rows(ind)`` gives the rows in the
+            ``ind``-th triangle of the collection, e.g., picked by a click.
+
+        bootstrap : int, default: *None*
+            If given, the number of the replicates to estimate the 95%
+            confidence intervals of the triangle values by the Poisson
+            bootstrap; see `.BinIndex.bootstrap`. The widths of the intervals
+            are kept as ``interval_widths`` of the returned collection, e.g.,
+            to be shown as ``collection.set_alpha(1 - widths / widths.max())``.
+            Only the counts and *reduce_C_function* of `numpy.sum` or
+            `numpy.mean` are supported.
+
+        bootstrap_seed : int or `numpy.random.Generator`, default: *None*
+            Seed of the replicates of *bootstrap*, to reproduce the
+            ``interval_widths``. By default they differ at every call.
+
         extent : 6-tuple of float, default: *None*
             The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
             The default assigns the limits based on *tlim*, *llim*, *rlim*.
@@ -653,6 +864,16 @@ class TernaryAxes(TernaryAxesBase):
             - `numpy.sum`: integral of the point values
             - `numpy.amax`: value taken from the largest point
 
+            If *C* are class labels of the points, the following strings are
+            also accepted, with which the classes are counted in all the bins
+            in one pass:
+
+            - 'majority': most frequent class, given as the index in
+              ``categories`` of the returned collection, i.e., the sorted
+              unique labels; ties go to the first one
+            - 'purity': fraction of the points of the most frequent class
+            - 'entropy': Shannon entropy of the classes in nats
+
         data : indexable object, optional
             DATA_PARAMETER_PLACEHOLDER
 
@@ -668,12 +889,15 @@ class TernaryAxes(TernaryAxesBase):
         self._process_unit_info(
             [("t", t), ("l", l), ("r", r)], kwargs, convert=False)
 
-        t, l, r, C = cbook.delete_masked_points(t, l, r, C)
+        # rows of the points, kept through the deletion of masked points
+        rows = np.arange(len(t)) if keep_index else None
+        t, l, r, C, rows = cbook.delete_masked_points(t, l, r, C, rows)
 
         # Count the number of data in each triangle
-        t = np.asarray(t, float)
-        l = np.asarray(l, float)
-        r = np.asarray(r, float)
+        dtype = self._get_float_dtype()
+        t = np.asarray(t, dtype)
+        l = np.asarray(l, dtype)
+        r = np.asarray(r, dtype)
 
         t, l, r = _normalize_tlr(t, l, r, self.ternary_sum)
 
@@ -687,52 +911,545 @@ class TernaryAxes(TernaryAxesBase):
         # number of triangles
         n = gridsize ** 2
 
-        st, sl, sr, it, il, ir = tribin_helpers.calc_ternary_indices(
-            t, l, r, gridsize, (tmin, tmax, lmin, lmax, rmin, rmax))
+        with profiling.phase('tribin.binning'):
+            _, _, _, it, il, ir = tribin_helpers.calc_ternary_indices(
+                t, l, r, gridsize, (tmin, tmax, lmin, lmax, rmin, rmax))
+
+            # flat indices plus one; out-of-range points go to position 0.
+            indices = tribin_helpers.ternary_to_serial(
+                gridsize, it, il, ir) + 1
+
+            categorical = C is not None and isinstance(reduce_C_function, str)
+
+            if bootstrap is not None:
+                reduce = 'count' if C is None else _reduce_names.get(
+                    reduce_C_function, reduce_C_function)
+                _api.check_in_list(
+                    ['count', 'sum', 'mean'], reduce_C_function=reduce)
+
+            bin_index = None
+            if keep_index or bootstrap is not None or (
+                    C is not None and not categorical):
+                bin_index = BinIndex(indices - 1, n, rows)
+
+            if C is None:  # [1:] drops out-of-range points.
+                counts = np.bincount(indices, minlength=1 + n)[1:]
+                accum = counts.astype(float)
+                if mincnt is not None:
+                    accum[accum < mincnt] = np.nan
+            elif categorical:
+                _api.check_in_list(
+                    ['majority', 'purity', 'entropy'],
+                    reduce_C_function=reduce_C_function)
+                categories, counts, accum = _reduce_labels(
+                    indices, C, n, reduce_C_function)
+                if mincnt is not None:
+                    accum[counts < mincnt] = np.nan
+                if reduce_C_function == 'majority' and norm is None:
+                    # Each class has the same color regardless of the bins.
+                    vmin = -0.5 if vmin is None else vmin
+                    vmax = len(categories) - 0.5 if vmax is None else vmax
+            else:
+                if mincnt is None:
+                    mincnt = 0
+                accum = bin_index.reduce(C, reduce_C_function, mincnt)
+
+        serials = np.flatnonzero(~np.isnan(accum))
+        collection = self._tribin(
+            serials, accum[serials], gridsize,
+            (tmin, tmax, lmin, lmax, rmin, rmax), bins, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+        if keep_index:
+            bin_index.serials = serials
+            collection.bin_index = bin_index
+        if bootstrap is not None:
+            lower, upper = bin_index.bootstrap(
+                C, reduce, bootstrap, seed=bootstrap_seed)
+            collection.interval_widths = (upper - lower)[serials]
+        if categorical:
+            collection.categories = categories
+        return collection
+
+    @profiling.profiled_axes_method('hexbin_prebinned')
+    def hexbin_prebinned(self, *args, gridsize=100, bins=None, extent=None,
+                         cmap=None, norm=None, vmin=None, vmax=None,
+                         alpha=None, linewidths=None, edgecolors='face',
+                         mincnt=None, **kwargs):
+        """
+        Make a hexbin plot of values already aggregated in hexagons.
+
+        Call signatures::
+
+            hexbin_prebinned(i, C, ...)
+            hexbin_prebinned(it, il, ir, C, ...)
+
+        The hexagons are given by the serial indices *i* or the ternary
+        indices *it*, *il*, *ir* as in
+        `mpltern.hexbin_helpers.ternary_to_serial`, and only the given
+        hexagons are processed, without the points. The values of the same
+        hexagon are summed.
+
+        Parameters
+        ----------
+        i : array-like of int
+            Serial indices of the hexagons.
+
+        it, il, ir : array-like of int
+            Ternary indices of the hexagons.
+
+        C : array-like
+            Values of the hexagons, e.g., the counts of the points.
+
+        gridsize : int, default: 100
+            Grid size of the bins, with which the indices are given.
+
+        bins : 'log' or int or sequence, default: None
+            Discretization of the hexagon values as in `hexbin`.
+
+        mincnt : float, default: *None*
+            If not *None*, only display cells with values not less than
+            *mincnt*.
+
+        extent : 6-tuple of float, default: *None*
+            The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
+            The default assigns the limits based on *tlim*, *llim*, *rlim*.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+            A `.PolyCollection` defining the hexagonal bins, in the
+            ascending order of the serial indices.
+
+        Other Parameters
+        ----------------
+        cmap, norm, vmin, vmax, alpha, linewidths, edgecolors
+            Same as in `hexbin`.
 
-        # flat indices, plus one so that out-of-range points go to position 0.
-        indices = tribin_helpers.ternary_to_serial(gridsize, it, il, ir) + 1
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+            All other keyword arguments are passed on to `.PolyCollection`.
 
-        if C is None:  # [1:] drops out-of-range points.
-            counts = np.bincount(indices, minlength=1 + n)[1:]
-            accum = counts.astype(float)
-            if mincnt is not None:
-                accum[accum < mincnt] = np.nan
+        See Also
+        --------
+        hexbin
+        """
+        n = (gridsize + 1) * (gridsize + 2) // 2
+        serials, accum = _get_prebinned(
+            args, gridsize, n, hexbin_helpers, 'hexbin_prebinned')
+        is_shown = ~np.isnan(accum)
+        if mincnt is not None:
+            is_shown &= accum >= mincnt
+        serials = serials[is_shown]
+        accum = accum[is_shown]
+
+        if extent is not None:
+            extent = tuple(extent)
         else:
-            # store the C values in a list per hexagon index
-            Cs = [[] for _ in range(1 + n)]
-            for i in range(len(C)):
-                Cs[indices[i]].append(C[i])
-            if mincnt is None:
-                mincnt = 0
-            accum = np.array(
-                [reduce_C_function(acc) if len(acc) >= mincnt else np.nan
-                 for acc in Cs[1:]],  # [1:] drops out-of-range points.
-                float)
-
-        good_idxs = ~np.isnan(accum)
-
-        _ = tribin_helpers.serial_to_ternary(gridsize, np.arange(n))
+            extent = self.get_tlim() + self.get_llim() + self.get_rlim()
+
+        return self._hexbin(
+            serials, accum, gridsize, extent, bins, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+
+    @profiling.profiled_axes_method('tribin_prebinned')
+    def tribin_prebinned(self, *args, gridsize=100, bins=None, extent=None,
+                         cmap=None, norm=None, vmin=None, vmax=None,
+                         alpha=None, linewidths=None, edgecolors='face',
+                         mincnt=None, **kwargs):
+        """
+        Make a tribin plot of values already aggregated in triangles.
+
+        Call signatures::
+
+            tribin_prebinned(i, C, ...)
+            tribin_prebinned(it, il, ir, C, ...)
+
+        The triangles are given by the serial indices *i* or the ternary
+        indices *it*, *il*, *ir* as in
+        `mpltern.tribin_helpers.ternary_to_serial`, and only the given
+        triangles are processed, without the points. The values of the same
+        triangle are summed.
+
+        Parameters
+        ----------
+        i : array-like of int
+            Serial indices of the triangles.
+
+        it, il, ir : array-like of int
+            Ternary indices of the triangles.
+
+        C : array-like
+            Values of the triangles, e.g., the counts of the points.
+
+        gridsize : int, default: 100
+            Grid size of the bins, with which the indices are given.
+
+        bins : 'log' or int or sequence, default: None
+            Discretization of the triangle values as in `tribin`.
+
+        mincnt : float, default: *None*
+            If not *None*, only display cells with values not less than
+            *mincnt*.
+
+        extent : 6-tuple of float, default: *None*
+            The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
+            The default assigns the limits based on *tlim*, *llim*, *rlim*.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+            A `.PolyCollection` defining the triangular bins, in the
+            ascending order of the serial indices.
+
+        Other Parameters
+        ----------------
+        cmap, norm, vmin, vmax, alpha, linewidths, edgecolors
+            Same as in `tribin`.
+
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+            All other keyword arguments are passed on to `.PolyCollection`.
+
+        See Also
+        --------
+        tribin
+        """
+        n = gridsize ** 2
+        serials, accum = _get_prebinned(
+            args, gridsize, n, tribin_helpers, 'tribin_prebinned')
+        is_shown = ~np.isnan(accum)
+        if mincnt is not None:
+            is_shown &= accum >= mincnt
+        serials = serials[is_shown]
+        accum = accum[is_shown]
+
+        if extent is not None:
+            extent = tuple(extent)
+        else:
+            extent = self.get_tlim() + self.get_llim() + self.get_rlim()
+
+        return self._tribin(
+            serials, accum, gridsize, extent, bins, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+
+    @profiling.profiled_axes_method('hexbin_compare')
+    def hexbin_compare(self, tlr1, tlr2, gridsize=100,
+                       statistic='difference', density=False, extent=None,
+                       cmap=None, norm=None, vmin=None, vmax=None, alpha=None,
+                       linewidths=None, edgecolors='face', mincnt=None,
+                       **kwargs):
+        """
+        Make a hexbin plot comparing two datasets on the same hexagons.
+
+        The points of both datasets are binned together in one pass, and only
+        the collection of the comparison is made.
+
+        Parameters
+        ----------
+        tlr1, tlr2 : (N, 3) array-like
+            Ternary coordinates of the baseline and the candidate datasets.
+
+        gridsize : int, default: 100
+            Number of hexagons in one direction between min and max.
+
+        statistic : {'difference', 'log_ratio', 'significance'}, \
+default: 'difference'
+            Value of each hexagon from the counts ``n1`` and ``n2`` of the
+            datasets with the totals ``N1`` and ``N2``:
+
+            - 'difference': ``n2 - n1``
+            - 'log_ratio': ``log((n2 + 0.5) / (n1 + 0.5))``, where 0.5 is
+              added to deal with empty hexagons
+            - 'significance': z-score of the difference of the Poisson rates,
+              ``(n2 / N2 - n1 / N1) / sqrt(n1 / N1**2 + n2 / N2**2)``
+
+        density : bool, default: False
+            If True, the counts in 'difference' and 'log_ratio', after adding
+            0.5 for the latter, are divided by ``N1`` and ``N2``.
+
+        extent : 6-tuple of float, default: *None*
+            The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
+            The default assigns the limits based on *tlim*, *llim*, *rlim*.
+
+        mincnt : int > 0, default: *None*
+            If not *None*, only display cells with at least *mincnt* points
+            of both datasets in total. Otherwise, cells with any point.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+            A `.PolyCollection` defining the hexagonal bins.
+
+        Other Parameters
+        ----------------
+        cmap : str or `~matplotlib.colors.Colormap`, default: 'RdBu_r'
+            Diverging colormap.
+
+        norm : `~matplotlib.colors.Normalize`, optional
+            By default, `~matplotlib.colors.CenteredNorm` centered at zero if
+            neither *vmin* nor *vmax* is given.
+
+        vmin, vmax, alpha, linewidths, edgecolors
+            Same as in `hexbin`.
+
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+            All other keyword arguments are passed on to `.PolyCollection`.
+
+        See Also
+        --------
+        hexbin
+        """
+        _api.check_in_list(
+            ['difference', 'log_ratio', 'significance'], statistic=statistic)
+        n = (gridsize + 1) * (gridsize + 2) // 2
+        serials, accum, extent = self._bin_compare(
+            tlr1, tlr2, gridsize, n, hexbin_helpers, extent,
+            statistic, density, mincnt, 'hexbin_compare')
+        if cmap is None:
+            cmap = 'RdBu_r'
+        if norm is None and vmin is None and vmax is None:
+            norm = mcolors.CenteredNorm()
+        return self._hexbin(
+            serials, accum, gridsize, extent, None, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+
+    @profiling.profiled_axes_method('tribin_compare')
+    def tribin_compare(self, tlr1, tlr2, gridsize=100,
+                       statistic='difference', density=False, extent=None,
+                       cmap=None, norm=None, vmin=None, vmax=None, alpha=None,
+                       linewidths=None, edgecolors='face', mincnt=None,
+                       **kwargs):
+        """
+        Make a tribin plot comparing two datasets on the same triangles.
+
+        The points of both datasets are binned together in one pass, and only
+        the collection of the comparison is made.
+
+        Parameters
+        ----------
+        tlr1, tlr2 : (N, 3) array-like
+            Ternary coordinates of the baseline and the candidate datasets.
+
+        gridsize : int, default: 100
+            Number of triangles in one direction between min and max.
+
+        statistic : {'difference', 'log_ratio', 'significance'}, \
+default: 'difference'
+            Value of each triangle from the counts ``n1`` and ``n2`` of the
+            datasets with the totals ``N1`` and ``N2``:
+
+            - 'difference': ``n2 - n1``
+            - 'log_ratio': ``log((n2 + 0.5) / (n1 + 0.5))``, where 0.5 is
+              added to deal with empty triangles
+            - 'significance': z-score of the difference of the Poisson rates,
+              ``(n2 / N2 - n1 / N1) / sqrt(n1 / N1**2 + n2 / N2**2)``
+
+        density : bool, default: False
+            If True, the counts in 'difference' and 'log_ratio', after adding
+            0.5 for the latter, are divided by ``N1`` and ``N2``.
+
+        extent : 6-tuple of float, default: *None*
+            The limits of the bins (tmin, tmax, lmin, lmax, rmin, rmax).
+            The default assigns the limits based on *tlim*, *llim*, *rlim*.
+
+        mincnt : int > 0, default: *None*
+            If not *None*, only display cells with at least *mincnt* points
+            of both datasets in total. Otherwise, cells with any point.
+
+        Returns
+        -------
+        `~matplotlib.collections.PolyCollection`
+            A `.PolyCollection` defining the triangular bins.
+
+        Other Parameters
+        ----------------
+        cmap : str or `~matplotlib.colors.Colormap`, default: 'RdBu_r'
+            Diverging colormap.
+
+        norm : `~matplotlib.colors.Normalize`, optional
+            By default, `~matplotlib.colors.CenteredNorm` centered at zero if
+            neither *vmin* nor *vmax* is given.
+
+        vmin, vmax, alpha, linewidths, edgecolors
+            Same as in `tribin`.
+
+        **kwargs : `~matplotlib.collections.PolyCollection` properties
+            All other keyword arguments are passed on to `.PolyCollection`.
+
+        See Also
+        --------
+        tribin
+        """
+        _api.check_in_list(
+            ['difference', 'log_ratio', 'significance'], statistic=statistic)
+        n = gridsize ** 2
+        serials, accum, extent = self._bin_compare(
+            tlr1, tlr2, gridsize, n, tribin_helpers, extent,
+            statistic, density, mincnt, 'tribin_compare')
+        if cmap is None:
+            cmap = 'RdBu_r'
+        if norm is None and vmin is None and vmax is None:
+            norm = mcolors.CenteredNorm()
+        return self._tribin(
+            serials, accum, gridsize, extent, None, cmap, norm,
+            vmin, vmax, alpha, linewidths, edgecolors, kwargs)
+
+    def _bin_compare(self, tlr1, tlr2, gridsize, n, helpers, extent,
+                     statistic, density, mincnt, name):
+        """Bin two datasets together and compare the counts in the bins.
+
+        *name* is the method, used as the prefix of the profiling phase.
+        """
+        sizes = []
+        tlrs = []
+        for tlr in (tlr1, tlr2):
+            t, l, r = np.asarray(tlr, self._get_float_dtype()).reshape(-1, 3).T
+            t, l, r = cbook.delete_masked_points(t, l, r)
+            sizes.append(len(t))
+            tlrs.append(_normalize_tlr(t, l, r, self.ternary_sum))
+        t, l, r = np.concatenate(tlrs, axis=1)
+
+        if extent is not None:
+            extent = tuple(extent)
+        else:
+            extent = self.get_tlim() + self.get_llim() + self.get_rlim()
+
+        with profiling.phase(f'{name}.binning'):
+            _, _, _, it, il, ir = helpers.calc_ternary_indices(
+                t, l, r, gridsize, extent)
+            # flat indices plus one; out-of-range points go to position 0.
+            indices = helpers.ternary_to_serial(gridsize, it, il, ir) + 1
+            # counts of (bin, dataset) in one pass
+            datasets = np.repeat([0, 1], sizes)
+            counts = np.bincount(2 * indices + datasets, minlength=2 * (1 + n))
+            n1, n2 = counts.reshape(1 + n, 2)[1:].T.astype(float)
+
+        serials = np.flatnonzero(
+            n1 + n2 >= (1 if mincnt is None else max(mincnt, 1)))
+        n1 = n1[serials]
+        n2 = n2[serials]
+        total1, total2 = (max(size, 1) for size in sizes)
+        if statistic == 'significance':
+            # Poisson rates and their variances
+            rate1, var1 = n1 / total1, n1 / total1 ** 2
+            rate2, var2 = n2 / total2, n2 / total2 ** 2
+            accum = (rate2 - rate1) / np.sqrt(var1 + var2)
+        elif statistic == 'difference':
+            accum = n2 / total2 - n1 / total1 if density else n2 - n1
+        else:  # 'log_ratio'
+            accum = np.log((n2 + 0.5) / (n1 + 0.5))
+            if density:
+                accum += np.log(total1 / total2)
+        return serials, accum, extent
+
+    def _hexbin(self, serials, accum, gridsize, extent, bins, cmap, norm,
+                vmin, vmax, alpha, linewidths, edgecolors, kwargs):
+        """Make the `.PolyCollection` of the hexagons of *serials*."""
+        tmin, tmax, lmin, lmax, rmin, rmax = extent
+
+        _ = hexbin_helpers.serial_to_ternary(gridsize, serials)
         offsets = np.array(_).T.astype(float)
 
-        # remove accumulation bins with no data
-        offsets = offsets[good_idxs, :]
-        accum = accum[good_idxs]
+        # scale into [0, 1]
+        offsets /= gridsize
+
+        # scale into the given extent
+        offsets_c = 1.0 - offsets
+        offsets[..., 0] = offsets_c[..., 0] * tmin + offsets[..., 0] * tmax
+        offsets[..., 1] = offsets_c[..., 1] * lmin + offsets[..., 1] * lmax
+        offsets[..., 2] = offsets_c[..., 2] * rmin + offsets[..., 2] * rmax
+
+        # side lengths along ternary axes
+        st = (tmax - tmin) / gridsize
+        sl = (lmax - lmin) / gridsize
+        sr = (rmax - rmin) / gridsize
+
+        polygon = [st, sl, sr] * np.array([
+            [-1.0 / 3, -1.0 / 3, +2.0 / 3],
+            [+1.0 / 3, -2.0 / 3, +1.0 / 3],
+            [+2.0 / 3, -1.0 / 3, -1.0 / 3],
+            [+1.0 / 3, +1.0 / 3, -2.0 / 3],
+            [-1.0 / 3, +2.0 / 3, -1.0 / 3],
+            [-2.0 / 3, +1.0 / 3, +1.0 / 3],
+        ]) + (tmax, lmin, rmin)
+
+        if linewidths is None:
+            linewidths = [1.0]
+
+        polygon = self.transProjection.transform(polygon)
+        offsets = self.transProjection.transform(offsets)
+
+        # shift the reference polygon at (tmax, lmin, rmin) to the origin
+        polygon -= self.transProjection.transform([(tmax, lmin, rmin)])[0]
+
+        if True:
+            # While `offset_transform` is introduced since `matplotlib>=3.6.0`,
+            # here an alias `transOffset` is used for backword compatibility.
+            # see matplotlib/matplotlib#21965
+            collection = mcoll.PolyCollection(
+                [polygon],
+                edgecolors=edgecolors,
+                linewidths=linewidths,
+                offsets=offsets,
+                transform=mtransforms.AffineDeltaTransform(self.transData),
+                transOffset=self.transData,
+            )
+
+        # Set normalizer if bins is 'log'
+        if bins == 'log':
+            if norm is not None:
+                _api.warn_external("Only one of 'bins' and 'norm' arguments "
+                                   f"can be supplied, ignoring bins={bins}")
+            else:
+                norm = mcolors.LogNorm(vmin=vmin, vmax=vmax)
+                vmin = vmax = None
+            bins = None
+
+        # autoscale the norm with current accum values if it hasn't been set
+        if norm is not None and len(accum):
+            if norm.vmin is None and norm.vmax is None:
+                norm.autoscale(accum)
+
+        if bins is not None:
+            if not np.iterable(bins):
+                minimum, maximum = min(accum), max(accum)
+                bins -= 1  # one less edge than bins
+                bins = minimum + (maximum - minimum) * np.arange(bins) / bins
+            bins = np.sort(bins)
+            accum = bins.searchsorted(accum)
+
+        collection.set_array(accum)
+        collection.set_cmap(cmap)
+        collection.set_norm(norm)
+        collection.set_alpha(alpha)
+        collection.update(kwargs)  # matplotlib/matplotlib#22451
+        collection._scale_norm(norm, vmin, vmax)
+
+        # add the collection last
+        self.add_collection(collection, autolim=False)
+        return collection
+
+    def _tribin(self, serials, accum, gridsize, extent, bins, cmap, norm,
+                vmin, vmax, alpha, linewidths, edgecolors, kwargs):
+        """Make the `.PolyCollection` of the triangles of *serials*."""
+        tmin, tmax, lmin, lmax, rmin, rmax = extent
+
+        _ = tribin_helpers.serial_to_ternary(gridsize, serials)
+        offsets = np.array(_).T.astype(float)
 
         polygons = np.repeat(offsets[:, None, :], 3, axis=1)
 
         # number of upward triangles
         nup = gridsize * (gridsize + 1) // 2
+        is_up = serials < nup
 
         # upward triangles
-        polygons[:nup, 0, :] += [1, 0, 0]
-        polygons[:nup, 1, :] += [0, 1, 0]
-        polygons[:nup, 2, :] += [0, 0, 1]
+        polygons[is_up, 0, :] += [1, 0, 0]
+        polygons[is_up, 1, :] += [0, 1, 0]
+        polygons[is_up, 2, :] += [0, 0, 1]
 
         # downward triangles
-        polygons[nup:, 0, :] += [0, 1, 1]
-        polygons[nup:, 1, :] += [1, 0, 1]
-        polygons[nup:, 2, :] += [1, 1, 0]
+        polygons[~is_up, 0, :] += [0, 1, 1]
+        polygons[~is_up, 1, :] += [1, 0, 1]
+        polygons[~is_up, 2, :] += [1, 1, 0]
 
         # scale into [0, 1]
         polygons /= gridsize
@@ -767,7 +1484,7 @@ class TernaryAxes(TernaryAxesBase):
             bins = None
 
         # autoscale the norm with current accum values if it hasn't been set
-        if norm is not None:
+        if norm is not None and len(accum):
             if norm.vmin is None and norm.vmax is None:
                 norm.autoscale(accum)
 
@@ -790,15 +1507,261 @@ class TernaryAxes(TernaryAxesBase):
         self.add_collection(collection, autolim=False)
         return collection
 
+    @profiling.profiled_axes_method('pixelbin')
+    def pixelbin(self, t, l, r, C=None, reduce_C_function='mean',
+                 pixelsize=1.0, cmap=None, norm=None, vmin=None, vmax=None,
+                 alpha=None, **kwargs):
+        """
+        Make an image of points *t*, *l*, *r* aggregated into pixels.
+
+        Unlike `hexbin` and `tribin`, the points are aggregated directly into
+        a grid of the pixels of the Axes, and the result is drawn as a single
+        image clipped to the triangle. This is suitable for a huge number of
+        points, for which `scatter` is slow to draw and heavy in vector
+        formats. The aggregation is redone when the Axes is resized or the
+        ternary limits are changed.
+
+        If *C* is *None*, the value of the pixel is the number of points in the
+        pixel. Otherwise, *C* specifies values at the coordinate
+        (t[i], l[i], r[i]), which are reduced using *reduce_C_function*.
+        Pixels with no points are left transparent.
+
+        Parameters
+        ----------
+        t, l, r : array-like
+            The data positions. *t*, *l*, and *r* must be of the same length.
+
+        C : array-like, optional
+            If given, these values are accumulated in the pixels. Must be of
+            the same length as *t*, *l*, and *r*.
+
+        reduce_C_function : {'mean', 'sum', 'min', 'max'}, default: 'mean'
+            How to aggregate *C* within the pixels. It is ignored if *C* is
+            not given. `numpy.mean`, `numpy.sum`, `numpy.amin`, and
+            `numpy.amax` are also accepted.
+
+        pixelsize : float, default: 1.0
+            Size of a bin in the display (pixel) coordinates.
+
+        Returns
+        -------
+        `~mpltern.ternary.image.TernaryDensityImage`
+
+        Other Parameters
+        ----------------
+        %(cmap_doc)s
+
+        %(norm_doc)s
+
+        %(vmin_vmax_doc)s
+
+        alpha : float between 0 and 1, optional
+            The alpha blending value, between 0 (transparent) and 1 (opaque).
+
+        **kwargs : `~matplotlib.image.AxesImage` properties
+
+        See Also
+        --------
+        hexbin : 2D histogram hexagonal bins
+        tribin : 2D histogram triangular bins
+        """
+        self._process_unit_info(
+            [("t", t), ("l", l), ("r", r)], kwargs, convert=False)
+
+        t, l, r, C = cbook.delete_masked_points(t, l, r, C)
+
+        if C is None:
+            reduce = 'count'
+        else:
+            reduce = _reduce_names.get(reduce_C_function, reduce_C_function)
+            _api.check_in_list(
+                ['mean', 'sum', 'min', 'max'],
+                reduce_C_function=reduce)
+
+        tlr = np.column_stack((t, l, r))
+        xy = self.transProjection.transform(
+            tlr.astype(self._get_float_dtype(), copy=False))
+
+        autoscale = vmin is None and vmax is None and (
+            norm is None or (norm.vmin is None and norm.vmax is None))
+
+        image = TernaryDensityImage(
+            self,
+            xy,
+            C,
+            reduce=reduce,
+            pixelsize=pixelsize,
+            autoscale=autoscale,
+            cmap=cmap,
+            norm=norm,
+            origin='lower',
+            interpolation='nearest',
+        )
+        image._aggregate()
+        image.set_alpha(alpha)
+        image.update(kwargs)
+        image._scale_norm(norm, vmin, vmax)
+        image.set_clip_path(self.patch)
+
+        self.add_image(image)
+        return image
+
+    def trajectories(self, tlrs, C=None, *, cmap=None, norm=None, vmin=None,
+                     vmax=None, **kwargs):
+        """
+        Plot many trajectories as a single `.LineCollection`.
+
+        This is much faster than calling `plot` for each trajectory, because
+        all the points are projected at once and only one artist is drawn.
+
+        Parameters
+        ----------
+        tlrs : (K, N, 3) array-like or sequence of (N_k, 3) array-like
+            Ternary coordinates of the K trajectories. The trajectories may
+            have different numbers of points.
+
+        C : (K,) array-like, optional
+            Values of the trajectories mapped to colors by *cmap* and *norm*.
+
+        Returns
+        -------
+        `~matplotlib.collections.LineCollection`
+
+        Other Parameters
+        ----------------
+        %(cmap_doc)s
+
+        %(norm_doc)s
+
+        %(vmin_vmax_doc)s
+
+        **kwargs : `~matplotlib.collections.LineCollection` properties
+
+        See Also
+        --------
+        plot : Plot a single trajectory as `~matplotlib.lines.Line2D`.
+        """
+        if isinstance(tlrs, np.ndarray) and tlrs.ndim == 3:
+            k, n, _ = tlrs.shape
+            xy = self.transProjection.transform(tlrs.reshape(-1, 3))
+            segments = xy.reshape(k, n, 2)
+        else:
+            tlrs = [np.asarray(_, dtype=float).reshape(-1, 3) for _ in tlrs]
+            if tlrs:
+                xy = self.transProjection.transform(np.concatenate(tlrs))
+            else:
+                xy = np.empty((0, 2))
+            indices = np.cumsum([len(_) for _ in tlrs])[:-1]
+            segments = np.split(xy, indices)
+
+        collection = mcoll.LineCollection(segments, cmap=cmap, norm=norm,
+                                          **kwargs)
+        if C is not None:
+            collection.set_array(np.asarray(C))
+            collection._scale_norm(norm, vmin, vmax)
+
+        self.add_collection(collection, autolim=False)
+        return collection
+
+    def streamplot(self, *args, **kwargs):
+        trans = kwargs.get('transform', None)
+        if trans is not None and trans.input_dims == 2:
+            return super().streamplot(*args, **kwargs)
+        return mstream.streamplot(self, *args, **kwargs)
+
+    streamplot.__doc__ = mstream.streamplot.__doc__
+
     arrow = parse_ternary_vector(TernaryAxesBase.arrow)
     quiver = parse_ternary_vector(TernaryAxesBase.quiver)
     barbs = parse_ternary_vector(TernaryAxesBase.barbs)
     fill = parse_ternary_multiple(TernaryAxesBase.fill)
     hist2d = parse_ternary_single(TernaryAxesBase.hist2d)
-    tricontour = parse_ternary_single(TernaryAxesBase.tricontour)
-    tricontourf = parse_ternary_single(TernaryAxesBase.tricontourf)
-    tripcolor = parse_ternary_single(TernaryAxesBase.tripcolor)
-    triplot = parse_ternary_single(TernaryAxesBase.triplot)
+    tricontour = parse_ternary_triangulation(TernaryAxesBase.tricontour)
+    tricontourf = parse_ternary_triangulation(TernaryAxesBase.tricontourf)
+    tripcolor = parse_ternary_triangulation(TernaryAxesBase.tripcolor)
+    triplot = parse_ternary_triangulation(TernaryAxesBase.triplot)
+
+
+# Reduction functions accepted in `pixelbin` in addition to their names
+_reduce_names = {
+    np.mean: 'mean',
+    np.sum: 'sum',
+    np.amin: 'min',
+    np.amax: 'max',
+    np.min: 'min',
+    np.max: 'max',
+    sum: 'sum',
+    min: 'min',
+    max: 'max',
+}
+
+
+def _get_prebinned(args, gridsize, n, helpers, name):
+    """Get the sorted serial indices and the summed values of the bins."""
+    if len(args) == 2:
+        serials, values = args
+        serials = np.asarray(serials)
+    elif len(args) == 4:
+        it, il, ir, values = args
+        it, il, ir = np.broadcast_arrays(it, il, ir)
+        serials = helpers.ternary_to_serial(gridsize, it, il, ir)
+        # The sum of the ternary indices is not checked in the conversion.
+        is_valid = np.all(np.equal(
+            helpers.serial_to_ternary(gridsize, np.maximum(serials, 0)),
+            (it, il, ir)), axis=0)
+        serials = np.where(is_valid, serials, -1)
+    else:
+        raise TypeError(f"{name}() takes 2 or 4 positional arguments but "
+                        f"{len(args)} were given")
+    values = np.asarray(values, float)
+    if serials.shape != values.shape:
+        raise ValueError("The indices and 'C' must be of the same shape")
+    if serials.size and not np.issubdtype(serials.dtype, np.integer):
+        raise ValueError("The indices must be integers")
+    serials = serials.astype(int)  # e.g. float64 of `np.asarray([])`
+    if np.any((serials < 0) | (serials >= n)):
+        raise ValueError(f"The indices are out of the bins of gridsize "
+                         f"{gridsize}")
+    serials, inverse = np.unique(serials.ravel(), return_inverse=True)
+    values = np.bincount(inverse, weights=values.ravel(),
+                         minlength=len(serials))
+    return serials, values
+
+
+def _reduce_labels(indices, labels, n, reduce):
+    """Reduce the class labels in each bin.
+
+    *indices* are the serial indices of the bins plus one, where 0 is for the
+    out-of-range points. Bins with no points give NaN.
+
+    Returns
+    -------
+    categories : np.ndarray
+        Sorted unique labels.
+    counts : (n,) np.ndarray
+        Number of the points in each bin.
+    accum : (n,) np.ndarray
+        Reduced values.
+    """
+    categories, codes = np.unique(np.asarray(labels), return_inverse=True)
+    k = len(categories)
+    if k == 0:
+        return categories, np.zeros(n, int), np.full(n, np.nan)
+    counts = np.bincount(indices * k + codes.ravel(), minlength=(1 + n) * k)
+    counts = counts.reshape(1 + n, k)[1:]  # [1:] drops out-of-range points.
+    total = counts.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fractions = counts / total[:, None]
+        if reduce == 'majority':
+            accum = np.argmax(counts, axis=1).astype(float)
+        elif reduce == 'purity':
+            accum = np.max(fractions, axis=1)
+        else:  # 'entropy'
+            accum = np.sum(
+                np.where(counts > 0, fractions * np.log(1.0 / fractions), 0.0),
+                axis=1)
+    accum[total == 0] = np.nan
+    return categories, total, accum
 
 
 def _normalize_tlr(t, l, r, ternary_sum):
@@ -808,8 +1771,6 @@ def _normalize_tlr(t, l, r, ternary_sum):
     values must be analyzed inside.
     In the other methods ternary values are normalized in parsers beforehand.
     """
-    scale = ternary_sum / (t + l + r)
-    t *= scale
-    l *= scale
-    r *= scale
-    return t, l, r
+    scale = float(ternary_sum) / (t + l + r)
+    # Not in place, not to modify the arrays given by the user
+    return t * scale, l * scale, r * scale
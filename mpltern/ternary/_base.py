@@ -1,15 +1,23 @@
+import contextlib
 import logging
 import warnings
+import weakref
 
 import numpy as np
 
 import matplotlib as mpl
 import matplotlib.cbook as cbook
+import matplotlib.collections as mcoll
+import matplotlib.colors as mcolors
+import matplotlib.contour as mcontour
+import matplotlib.lines as mlines
 import matplotlib.patches as mpatches
 import matplotlib.transforms as mtransforms
 import matplotlib.axis as maxis
 from matplotlib.axes import Axes
 from matplotlib import _api
+from mpltern.conversions import get_corners
+from mpltern.spatial import GridIndex
 from mpltern.ternary.spines import Spine
 from mpltern.ternary.transforms import (
     TernaryAxisTransform, TernaryTickLabelShift,
@@ -18,39 +26,47 @@ from mpltern.ternary.transforms import (
     TernaryLinearTransform,
     BarycentricTransform)
 from mpltern.ternary.axis import TAxis, LAxis, RAxis
+from mpltern.ternary.decimation import Decimation
+from mpltern.ternary import profiling
 
 _log = logging.getLogger(__name__)
 
+# Corners of a regular triangle with the side of sqrt(2), which embed the
+# plane of ``t + l + r = const`` in 2D keeping the Euclidean distances
+_ISOMETRIC_CORNERS = np.array([
+    [0.0, 0.0], [np.sqrt(2.0), 0.0], [np.sqrt(0.5), np.sqrt(1.5)]])
 
-def _create_corners(corners=None, rotation=None):
-    if corners is None:
-        # By default, regular upward triangle is created.
-        # The bottom and the top of the triangle have 0.0 and 1.0,
-        # respectively, as the *y* coordinate in the original `Axes`
-        # coordinates.
-        # The horizontal center of the triangle has 0.0 as the *x*
-        # coordinate in the original `Axes` coordinates.
-        # The other coordinates are given to make the regular triangle.
-        xmin = -1.0 / np.sqrt(3.0)
-        xmax = +1.0 / np.sqrt(3.0)
-        corners = ((0.0, 1.0), (xmin, 0.0), (xmax, 0.0))
-    corners = np.asarray(corners)
-    if rotation is not None:
-        # The rotation is done around the centroid of the given triangle.
-        cx, cy = np.average(corners, axis=0)
-        trans = mtransforms.Affine2D().rotate_deg_around(cx, cy, rotation)
-        corners = trans.transform(corners)
-        # The following shift places the triangle inside the original
-        # square `Axes` as much as possible.
-        tmp = (np.min(corners, axis=0) + np.max(corners, axis=0)) * 0.5
-        corners += (np.array([0.0, 0.5]) - tmp)
-    return corners
+
+def _count_elements(collection):
+    """Count the elements of *collection* for the rasterization policy."""
+    if isinstance(collection, mcoll.TriMesh):
+        return len(collection._triangulation.get_masked_triangles())
+    paths = collection.get_paths()
+    count = max(len(collection.get_offsets()), len(paths))
+    # Filled contours have a few paths with many polygons each.
+    if isinstance(collection, mcontour.ContourSet) or count <= 1:
+        return sum(len(_.vertices) for _ in paths)
+    return count
+
+
+def _get_dash_pattern(line):
+    """Get the unscaled dash pattern of *line*, or None if not dashed."""
+    if not line.is_dashed():
+        return None
+    if tuple(int(_) for _ in mpl.__version__.split('.')[:2]) < (3, 5):
+        offset, dashes = line._us_dashOffset, line._us_dashSeq
+    else:
+        offset, dashes = line._unscaled_dash_pattern
+    return offset, tuple(dashes)
 
 
 class TernaryAxesBase(Axes):
     _axis_names = ("x", "y", "t", "l", "r")
     _shared_axes = {name: cbook.Grouper() for name in _axis_names}
 
+    # Maximum number of triangulations kept for `tricontour` etc.
+    _triangulation_cache_size = 8
+
     def __init__(self, *args, ternary_sum: float = 1.0, corners=None,
                  rotation: float = None, **kwargs):
         """Build an TernaryAxes in a figure.
@@ -77,8 +93,41 @@ class TernaryAxesBase(Axes):
         self._sharel = None
         self._sharer = None
 
+        # Triangulations of ternary data, reused among `tricontour` etc.
+        self._triangulation_cache = {}
+
+        # Level-of-detail decimation of lines and markers, off by default
+        self._decimation = None
+
+        # Whether `get_children` gives the artists to `Axes.draw`
+        self._drawing = False
+
+        # Element count above which collections are rasterized, off by default
+        self._rasterization_threshold = None
+
+        # Profiler of the phases of plotting and drawing, off by default
+        self._profiler = None
+
+        # Floating-point precision of the ternary data
+        self._precision = 'float64'
+
+        # Spatial indices of the points of artists, built on the first query
+        # artist -> {coords: (data, view key, index)}
+        self._point_indices = weakref.WeakKeyDictionary()
+
+        # Gridlines drawn as collections instead of by each tick
+        self._grid_collection = False
+        self._grid_collections = []
+
+        # Tick spaces of the three axes and the view they are computed for
+        self._tick_spaces_key = None
+        self._tick_spaces = None
+
+        # Angles of the ticks and the axes, shared by the ticks of each axis
+        self._tick_angles_cache = {}
+
         # Triangle corners in the original data coordinates
-        self.corners_data = _create_corners(corners, rotation)
+        self.corners_data = get_corners(corners, rotation)
         sx = np.sqrt(3.0) * 0.5  # Scale for x
         xmin = -1.0 / np.sqrt(3.0)
         v = xmin * sx
@@ -197,8 +246,8 @@ class TernaryAxesBase(Axes):
         self._rlabel_c_transform = TernaryAxisLabelCTransform(raxis_tr, h2t_r)
 
         # From ternary coordinates to the original data coordinates
-        self.transProjection = \
-            self.transTernaryScale + BarycentricTransform(self.corners_data)
+        self._transBarycentric = BarycentricTransform(self.corners_data)
+        self.transProjection = self.transTernaryScale + self._transBarycentric
 
         # From ternary coordinates to the original Axes coordinates
         self._ternary_axes_transform = self.transProjection + self.transLimits
@@ -293,6 +342,8 @@ class TernaryAxesBase(Axes):
         return self.raxis
 
     def clear(self):
+        self._triangulation_cache.clear()
+        self._point_indices.clear()
         self.viewTLim.intervalx = 0.0, self.ternary_sum
         self.viewLLim.intervalx = 0.0, self.ternary_sum
         self.viewRLim.intervalx = 0.0, self.ternary_sum
@@ -311,6 +362,7 @@ class TernaryAxesBase(Axes):
     def autoscale_view(self, *args, **kwargs):
         pass
 
+    @profiling.profiled('title_position')
     def _update_title_position(self, renderer):
         """
         Update the title position based on the bounding box enclosing
@@ -636,6 +688,41 @@ class TernaryAxesBase(Axes):
             [self.ternary_sum - rmax - lmin, lmin, rmax],
         ]
 
+    def _get_tick_spaces(self):
+        """Get the lengths in pixels available for the ticks of the axes.
+
+        The lengths for the t-, l-, and r-axes are computed together from a
+        single projection of the view limits and are reused until the view is
+        changed.
+
+        Returns
+        -------
+        (3,) np.ndarray
+            Extents of the view-limit hexagon perpendicular to the edges
+            opposite to the t, l, and r corners.
+        """
+        key = (
+            self.transAxes.get_matrix().tobytes(),
+            self.transLimits.get_matrix().tobytes(),
+            self.viewTLim.intervalx.tobytes(),
+            self.viewLLim.intervalx.tobytes(),
+            self.viewRLim.intervalx.tobytes(),
+            self.corners_axes.tobytes(),
+        )
+        if key != self._tick_spaces_key:
+            vertices = self._get_hexagonal_vertices()
+            points = self._ternary2display_transform.transform(vertices)
+            corners = [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]]
+            corners = self.transTernaryAxes.transform(corners)
+            # edges opposite to the t, l, and r corners
+            edges = np.roll(corners, -2, axis=0) - np.roll(corners, -1, axis=0)
+            normals = np.column_stack((-edges[:, 1], edges[:, 0]))
+            normals /= np.linalg.norm(normals, axis=1)[:, None]
+            distances = points @ normals.T
+            self._tick_spaces = distances.max(axis=0) - distances.min(axis=0)
+            self._tick_spaces_key = key
+        return self._tick_spaces
+
     def _get_triangular_vertices(self):
         """Get vertices of the extrapolative triangle."""
         tmin = self.get_tlim()[0]
@@ -805,6 +892,393 @@ class TernaryAxesBase(Axes):
         self.set_ternary_lim(tmin, tmax, lmin, lmax, rmin, rmax, fit)
         return self.get_rlim()
 
+    def get_decimation(self):
+        """Return the cell size for the decimation, or None if disabled."""
+        return None if self._decimation is None else self._decimation.pixelsize
+
+    def set_decimation(self, pixelsize=1.0):
+        """Set the level-of-detail decimation of lines and markers.
+
+        At drawing, the points of `plot` and `scatter` are decimated in the
+        display space so that only the points distinguishable at the current
+        resolution are rendered. Points of lines in the same cell as the
+        previous points are dropped, and only the last marker in each occupied
+        cell is kept. Only the paths given to the renderer are decimated, and
+        the data of the artists, e.g., given by `.PathCollection.get_offsets`,
+        are kept as they are. The decimation is redone when the view is
+        changed, e.g., by `set_ternary_lim`.
+
+        Parameters
+        ----------
+        pixelsize : float or None
+            Size of a cell in the display (pixel) coordinates.
+            If None, the decimation is disabled.
+        """
+        if pixelsize is None:
+            self._decimation = None
+        else:
+            self._decimation = Decimation(pixelsize)
+        self.stale = True
+
+    def get_rasterization_threshold(self):
+        """Return the threshold of the rasterization, or None if disabled."""
+        return self._rasterization_threshold
+
+    def set_rasterization_threshold(self, threshold=10000):
+        """Set the element count above which collections are rasterized.
+
+        At drawing in vector formats, collections with more elements than
+        *threshold*, e.g., of `hexbin`, `tribin`, `tripcolor`, `tricontourf`,
+        and `scatter`, are rasterized at the DPI of the output, while the
+        spines, the ticks, the gridlines, even if gathered by
+        `set_grid_collection`, and the labels are kept as vectors. This keeps
+        files of heavy plots small and fast to write. The elements are the
+        markers, the bins, or the triangles; for filled contours, the vertices
+        of the polygons. Collections already set to be rasterized are kept so.
+
+        Parameters
+        ----------
+        threshold : int or None
+            If None, the policy is disabled.
+        """
+        self._rasterization_threshold = threshold
+        self.stale = True
+
+    def get_grid_collection(self):
+        """Return whether the gridlines are drawn as collections."""
+        return self._grid_collection
+
+    def set_grid_collection(self, b):
+        """Set whether to draw the gridlines as collections.
+
+        If True, the gridlines of all the three axes are drawn as one
+        `.LineCollection` per line style, instead of one `.Line2D` per tick.
+        This makes figures with many gridlines faster to draw and smaller in
+        vector formats. The ticks still determine the positions and the
+        styles of the gridlines, which are configured by `grid` as usual.
+
+        Parameters
+        ----------
+        b : bool
+        """
+        self._grid_collection = bool(b)
+        self.stale = True
+
+    def _update_grid_collections(self):
+        """Gather the gridlines of the ticks into collections by style.
+
+        The ticks are kept for the draw, so that the axes need not update
+        them again.
+
+        Returns
+        -------
+        list of `.Line2D`
+            Gridlines gathered into the collections.
+        """
+        groups = {}
+        gridlines = []
+        axes = (self.taxis, self.laxis, self.raxis) if self.axison else ()
+        for axis in axes:
+            if not axis.get_visible():
+                continue
+            axis._ticks_to_draw = axis._update_ticks()
+            for tick in axis._ticks_to_draw:
+                line = tick.gridline
+                if not (tick.get_visible() and line.get_visible()):
+                    continue
+                if line.get_linestyle() in ('None', ' ', ''):
+                    continue
+                if line.is_dashed():
+                    capstyle = line.get_dash_capstyle()
+                else:
+                    capstyle = line.get_solid_capstyle()
+                key = (
+                    mcolors.to_rgba(line.get_color(), line.get_alpha()),
+                    line.get_linewidth(),
+                    line.get_linestyle(),
+                    _get_dash_pattern(line),
+                    capstyle,
+                    axis.get_zorder(),
+                )
+                xy = line.get_transform().transform(line.get_xydata())
+                groups.setdefault(key, []).append(xy)
+                gridlines.append(line)
+
+        self._grid_collections = []
+        for key, segments in groups.items():
+            color, linewidth, _, dashes, capstyle, zorder = key
+            collection = mcoll.LineCollection(
+                segments,
+                colors=[color],
+                linewidths=linewidth,
+                linestyles=['solid' if dashes is None else dashes],
+                capstyle=capstyle,
+                zorder=zorder,
+                transform=mtransforms.IdentityTransform(),
+            )
+            self._set_artist_props(collection)
+            collection.set_in_layout(False)
+            self._grid_collections.append(collection)
+        return gridlines
+
+    def get_precision(self):
+        """Return the floating-point precision of the ternary data."""
+        return self._precision
+
+    def set_precision(self, precision='float64'):
+        """Set the floating-point precision of the ternary data.
+
+        With 'float32', the ternary data given to the plotting methods
+        afterwards are projected, binned and aggregated in single precision,
+        which halves the memory of the intermediate arrays and speeds up
+        `hexbin`, `tribin`, `pixelbin`, and the parsing of the other methods
+        for large data. The ternary transforms, e.g. `transProjection`, then
+        also keep float32 input in float32; with 'float64', they return
+        float64 as usual. Matplotlib still stores the points of lines and the
+        offsets of collections in double precision.
+
+        The accuracy is bounded by the machine epsilon of float32,
+        ``eps = 2 ** -23``, i.e., about 1.2e-7:
+
+        - The projected coordinates have absolute errors within a few
+          ``eps`` of the size of the triangle, far below a pixel.
+        - In `hexbin` and `tribin`, only the points within about
+          ``gridsize * eps`` of the bin boundaries, in units of the bin size,
+          may be assigned to the neighboring bins.
+
+        Parameters
+        ----------
+        precision : {'float64', 'float32'}
+        """
+        _api.check_in_list(['float64', 'float32'], precision=precision)
+        self._precision = precision
+        for trans in (self.transTernaryScale, self._transBarycentric,
+                      self.transAxesProjection):
+            trans.dtype = np.dtype(precision)
+            trans.invalidate()
+
+    def _get_float_dtype(self):
+        return np.dtype(self._precision)
+
+    def get_profiler(self):
+        """Return the `.Profiler` recording this Axes, or None if disabled."""
+        return self._profiler
+
+    def set_profiling(self, b):
+        """Set whether to profile the phases of plotting and drawing.
+
+        If True, the wall time and the number of calls are recorded for the
+        parsing of the ternary data, the binning, the drawing of each kind of
+        artist, and, inside them, the tick layout, the title positioning, the
+        text-extent measurements and the transforms. The records accumulate
+        over the draws in the `.Profiler` given by `get_profiler`, which
+        provides them by `.Profiler.report` or sends them to the logger by
+        `.Profiler.log`.
+
+        Parameters
+        ----------
+        b : bool
+            If True, a new profiler is set. If False, the profiling is
+            disabled.
+        """
+        self._profiler = profiling.Profiler() if b else None
+
+    def _get_point_index(self, artist, coords):
+        """Get the `.GridIndex` of the points of *artist* in *coords*.
+
+        The index is rebuilt only if the data of *artist* are replaced or, for
+        ``coords='display'``, the data-to-display transform is changed.
+        """
+        _api.check_in_list(['ternary', 'display'], coords=coords)
+        if isinstance(artist, mcoll.Collection):
+            data = artist.get_offsets()
+            trans = artist.get_offset_transform()
+        elif isinstance(artist, mlines.Line2D):
+            data = artist.get_xydata()
+            trans = artist.get_transform()
+        else:
+            raise ValueError(f"{artist} has no points to query")
+        if trans != self.transData:
+            raise ValueError(f"{artist} is not in the data coordinates")
+
+        if coords == 'ternary':
+            key = None
+        else:
+            key = self.transData.get_affine().get_matrix().tobytes()
+        indices = self._point_indices.setdefault(artist, {})
+        entry = indices.get(coords)
+        if entry is not None and entry[0] is data and entry[1] == key:
+            return entry[2]
+
+        xy = np.ma.filled(np.ma.asarray(data, float), np.nan)
+        if coords == 'ternary':
+            tlr = self.transProjection.inverted().transform(xy)
+            points = tlr @ _ISOMETRIC_CORNERS
+        else:
+            points = self.transData.transform(xy)
+        index = GridIndex(points)
+        indices[coords] = data, key, index
+        return index
+
+    def _get_query_points(self, points, coords):
+        points = np.asarray(points, float)
+        if coords == 'ternary':
+            s = np.sum(points, axis=-1, keepdims=True)
+            return (points * (self.ternary_sum / s)) @ _ISOMETRIC_CORNERS
+        return points
+
+    def find_nearest(self, artist, point, *, coords='ternary',
+                     max_distance=np.inf):
+        """Find the point of *artist* nearest to *point*.
+
+        The points of *artist* are indexed on a grid on the first query, and
+        the index is reused until the data are replaced or, for
+        ``coords='display'``, the view is changed. This makes the queries,
+        e.g., for hovering, fast even for a large number of points.
+
+        Parameters
+        ----------
+        artist : `.Line2D` or `.Collection`
+            Artist in the data coordinates, e.g., given by `plot` or
+            `scatter`.
+        point : (3,) or (M, 3) array_like, or (2,) or (M, 2) array_like
+            Query point(s) as ``(t, l, r)`` or in the display coordinates.
+        coords : {'ternary', 'display'}, default: 'ternary'
+            Coordinates of *point* and the distances. The distances are the
+            Euclidean ones of ``(t, l, r)`` normalized to `ternary_sum`, or
+            those in pixels.
+        max_distance : float, default: inf
+            Points farther than this are not found.
+
+        Returns
+        -------
+        index : int or (M,) np.ndarray
+            Index of the nearest point, or -1 if not found.
+        distance : float or (M,) np.ndarray
+            Distance to the nearest point, or inf if not found.
+        """
+        index = self._get_point_index(artist, coords)
+        point = self._get_query_points(point, coords)
+        return index.nearest(point, max_distance)
+
+    def find_within(self, artist, point, radius, *, coords='ternary'):
+        """Find the points of *artist* within *radius* of *point*.
+
+        Parameters
+        ----------
+        artist : `.Line2D` or `.Collection`
+            Artist in the data coordinates, e.g., given by `plot` or
+            `scatter`.
+        point : (3,) or (2,) array_like
+            Query point as ``(t, l, r)`` or in the display coordinates.
+        radius : float
+            Radius in the coordinates given by *coords*.
+        coords : {'ternary', 'display'}, default: 'ternary'
+            Coordinates as in `find_nearest`.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the points in the ascending order.
+
+        See Also
+        --------
+        find_nearest
+        """
+        index = self._get_point_index(artist, coords)
+        return index.within(self._get_query_points(point, coords), radius)
+
+    def find_in_polygon(self, artist, vertices, *, coords='ternary'):
+        """Find the points of *artist* inside a polygon, e.g., of a lasso.
+
+        The points are tested in the coordinates projected in advance, and
+        only those near the edges of the polygon are tested one by one.
+
+        Parameters
+        ----------
+        artist : `.Line2D` or `.Collection`
+            Artist in the data coordinates, e.g., given by `plot` or
+            `scatter`.
+        vertices : (M, 3) or (M, 2) array_like
+            Vertices of the polygon as ``(t, l, r)`` or in the display
+            coordinates. The polygon is closed implicitly.
+        coords : {'ternary', 'display'}, default: 'ternary'
+            Coordinates as in `find_nearest`.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the points in the ascending order.
+
+        See Also
+        --------
+        find_nearest
+        """
+        index = self._get_point_index(artist, coords)
+        return index.within_polygon(self._get_query_points(vertices, coords))
+
+    def get_children(self):
+        children = super().get_children()
+        if self._grid_collection:
+            children.extend(self._grid_collections)
+        if self._drawing:
+            children = [self._get_draw_proxy(_) for _ in children]
+        return children
+
+    def _get_draw_proxy(self, artist):
+        """Return the object drawing *artist* in `draw`."""
+        proxy = artist
+        if self._decimation is not None:
+            proxy = self._decimation.wrap(proxy)
+        if profiling.is_active():
+            name = f'draw.{type(artist).__name__}'
+            proxy = profiling._ProfiledArtist(proxy, name)
+        return proxy
+
+    def get_tightbbox(self, renderer=None, *args, **kwargs):
+        with profiling.phase('tightbbox', self._profiler):
+            return super().get_tightbbox(renderer, *args, **kwargs)
+
+    def draw(self, renderer):
+        with profiling.phase('draw', self._profiler):
+            with self._gridlines_gathered():
+                # The gathered gridlines are kept vector.
+                rasterized = []
+                if self._rasterization_threshold is not None:
+                    rasterized = [
+                        _ for _ in self.get_children()
+                        if isinstance(_, mcoll.Collection)
+                        and _ not in self._grid_collections
+                        and not _.get_rasterized()
+                        and _count_elements(_) > self._rasterization_threshold
+                    ]
+                for artist in rasterized:
+                    artist.set_rasterized(True)
+                try:
+                    self._drawing = True
+                    super().draw(renderer)
+                finally:
+                    self._drawing = False
+                    for artist in rasterized:
+                        artist.set_rasterized(False)
+
+    @contextlib.contextmanager
+    def _gridlines_gathered(self):
+        """Draw the gridlines by the collections within the context."""
+        gridlines = []
+        if self._grid_collection:
+            with profiling.phase('grid_collections'):
+                gridlines = self._update_grid_collections()
+        for line in gridlines:
+            line.set_visible(False)
+        try:
+            yield
+        finally:
+            for line in gridlines:
+                line.set_visible(True)
+            for axis in (self.taxis, self.laxis, self.raxis):
+                axis._ticks_to_draw = None
+
     # Interactive manipulation
 
     def can_zoom(self):
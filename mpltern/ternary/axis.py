@@ -9,6 +9,7 @@ from matplotlib.axis import XAxis
 import matplotlib.text as mtext
 import matplotlib.ticker as mticker
 from matplotlib.transforms import Affine2D
+from mpltern.ternary.profiling import profiled
 from mpltern.ternary.tick import TTick, LTick, RTick
 
 
@@ -16,6 +17,8 @@ class TernaryAxis(XAxis):
     """Ternary axis."""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Ticks already updated in the current draw of the Axes
+        self._ticks_to_draw = None
         self._init()
 
     def _init(self):
@@ -38,6 +41,12 @@ class TernaryAxis(XAxis):
         dest.label1.set_y(src.label1.get_position()[1])
         dest.label2.set_y(src.label2.get_position()[1])
 
+    def _update_ticks(self):
+        # Overridden to reuse the ticks already updated in the current draw
+        if self._ticks_to_draw is not None:
+            return self._ticks_to_draw
+        return super()._update_ticks()
+
     def _set_tick_locations(self, ticks, *, minor=False):
         locator = mticker.FixedLocator(ticks)
         if minor:
@@ -119,6 +128,7 @@ class TernaryAxis(XAxis):
         self.label_position = position
         self.stale = True
 
+    @profiled('ticks.label_position')
     def _update_label_position(self, renderer):
         """
         Update the label position based on the bounding box enclosing
@@ -180,17 +190,10 @@ class TernaryAxis(XAxis):
         """Get tick space in data coordinates
 
         This is overridden to get the proper number of ticks for ternary axes.
+        The lengths for the three axes are obtained at once from the Axes.
         """
-        trans = {
-            't': self.axes._tlabel_s_transform,
-            'l': self.axes._llabel_s_transform,
-            'r': self.axes._rlabel_s_transform,
-        }[self.axis_name]
-        vertices = self.axes._get_hexagonal_vertices()
-        points = self.axes._ternary2display_transform.transform(vertices)
-        points = trans.inverted().transform(points)
-        # length in pixel
-        length = np.linalg.norm(max(points[:, 1]) - min(points[:, 1]))
+        index = ['t', 'l', 'r'].index(self.axis_name)
+        length = self.axes._get_tick_spaces()[index]  # length in pixel
         # Having a spacing of at least 2 just looks good.
         size = self._get_tick_label_size('y') * 2
         if size > 0:
@@ -208,6 +211,7 @@ class TernaryAxis(XAxis):
 
     # Helper methods for `mpltern`
 
+    @profiled('ticks.surrounding_hexagon')
     def _get_points_surrounding_hexagon(self, renderer):
         """Get the points of all tick labels in the pixel coordinates."""
         ticks = []
@@ -427,6 +431,7 @@ def _get_points_surrounding_text(text: mtext.Text, renderer):
     return tr.inverted().transform(points) + position
 
 
+@profiled('text.layout')
 def _get_layout(text: mtext.Text, renderer):
     """Get layout of ``text``.
 
@@ -0,0 +1,206 @@
+"""
+Level-of-detail decimation of lines and markers in the display space.
+
+The data of the artists are kept as they are, and only the points that are
+distinguishable at the current resolution of the Axes are given to the
+renderer. The decimation is redone whenever the data-to-display transform
+changes, e.g., by `set_ternary_lim` or by resizing the figure.
+"""
+import weakref
+
+import numpy as np
+
+import matplotlib.collections as mcoll
+import matplotlib.lines as mlines
+import matplotlib.path as mpath
+
+
+class Decimation:
+    """Decimation of the `Line2D` and `PathCollection` in an Axes.
+
+    Parameters
+    ----------
+    pixelsize : float
+        Size of a cell in the display (pixel) coordinates. Lines keep one
+        point per cell for consecutive points, and markers keep one point per
+        occupied cell.
+    """
+    def __init__(self, pixelsize=1.0):
+        self.pixelsize = pixelsize
+        # artist -> {kind: (data, key, indices)}
+        self._indices = weakref.WeakKeyDictionary()
+
+    def wrap(self, artist):
+        """Return a proxy of *artist* drawing the decimated points.
+
+        *artist* itself is returned if it is not decimated.
+        """
+        if isinstance(artist, mlines.Line2D):
+            if _is_line_decimatable(artist, artist.axes.transData):
+                return _DecimatedArtist(artist, self)
+        elif isinstance(artist, mcoll.Collection):
+            if _is_collection_decimatable(artist, artist.axes.transData):
+                return _DecimatedArtist(artist, self)
+        return artist
+
+    def get_indices(self, artist, kind, xy):
+        """Get the indices of the points of *artist* to be drawn.
+
+        Parameters
+        ----------
+        artist : `.Line2D` or `.PathCollection`
+        kind : {'line', 'point'}
+            Whether the points are connected by a line or are markers.
+        xy : (N, 2) np.ndarray
+            Points in the display coordinates.
+        """
+        data = _get_data(artist)
+        key = artist.axes.transData.get_matrix().tobytes(), len(xy)
+        entries = self._indices.setdefault(artist, {})
+        entry = entries.get(kind)
+        if entry is not None and entry[0] is data and entry[1] == key:
+            return entry[2]
+        if kind == 'line':
+            indices = get_line_indices(xy, self.pixelsize)
+        else:
+            indices = get_point_indices(xy, self.pixelsize)
+        entries[kind] = data, key, indices
+        return indices
+
+
+class _DecimatedArtist:
+    """Proxy of an artist drawing it with a `_DecimatingRenderer`."""
+
+    def __init__(self, artist, decimation):
+        self._artist = artist
+        self._decimation = decimation
+
+    def __getattr__(self, name):
+        return getattr(self._artist, name)
+
+    def draw(self, renderer, *args, **kwargs):
+        renderer = _DecimatingRenderer(
+            renderer, self._artist, self._decimation)
+        return self._artist.draw(renderer, *args, **kwargs)
+
+
+class _DecimatingRenderer:
+    """Renderer passing the decimated paths of an artist to *renderer*.
+
+    Only the paths given to the renderer are decimated, and the data of the
+    artist are kept as they are.
+    """
+
+    def __init__(self, renderer, artist, decimation):
+        vars(self).update(
+            _renderer=renderer, _artist=artist, _decimation=decimation)
+
+    def __getattr__(self, name):
+        return getattr(self._renderer, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._renderer, name, value)
+
+    def draw_path(self, gc, path, transform, rgbFace=None):
+        if isinstance(self._artist, mlines.Line2D) and path.codes is None:
+            path = self._decimate(path, transform, 'line')
+        self._renderer.draw_path(gc, path, transform, rgbFace)
+
+    def draw_markers(self, gc, marker_path, marker_trans, path, trans,
+                     rgbFace=None):
+        if path.codes is None:
+            path = self._decimate(path, trans, 'point')
+        self._renderer.draw_markers(
+            gc, marker_path, marker_trans, path, trans, rgbFace)
+
+    def draw_path_collection(self, gc, master_transform, paths,
+                             all_transforms, offsets, offset_trans,
+                             *args, **kwargs):
+        n = len(offsets)
+        indices = self._decimation.get_indices(
+            self._artist, 'point', offset_trans.transform(offsets))
+
+        def take(values):
+            # Only the per-point properties are decimated.
+            if isinstance(values, str) or len(values) != n:
+                return values
+            if isinstance(values, np.ndarray):
+                return values[indices]
+            return [values[_] for _ in indices]
+
+        self._renderer.draw_path_collection(
+            gc, master_transform, take(paths), take(all_transforms),
+            offsets[indices], offset_trans,
+            *map(take, args), **{k: take(v) for k, v in kwargs.items()})
+
+    def _decimate(self, path, transform, kind):
+        indices = self._decimation.get_indices(
+            self._artist, kind, transform.transform(path.vertices))
+        return mpath.Path(path.vertices[indices])
+
+
+def get_line_indices(xy, pixelsize=1.0):
+    """Get the indices of the points of a line to be drawn.
+
+    A point is dropped if it is in the same cell as the previous point, and
+    therefore the deviation of the decimated line is within *pixelsize*.
+    The first and the last points and non-finite points (line breaks) are
+    always kept.
+
+    Parameters
+    ----------
+    xy : (N, 2) np.ndarray
+        Points in the display coordinates.
+    pixelsize : float
+        Size of a cell in the display coordinates.
+    """
+    n = len(xy)
+    if n < 3:
+        return np.arange(n)
+    is_finite = np.all(np.isfinite(xy), axis=1)
+    cells = np.floor(np.where(is_finite[:, None], xy, 0.0) / pixelsize)
+    is_kept = np.empty(n, dtype=bool)
+    is_kept[0] = True
+    is_kept[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    is_kept |= ~is_finite
+    is_kept[1:] |= ~is_finite[:-1]  # the first points after line breaks
+    is_kept[-1] = True
+    return np.flatnonzero(is_kept)
+
+
+def get_point_indices(xy, pixelsize=1.0):
+    """Get the indices of the markers to be drawn.
+
+    Only the last point in each occupied cell is kept, which is the one drawn
+    on the top. The order of the points is preserved.
+
+    Parameters
+    ----------
+    xy : (N, 2) np.ndarray
+        Points in the display coordinates.
+    pixelsize : float
+        Size of a cell in the display coordinates.
+    """
+    indices = np.flatnonzero(np.all(np.isfinite(xy), axis=1))
+    cells = np.floor(xy[indices] / pixelsize).astype(np.int64)
+    _, last = np.unique(cells[::-1], axis=0, return_index=True)
+    return np.sort(indices[len(indices) - 1 - last])
+
+
+def _is_line_decimatable(line, trans):
+    return (line.get_transform() == trans
+            and line.get_drawstyle() == 'default'
+            and line.get_markevery() is None)
+
+
+def _is_collection_decimatable(collection, trans):
+    return (type(collection) is mcoll.PathCollection
+            and collection.get_offset_transform() == trans
+            and len(collection.get_paths()) <= 1)
+
+
+def _get_data(artist):
+    """Get the object storing the data, to detect changes by the user."""
+    if isinstance(artist, mlines.Line2D):
+        return artist.get_data(orig=True)[0]
+    return artist.get_offsets()
@@ -0,0 +1,114 @@
+"""
+Images for the ternary plots.
+"""
+import numpy as np
+
+import matplotlib.image as mimage
+from mpltern.ternary.profiling import profiled
+
+
+class TernaryDensityImage(mimage.AxesImage):
+    """Image of points aggregated into the pixels of the Axes.
+
+    The points are given in the data coordinates, i.e., after the barycentric
+    projection. They are aggregated on the fly into a grid of the size of the
+    Axes in the display (pixel) coordinates, and therefore the aggregation is
+    redone only when the Axes is resized or the ternary limits are changed.
+
+    Parameters
+    ----------
+    ax : `TernaryAxes`
+        The Axes the image belongs to.
+    xy : (N, 2) array_like
+        Points in the data coordinates.
+    C : (N,) array_like, optional
+        Values at the points. If None, the points are counted.
+    reduce : {'count', 'sum', 'mean', 'min', 'max'}
+        How the points in a pixel are aggregated.
+    pixelsize : float
+        Size of a bin in the display (pixel) coordinates.
+    autoscale : bool
+        If True, the normalization is rescaled whenever the aggregation is
+        redone.
+    """
+    def __init__(self, ax, xy, C=None, reduce='count', pixelsize=1.0,
+                 autoscale=True, **kwargs):
+        super().__init__(ax, **kwargs)
+        # float32 is kept for the precision mode of the Axes.
+        self._xy = _as_float_array(xy)
+        self._C = None if C is None else _as_float_array(C)
+        self._reduce = reduce
+        self._pixelsize = pixelsize
+        self._autoscale = autoscale
+        self._aggregation_key = None
+
+    @profiled('pixelbin.aggregation')
+    def _aggregate(self):
+        """Aggregate the points into the pixels if the view is changed."""
+        ax = self.axes
+        nx = max(int(np.ceil(ax.bbox.width / self._pixelsize)), 1)
+        ny = max(int(np.ceil(ax.bbox.height / self._pixelsize)), 1)
+        xmin, xmax = (float(_) for _ in ax.get_xlim())
+        ymin, ymax = (float(_) for _ in ax.get_ylim())
+        key = (nx, ny, xmin, xmax, ymin, ymax)
+        if key == self._aggregation_key:
+            return
+        self._aggregation_key = key
+
+        x, y = self._xy.T
+        ix = np.floor((x - xmin) / (xmax - xmin) * nx).astype(int)
+        iy = np.floor((y - ymin) / (ymax - ymin) * ny).astype(int)
+        is_inside = (0 <= ix) & (ix < nx) & (0 <= iy) & (iy < ny)
+        indices = (iy * nx + ix)[is_inside]
+
+        accum = _reduce_by_index(
+            indices,
+            None if self._C is None else self._C[is_inside],
+            nx * ny,
+            self._reduce,
+        )
+        accum = np.ma.masked_invalid(accum.reshape(ny, nx))
+
+        self.set_data(accum)
+        self.set_extent((xmin, xmax, ymin, ymax))
+        if self._autoscale:
+            self.norm.autoscale(accum)
+
+    def draw(self, renderer, *args, **kwargs):
+        if self.get_visible():
+            self._aggregate()
+        super().draw(renderer, *args, **kwargs)
+
+    def get_window_extent(self, renderer=None):
+        # The image always covers the entire Axes.
+        return self.axes.bbox
+
+
+def _as_float_array(values):
+    values = np.asarray(values)
+    return values if values.dtype == np.float32 else values.astype(float)
+
+
+def _reduce_by_index(indices, C, n, reduce):
+    """Reduce values with the same indices.
+
+    Bins with no points give NaN.
+    """
+    counts = np.bincount(indices, minlength=n).astype(float)
+    if reduce == 'count':
+        accum = counts
+    elif reduce == 'sum':
+        accum = np.bincount(indices, weights=C, minlength=n)
+    elif reduce == 'mean':
+        accum = np.bincount(indices, weights=C, minlength=n)
+        accum /= np.where(counts > 0, counts, 1.0)
+    else:  # 'min' or 'max'
+        order = np.argsort(indices, kind='stable')
+        sorted_indices = indices[order]
+        starts = np.flatnonzero(np.diff(sorted_indices, prepend=-1))
+        ufunc = {'min': np.minimum, 'max': np.maximum}[reduce]
+        accum = np.zeros(n)
+        if len(order) > 0:
+            accum[sorted_indices[starts]] = ufunc.reduceat(C[order], starts)
+    accum[counts == 0] = np.nan
+    return accum
@@ -0,0 +1,204 @@
+"""
+Opt-in profiling of the phases of ternary plots.
+
+A `Profiler` records the wall time and the number of calls of each phase,
+e.g., parsing of the ternary data, transforms, binning, tick layout, title
+positioning, text-extent measurements, and drawing of each kind of artist.
+The phases are recorded only while a profiler is active, i.e., within
+`profile` or in an Axes with `TernaryAxes.set_profiling` enabled. The active
+profilers are kept per context, and therefore per thread. When no profiler is
+active anywhere, the instrumentation costs only a lookup of a global counter.
+
+The times of nested phases are inclusive; e.g., the time of ``draw``
+includes those of the ``ticks.*`` and ``transform.*`` phases in it.
+"""
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+
+_log = logging.getLogger(__name__)
+
+# Profilers recording in the current context, in the order of activation.
+_active = contextvars.ContextVar('_active', default=())
+
+# Number of the profilers active in any context, for the quick check.
+_nactive = 0
+_nactive_lock = threading.Lock()
+
+_null = contextlib.nullcontext()
+
+
+class Profiler:
+    """Wall time and number of calls per phase."""
+
+    def __init__(self):
+        self._records = {}
+
+    def reset(self):
+        """Clear the records."""
+        self._records.clear()
+
+    def add(self, name: str, elapsed: float):
+        """Add a call of the phase *name* that took *elapsed* seconds."""
+        record = self._records.get(name)
+        if record is None:
+            self._records[name] = [1, elapsed]
+        else:
+            record[0] += 1
+            record[1] += elapsed
+
+    def report(self):
+        """Return the records.
+
+        Returns
+        -------
+        dict
+            ``{phase: {'calls': int, 'time': float}}``, where ``time`` is the
+            total wall time in seconds. The phases are in the descending
+            order of the time.
+        """
+        items = sorted(self._records.items(), key=lambda _: -_[1][1])
+        return {
+            name: {'calls': calls, 'time': elapsed}
+            for name, (calls, elapsed) in items
+        }
+
+    def format(self):
+        """Return the records as a table in text."""
+        lines = [f'{"phase":<36s} {"calls":>8s} {"time [ms]":>12s}']
+        for name, record in self.report().items():
+            calls = record['calls']
+            elapsed = 1e3 * record['time']
+            lines.append(f'{name:<36s} {calls:>8d} {elapsed:>12.3f}')
+        return '\n'.join(lines)
+
+    def log(self, level=logging.INFO):
+        """Send the records to the logger ``mpltern.ternary.profiling``."""
+        for name, record in self.report().items():
+            _log.log(level, '%s: %d calls, %.3f ms',
+                     name, record['calls'], 1e3 * record['time'])
+
+
+@contextlib.contextmanager
+def _activate(profiler):
+    global _nactive
+    token = _active.set(_active.get() + (profiler,))
+    with _nactive_lock:
+        _nactive += 1
+    try:
+        yield profiler
+    finally:
+        _active.reset(token)
+        with _nactive_lock:
+            _nactive -= 1
+
+
+def is_active():
+    """Return whether any profiler is recording in the current context."""
+    return bool(_nactive and _active.get())
+
+
+def profile(profiler=None):
+    """Return a context manager recording the phases within it.
+
+    Parameters
+    ----------
+    profiler : `Profiler`, optional
+        Profiler to add the records to. If not given, a new one is created.
+
+    Examples
+    --------
+    >>> with profile() as profiler:
+    ...     fig.savefig('ternary.png')
+    >>> print(profiler.format())
+    """
+    if profiler is None:
+        profiler = Profiler()
+    if profiler in _active.get():
+        return contextlib.nullcontext(profiler)
+    return _activate(profiler)
+
+
+@contextlib.contextmanager
+def _phase(name, profilers):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        for _ in profilers:
+            _.add(name, elapsed)
+
+
+@contextlib.contextmanager
+def _activated_phase(name, profiler):
+    with _activate(profiler), _phase(name, _active.get()):
+        yield
+
+
+def phase(name: str, profiler=None):
+    """Return a context manager recording the phase *name*.
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase.
+    profiler : `Profiler`, optional
+        Profiler to be activated in addition during the phase, e.g., that of
+        the Axes the phase belongs to.
+    """
+    if profiler is not None and profiler not in _active.get():
+        return _activated_phase(name, profiler)
+    return _phase(name, _active.get()) if is_active() else _null
+
+
+def profiled(name: str):
+    """Decorate a function to be recorded as the phase *name*."""
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _nactive:
+                return f(*args, **kwargs)
+            with phase(name):
+                return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profiled_axes_method(name: str):
+    """Decorate a method of the Axes to be recorded as the phase *name*.
+
+    The profiler of the Axes is activated during the call if set.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(ax, *args, **kwargs):
+            with phase(name, ax._profiler):
+                return f(ax, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _ProfiledArtist:
+    """Proxy of an artist recording its draws as ``draw.<class name>``."""
+
+    def __init__(self, artist, name):
+        self._artist = artist
+        self._name = name
+
+    def __getattr__(self, name):
+        return getattr(self._artist, name)
+
+    # Equal to the artist, e.g., to be removed from the list in `Axes.draw`
+    def __eq__(self, other):
+        return self._artist == other
+
+    def __hash__(self):
+        return hash(self._artist)
+
+    def draw(self, renderer, *args, **kwargs):
+        with phase(self._name):
+            return self._artist.draw(renderer, *args, **kwargs)
@@ -0,0 +1,393 @@
+"""
+Streamlines of a vector field on the ternary simplex.
+
+The streamlines are integrated in barycentric coordinates, with the RK4 steps
+of all the seeds performed at once. The seeds and the spacing of the
+streamlines are controlled by an occupancy mask on the triangular lattice of
+`tribin`, similarly to `matplotlib.streamplot`.
+"""
+import numpy as np
+
+import matplotlib as mpl
+import matplotlib.collections as mcoll
+import matplotlib.patches as mpatches
+import matplotlib.tri as mtri
+from matplotlib import _api
+from matplotlib.streamplot import StreamplotSet
+
+from mpltern import tribin_helpers
+
+
+def streamplot(axes, *args, density=1, linewidth=None, color=None, cmap=None,
+               norm=None, arrowsize=1, arrowstyle='-|>', minlength=0.1,
+               start_points=None, maxlength=4.0,
+               integration_direction='both', zorder=None, transform=None):
+    """
+    Draw streamlines of a vector field on the ternary simplex.
+
+    Call signatures::
+
+        streamplot(t, l, r, dt, dl, dr, ...)
+        streamplot(func, ...)
+
+    Parameters
+    ----------
+    t, l, r : 1D array-like
+        Points where the vector field is given, e.g., the nodes of
+        `mpltern.datasets.get_triangular_grid`. The field is linearly
+        interpolated on the Delaunay triangulation of the points.
+    dt, dl, dr : 1D array-like
+        Vector field at the points. The component normal to the simplex,
+        i.e., along ``(1, 1, 1)``, is ignored.
+    func : callable
+        Function ``func(t, l, r) -> (dt, dl, dr)`` giving the vector field.
+        It is called with arrays of ternary coordinates summing to
+        *ternary_sum*.
+    density : float
+        Closeness of the streamlines. With the default of 1, the triangle is
+        divided into a lattice of 30 triangular bins along each edge, and
+        each bin has at most one streamline passing through it.
+    linewidth : float or 1D array-like, optional
+        Width of the streamlines. An array must be given at the points
+        *t*, *l*, *r* like the field.
+    color : color or 1D array-like, optional
+        Color of the streamlines. An array must be given at the points
+        *t*, *l*, *r* like the field and is mapped to colors by *cmap* and
+        *norm*.
+    cmap, norm
+        Colormap and normalization for *color* given as an array.
+    arrowsize : float
+        Scaling factor for the arrow size.
+    arrowstyle : str
+        Arrow style specification. See `~matplotlib.patches.FancyArrowPatch`.
+    minlength : float
+        Minimum length of the streamlines in the unit where the edges of the
+        triangle are 1.
+    start_points : (N, 3) array-like, optional
+        Ternary coordinates of the starting points of the streamlines.
+        By default, all the bins of the lattice are seeded.
+    maxlength : float
+        Maximum length of the streamlines in the unit where the edges of the
+        triangle are 1.
+    integration_direction : {'forward', 'backward', 'both'}, default: 'both'
+        Integrate the streamlines in the forward, backward, or both
+        directions.
+    zorder : float
+        The zorder of the streamlines and arrows.
+    transform : `~matplotlib.transforms.Transform`, optional
+        Ternary transform of the data. If ``ax.transTernaryAxes``, the points,
+        the field, and *start_points* are in the ternary axes coordinates
+        summing to 1. By default, they are in the data coordinates.
+
+    Returns
+    -------
+    StreamplotSet
+        Container object with attributes
+
+        - ``lines``: `.LineCollection` of streamlines
+        - ``arrows``: `.PatchCollection` containing `.FancyArrowPatch`
+          objects representing the arrows half-way along streamlines.
+    """
+    _api.check_in_list(['both', 'forward', 'backward'],
+                       integration_direction=integration_direction)
+    if transform is None:
+        ternary_sum = axes.ternary_sum
+        projection = axes.transProjection
+        transform = axes.transData
+    elif transform == axes.transTernaryAxes:
+        ternary_sum = 1.0
+        projection = axes.transAxesProjection
+        transform = axes.transOuterAxes
+    else:
+        raise ValueError(
+            "'transform' must be 'transTernaryAxes' or a 2D transform")
+
+    if len(args) == 1 and callable(args[0]):
+        field = _get_callable_field(args[0], ternary_sum)
+        interpolator = None
+    elif len(args) == 6:
+        t, l, r, dt, dl, dr = (
+            np.asarray(_, dtype=float).ravel() for _ in args)
+        s = t + l + r
+        interpolator = _TernaryInterpolator(t / s, l / s, r / s)
+        field = interpolator.get_field(dt, dl, dr)
+        field = _get_scaled_field(field, 1.0 / ternary_sum)
+    else:
+        raise TypeError(
+            "streamplot() takes either 6 positional arguments "
+            "(t, l, r, dt, dl, dr) or 1 callable")
+
+    # scalars interpolated along the streamlines
+    values = {}
+    for key, value in (('color', color), ('linewidth', linewidth)):
+        if isinstance(value, np.ndarray) or (
+                key == 'linewidth' and np.ndim(value) == 1):
+            if interpolator is None:
+                raise ValueError(
+                    f"{key!r} cannot be an array for a callable field")
+            values[key] = interpolator.get_scalar(value)
+
+    if zorder is None:
+        zorder = mcoll.LineCollection.zorder
+    line_kw = {'zorder': zorder}
+    arrow_kw = dict(arrowstyle=arrowstyle, mutation_scale=10 * arrowsize,
+                    zorder=zorder)
+    if 'color' not in values:
+        if color is None:
+            color = axes._get_lines.get_next_color()
+        line_kw['color'] = arrow_kw['color'] = color
+    if 'linewidth' not in values:
+        if linewidth is None:
+            linewidth = mpl.rcParams['lines.linewidth']
+        line_kw['linewidth'] = arrow_kw['linewidth'] = linewidth
+
+    gridsize = max(int(30 * density), 1)
+    if start_points is None:
+        seeds = _get_bin_centroids(gridsize)
+    else:
+        seeds = np.asarray(start_points, dtype=float).reshape(-1, 3)
+        seeds = seeds / np.sum(seeds, axis=1)[:, None]
+
+    signs = {'both': (-1.0, 1.0), 'forward': (1.0,), 'backward': (-1.0,)}
+    signs = signs[integration_direction]
+    step = 0.2 / gridsize
+    nsteps = int(np.ceil(maxlength / len(signs) / step))
+    halves = [_integrate(field, seeds, sign * step, nsteps) for sign in signs]
+    streamlines = _select_streamlines(halves, signs, gridsize, minlength)
+
+    segments = []
+    scalars = {key: [] for key in values}
+    for streamline in streamlines:
+        xy = projection.transform(streamline * ternary_sum)
+        if values:
+            # Create multiple tiny segments for varying width or color.
+            segments.extend(np.stack((xy[:-1], xy[1:]), axis=1))
+            midpoints = 0.5 * (streamline[:-1] + streamline[1:])
+            for key, value in values.items():
+                scalars[key].append(value(midpoints))
+        else:
+            segments.append(xy)
+    scalars = {
+        key: np.concatenate(value) if value else np.empty(0)
+        for key, value in scalars.items()}
+
+    if 'linewidth' in scalars:
+        line_kw['linewidth'] = scalars['linewidth']
+    if scalars:
+        # Round caps hide the seams between the tiny segments.
+        line_kw['capstyle'] = 'round'
+    lc = mcoll.LineCollection(segments, transform=transform, **line_kw)
+    if 'color' in scalars:
+        lc.set_array(scalars['color'])
+        lc.set_cmap(cmap)
+        if norm is None:
+            vmin, vmax = np.nanmin(color), np.nanmax(color)
+            lc.set_clim(vmin, vmax)
+        else:
+            lc.set_norm(norm)
+    axes.add_collection(lc, autolim=False)
+
+    # Add arrows half-way along the streamlines.
+    arrows = []
+    offset = 0
+    for streamline in streamlines:
+        xy = projection.transform(streamline * ternary_sum)
+        s = np.cumsum(np.hypot(*np.diff(xy, axis=0).T))
+        i = min(np.searchsorted(s, 0.5 * s[-1]), len(xy) - 2)
+        if 'color' in scalars:
+            arrow_kw['color'] = lc.to_rgba(scalars['color'][offset + i])
+        if 'linewidth' in scalars:
+            arrow_kw['linewidth'] = scalars['linewidth'][offset + i]
+        offset += len(xy) - 1
+        arrows.append(mpatches.FancyArrowPatch(
+            xy[i], 0.5 * (xy[i] + xy[i + 1]),
+            transform=transform, **arrow_kw))
+
+    ac = mcoll.PatchCollection(arrows)
+    # Adding the collection itself is broken in Matplotlib; see #2341.
+    for p in arrows:
+        axes.add_patch(p)
+
+    return StreamplotSet(lc, ac)
+
+
+class _TernaryInterpolator:
+    """Linear interpolator of values at points on the simplex.
+
+    The triangle enclosing each point is found only once for all the
+    components of the values.
+    """
+    def __init__(self, t, l, r):
+        # Triangulated on the Cartesian coordinates of the regular triangle.
+        x, y = _to_xy(t, l, r)
+        self._triangulation = mtri.Triangulation(x, y)
+        self._trifinder = self._triangulation.get_trifinder()
+        triangles = self._triangulation.get_masked_triangles()
+        self._triangles = triangles
+        # matrices mapping (x, y, 1) to the barycentric weights
+        a = np.stack((x[triangles], y[triangles], np.ones(triangles.shape)),
+                     axis=1)
+        self._inverses = np.linalg.inv(a)
+
+    def interpolate(self, tlr, values):
+        """Interpolate values at the points, giving NaN outside."""
+        x, y = _to_xy(*tlr.T)
+        i = self._trifinder(x, y)
+        is_inside = i >= 0
+        result = np.full((len(x), values.shape[1]), np.nan)
+        i = i[is_inside]
+        p = np.column_stack((x[is_inside], y[is_inside], np.ones(len(i))))
+        weights = np.einsum('nij,nj->ni', self._inverses[i], p)
+        result[is_inside] = np.einsum(
+            'ni,nik->nk', weights, values[self._triangles[i]])
+        return result
+
+    def get_scalar(self, value):
+        value = np.asarray(value, dtype=float).reshape(-1, 1)
+        if len(value) != len(self._triangulation.x):
+            raise ValueError("Values must have the same length as 't'")
+
+        def scalar(tlr):
+            return self.interpolate(tlr, value)[:, 0]
+
+        return scalar
+
+    def get_field(self, dt, dl, dr):
+        values = np.column_stack((dt, dl, dr))
+
+        def field(tlr):
+            return self.interpolate(tlr, values)
+
+        return field
+
+
+def _to_xy(t, l, r):
+    """Cartesian coordinates in the regular triangle with unit edges."""
+    return r + 0.5 * t, 0.5 * np.sqrt(3.0) * t
+
+
+def _get_callable_field(func, ternary_sum):
+    def field(tlr):
+        d = np.column_stack(func(*(tlr * ternary_sum).T))
+        return d.astype(float) / ternary_sum
+
+    return field
+
+
+def _get_scaled_field(field, scale):
+    def scaled(tlr):
+        return field(tlr) * scale
+
+    return scaled
+
+
+def _get_bin_centroids(gridsize):
+    """Centroids of the bins of `tribin` in normalized ternary coordinates."""
+    n = gridsize ** 2
+    nup = gridsize * (gridsize + 1) // 2
+    it, il, ir = tribin_helpers.serial_to_ternary(gridsize, np.arange(n))
+    centroids = np.column_stack((it, il, ir)).astype(float)
+    centroids[:nup] += 1.0 / 3.0
+    centroids[nup:] += 2.0 / 3.0
+    return centroids / gridsize
+
+
+def _get_lengths(d):
+    """Lengths of displacements on the simplex for unit edges."""
+    d = d - np.mean(d, axis=-1)[..., None]
+    return np.sqrt(0.5 * np.sum(d ** 2, axis=-1))
+
+
+def _integrate(field, seeds, h, nsteps):
+    """Integrate streamlines from all the seeds at once.
+
+    The field is normalized to the unit speed, and the RK4 steps are repeated
+    until the streamlines leave the triangle, reach a stagnation point, or
+    reach *nsteps*.
+
+    Returns
+    -------
+    (nsteps + 1, N, 3) np.ndarray
+        Points of the streamlines, which are NaN after the termination.
+    """
+    def velocity(p):
+        d = field(p)
+        d = d - np.mean(d, axis=1)[:, None]  # tangent to the simplex
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return d / _get_lengths(d)[:, None]
+
+    points = np.full((nsteps + 1, *seeds.shape), np.nan)
+    points[0] = seeds
+    p = seeds
+    indices = np.flatnonzero(np.all(seeds >= 0.0, axis=1))
+    p = p[indices]
+    previous = None
+    for k in range(nsteps):
+        k1 = velocity(p)
+        k2 = velocity(p + 0.5 * h * k1)
+        k3 = velocity(p + 0.5 * h * k2)
+        k4 = velocity(p + h * k3)
+        new = p + h / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+        is_valid = np.all(np.isfinite(new) & (new >= 0.0), axis=1)
+        if previous is not None:
+            # The direction reverses around stagnation points.
+            is_valid &= np.sum(k1 * previous, axis=1) > 0.0
+        indices = indices[is_valid]
+        p = new[is_valid]
+        previous = k1[is_valid]
+        if len(indices) == 0:
+            break
+        points[k + 1, indices] = p
+    return points
+
+
+def _select_streamlines(halves, signs, gridsize, minlength):
+    """Select streamlines so that each bin is passed by one streamline.
+
+    The streamlines are truncated when they enter a bin already occupied by
+    the previous streamlines, and those starting in such bins are dropped.
+    The returned streamlines run along the flow, i.e., the halves integrated
+    backward are reversed.
+    """
+    g = gridsize
+    extent = (0.0, 1.0, 0.0, 1.0, 0.0, 1.0)
+    bins = []
+    for half in halves:
+        points = half.reshape(-1, 3)
+        is_finite = np.all(np.isfinite(points), axis=1)
+        _, _, _, it, il, ir = tribin_helpers.calc_ternary_indices(
+            *np.where(is_finite[:, None], points, 0.0).T, g, extent)
+        i = tribin_helpers.ternary_to_serial(g, it, il, ir)
+        # Points on the lattice nodes are not assigned to any bin.
+        s = it + il + ir
+        i[~is_finite | (s < g - 2) | (s > g - 1)] = -1
+        bins.append(i.reshape(half.shape[:2]))
+
+    is_occupied = np.zeros(g ** 2 + 1, dtype=bool)  # the last one for -1
+    streamlines = []
+    for j in range(halves[0].shape[1]):
+        if is_occupied[bins[0][0, j]]:
+            continue
+        parts = []
+        for half, b in zip(halves, bins):
+            n = np.count_nonzero(np.all(np.isfinite(half[:, j]), axis=1))
+            stops = np.flatnonzero(is_occupied[b[1:n, j]])
+            if len(stops):
+                n = stops[0] + 1
+            parts.append((half[:n, j], b[:n, j]))
+        if len(parts) == 2:  # backward and forward
+            (p0, b0), (p1, b1) = parts
+            line = np.concatenate((p0[::-1], p1[1:]))
+            line_bins = np.concatenate((b0, b1))
+        elif signs[0] < 0.0:  # backward only
+            line, line_bins = parts[0][0][::-1], parts[0][1][::-1]
+        else:
+            line, line_bins = parts[0]
+        if len(line) < 2:
+            continue
+        if np.sum(_get_lengths(np.diff(line, axis=0))) < minlength:
+            continue
+        is_occupied[line_bins] = True
+        is_occupied[-1] = False
+        streamlines.append(line)
+    return streamlines
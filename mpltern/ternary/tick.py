@@ -1,11 +1,14 @@
 """
 Classes for the ternary ticks.
 """
+import functools
+
 import numpy as np
 
 from matplotlib import _api
 import matplotlib.transforms as mtransforms
 from matplotlib.axis import XTick
+from mpltern.ternary.profiling import profiled
 
 
 class TernaryTick(XTick):
@@ -60,100 +63,19 @@ class TernaryTick(XTick):
     def _determine_anchor(self, mode, axis_angle, tick_angle):
         """Determine tick-label alignments.
 
-        from the spine and the tick angles.
-
-        Parameters
-        ----------
-        mode : {'tick', 'axis', 'horizontal'}
-        axis_angle : float
-            Spine angle in degree.
-        tick_angle : float
-            Tick angle for `direction="in"` in degree.
-
-        Returns
-        -------
-        ha : str
-            Horizontal alignment.
-        va : str
-            Vertical alignment.
-        rotation : float
+        See `_determine_anchor` at the module level, where the results are
+        cached because they depend only on the angles.
         """
-        tick_angle = (tick_angle + 180.0) % 360.0 - 180.0  # [-180, 180]
-        axis_angle = (axis_angle + 180.0) % 360.0 - 180.0  # [-180, 180]
-        tol = 1e-6
-        if mode == 'axis':
-            is_tick1 = (tick_angle - axis_angle) % 360.0 - 180.0 < 0.0
-            if abs(abs(axis_angle) - 90.0) < tol:
-                va = 'baseline'
-                rotation = 90.0 if is_tick1 ^ (axis_angle > 0.0) else 270.0
-            elif abs(axis_angle) < 90.0:
-                va = 'top' if is_tick1 else 'baseline'
-                rotation = axis_angle
-            else:
-                va = 'baseline' if is_tick1 else 'top'
-                rotation = axis_angle + 180.0
-            ha = 'center'
-            return ha, va, rotation
-
-        elif mode == 'horizontal':
-            # Correct when the triangle is counterclockwise
-            is_tick1 = (tick_angle - axis_angle) % 360.0 - 180.0 < 0.0
-            is_baseline = (-150.0 + tol < tick_angle < -30.0 - tol)
-
-            # The following part is tuned for regular triangles.
-            if is_tick1:
-                if axis_angle < -135.0 + tol:
-                    ha = 'center'
-                    va = 'bottom'
-                elif axis_angle < -15.0 - tol:
-                    ha = 'right'
-                    va = 'baseline' if is_baseline else 'center_baseline'
-                elif axis_angle < 45.0 + tol:
-                    ha = 'center'
-                    va = 'top'
-                elif axis_angle < 165.0 - tol:
-                    ha = 'left'
-                    va = 'baseline' if is_baseline else 'center_baseline'
-                else:
-                    ha = 'center'
-                    va = 'bottom'
-            else:
-                if axis_angle < -165.0 + tol:
-                    ha = 'center'
-                    va = 'top'
-                elif axis_angle < -45.0 - tol:
-                    ha = 'left'
-                    va = 'baseline' if is_baseline else 'center_baseline'
-                elif axis_angle < 15.0 + tol:
-                    ha = 'center'
-                    va = 'bottom'
-                elif axis_angle < 135.0 - tol:
-                    ha = 'right'
-                    va = 'baseline' if is_baseline else 'center_baseline'
-                else:
-                    ha = 'center'
-                    va = 'top'
-            return ha, va, 0.0
-
-        else:  # mode == 'tick'
-            va = 'center_baseline'
-            if abs(abs(tick_angle) - 90.0) < tol:
-                ha = 'right' if abs(axis_angle) < 0.0 else 'left'
-            elif abs(tick_angle) < 90.0:
-                ha = 'right'
-            else:
-                ha = 'left'
-            rotation = tick_angle if ha == 'right' else tick_angle + 180.0
-            return ha, va, rotation
+        return _determine_anchor(mode, axis_angle, tick_angle)
 
+    @profiled('ticks.update_position')
     def update_position(self, loc):
         # Implementation in `ThetaTick` and `RadialTick` in Matplotlib may be
         # helpful to understand what is done here.
         super().update_position(loc)
-        tick1_angle = self.get_tick_angle()  # in degree
+        # in degree
+        tick1_angle, axis1_angle, axis2_angle = self._get_angles()
         tick2_angle = tick1_angle + 180.0
-        axis1_angle = self.get_axis1_angle()  # in degree
-        axis2_angle = self.get_axis2_angle()  # in degree
         self._tilt_marker(self.tick1line, np.deg2rad(tick1_angle) - np.pi / 2)
         self._tilt_marker(self.tick2line, np.deg2rad(tick1_angle) + np.pi / 2)
 
@@ -181,6 +103,32 @@ class TernaryTick(XTick):
 
     # Helper methods for `mpltern`
 
+    def _get_angles(self):
+        """Get the tick angle and the two axis angles in degree.
+
+        The angles depend only on the triangle in the display coordinates and
+        are therefore shared by all the ticks of the axis. They are cached in
+        the Axes and recomputed only when the triangle is changed.
+        """
+        axes = self.axes
+        key = (
+            axes.transAxes.get_matrix().tobytes(),
+            axes.corners_axes.tobytes(),
+        )
+        cache = axes._tick_angles_cache
+        if self.tick_name not in cache or cache[self.tick_name][0] != key:
+            indices = {
+                'ttick': [2, 1, 2, 0, 1, 0],
+                'ltick': [0, 2, 0, 1, 2, 1],
+                'rtick': [1, 0, 1, 2, 0, 2],
+            }[self.tick_name]
+            corners = [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]]
+            points = axes.transTernaryAxes.transform(corners)[indices]
+            directions = points[1::2] - points[0::2]
+            angles = np.rad2deg(np.arctan2(directions[:, 1], directions[:, 0]))
+            cache[self.tick_name] = key, tuple(float(_) for _ in angles)
+        return cache[self.tick_name][1]
+
     def get_tick_angle(self):
         # The angle here is for `direction='in'`
         name = self.tick_name
@@ -232,3 +180,94 @@ class LTick(TernaryTick):
 class RTick(TernaryTick):
     """R tick"""
     tick_name = 'rtick'
+
+
+@functools.lru_cache(maxsize=256)
+def _determine_anchor(mode, axis_angle, tick_angle):
+    """Determine tick-label alignments.
+
+    from the spine and the tick angles.
+
+    Parameters
+    ----------
+    mode : {'tick', 'axis', 'horizontal'}
+    axis_angle : float
+        Spine angle in degree.
+    tick_angle : float
+        Tick angle for `direction="in"` in degree.
+
+    Returns
+    -------
+    ha : str
+        Horizontal alignment.
+    va : str
+        Vertical alignment.
+    rotation : float
+    """
+    tick_angle = (tick_angle + 180.0) % 360.0 - 180.0  # [-180, 180]
+    axis_angle = (axis_angle + 180.0) % 360.0 - 180.0  # [-180, 180]
+    tol = 1e-6
+    if mode == 'axis':
+        is_tick1 = (tick_angle - axis_angle) % 360.0 - 180.0 < 0.0
+        if abs(abs(axis_angle) - 90.0) < tol:
+            va = 'baseline'
+            rotation = 90.0 if is_tick1 ^ (axis_angle > 0.0) else 270.0
+        elif abs(axis_angle) < 90.0:
+            va = 'top' if is_tick1 else 'baseline'
+            rotation = axis_angle
+        else:
+            va = 'baseline' if is_tick1 else 'top'
+            rotation = axis_angle + 180.0
+        ha = 'center'
+        return ha, va, rotation
+
+    elif mode == 'horizontal':
+        # Correct when the triangle is counterclockwise
+        is_tick1 = (tick_angle - axis_angle) % 360.0 - 180.0 < 0.0
+        is_baseline = (-150.0 + tol < tick_angle < -30.0 - tol)
+
+        # The following part is tuned for regular triangles.
+        if is_tick1:
+            if axis_angle < -135.0 + tol:
+                ha = 'center'
+                va = 'bottom'
+            elif axis_angle < -15.0 - tol:
+                ha = 'right'
+                va = 'baseline' if is_baseline else 'center_baseline'
+            elif axis_angle < 45.0 + tol:
+                ha = 'center'
+                va = 'top'
+            elif axis_angle < 165.0 - tol:
+                ha = 'left'
+                va = 'baseline' if is_baseline else 'center_baseline'
+            else:
+                ha = 'center'
+                va = 'bottom'
+        else:
+            if axis_angle < -165.0 + tol:
+                ha = 'center'
+                va = 'top'
+            elif axis_angle < -45.0 - tol:
+                ha = 'left'
+                va = 'baseline' if is_baseline else 'center_baseline'
+            elif axis_angle < 15.0 + tol:
+                ha = 'center'
+                va = 'bottom'
+            elif axis_angle < 135.0 - tol:
+                ha = 'right'
+                va = 'baseline' if is_baseline else 'center_baseline'
+            else:
+                ha = 'center'
+                va = 'top'
+        return ha, va, 0.0
+
+    else:  # mode == 'tick'
+        va = 'center_baseline'
+        if abs(abs(tick_angle) - 90.0) < tol:
+            ha = 'right' if abs(axis_angle) < 0.0 else 'left'
+        elif abs(tick_angle) < 90.0:
+            ha = 'right'
+        else:
+            ha = 'left'
+        rotation = tick_angle if ha == 'right' else tick_angle + 180.0
+        return ha, va, rotation
@@ -9,6 +9,14 @@ values are forced to be the same as ``input_dims``.
 import numpy as np
 
 from matplotlib.transforms import Affine2DBase, Transform
+from mpltern.ternary.profiling import profiled
+
+
+def _cast(array, values, dtype):
+    """Cast *array* to float32 if both *values* and *dtype* are float32."""
+    if dtype == np.float32 and values.dtype == np.float32:
+        return np.asarray(array, np.float32)
+    return array
 
 
 class TernaryLinearTransform(Transform):
@@ -22,14 +30,19 @@ class TernaryLinearTransform(Transform):
     ternary_sum : float
         Value by which ternary coordinates are divided to be suitable for the
         input to BarycentricTransform.
+    dtype : dtype, default: float64
+        Precision of the results for float32 input; float32 input is kept in
+        float32 only if this is float32.
     """
     input_dims = output_dims = 3
     has_inverse = True
 
-    def __init__(self, ternary_sum: float, *args, **kwargs):
+    def __init__(self, ternary_sum: float, *args, dtype=np.float64, **kwargs):
         super().__init__(*args, **kwargs)
         self.ternary_sum = ternary_sum
+        self.dtype = np.dtype(dtype)
 
+    @profiled('transform.TernaryLinearTransform')
     def transform_non_affine(self, values):
         """Transform ternary coordinates.
 
@@ -43,10 +56,11 @@ class TernaryLinearTransform(Transform):
         (N, 3) np.ndarray
             Ternary coordinates after division.
         """
-        return values / self.ternary_sum
+        return values / _cast(self.ternary_sum, values, self.dtype)
 
     def inverted(self):
-        return TernaryLinearTransform(1.0 / self.ternary_sum)
+        return TernaryLinearTransform(
+            1.0 / self.ternary_sum, dtype=self.dtype)
 
 
 class TernaryAxisTransform(Transform):
@@ -68,6 +82,7 @@ class TernaryAxisTransform(Transform):
         self.corners = np.asarray(corners, float)
         self.index = index
 
+    @profiled('transform.TernaryAxisTransform')
     def transform_non_affine(self, values):
         """Transform ternary-axis to Cartesian coordinates
 
@@ -112,6 +127,7 @@ class InvertedTernaryAxisTransform(Transform):
         self.corners = np.asarray(corners, float)
         self.index = index
 
+    @profiled('transform.InvertedTernaryAxisTransform')
     def transform_non_affine(self, values):
         corner0 = self.corners[(self.index + 0) % 3]
         corner1 = self.corners[(self.index + 1) % 3]
@@ -139,6 +155,7 @@ class TernaryTickLabelShift(Affine2DBase):
         self.pad_points = pad_points
         self.indices = indices
 
+    @profiled('transform.TernaryTickLabelShift')
     def get_matrix(self):
         figure = self.axes.figure
         corners = [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]]
@@ -166,6 +183,7 @@ class TernaryAxisLabelSTransform(Affine2DBase):
         self.trans = trans
         self.h2t = h2t
 
+    @profiled('transform.TernaryAxisLabelSTransform')
     def get_matrix(self):
         """Transform axis-label to Cartesian (likely `display`) coordinates
 
@@ -217,6 +235,7 @@ class TernaryAxisLabelCTransform(Affine2DBase):
         self.trans = trans
         self.h2t = h2t
 
+    @profiled('transform.TernaryAxisLabelCTransform')
     def get_matrix(self):
         """Transform axis-label to Cartesian (likely `display`) coordinates
 
@@ -266,15 +285,20 @@ class BarycentricTransform(Transform):
         Corners of the triangle in Cartesian coordinates.
         If `corners` are in the `Axes` coordinates, this can be the transform
         for the `Axes` coordinates.
+    dtype : dtype, default: float64
+        Precision of the results for float32 input; float32 input is kept in
+        float32 only if this is float32.
     """
     input_dims = 3
     output_dims = 2
     has_inverse = True
 
-    def __init__(self, corners, *args, **kwargs):
+    def __init__(self, corners, *args, dtype=np.float64, **kwargs):
         super().__init__(*args, **kwargs)
         self.corners = np.asarray(corners, float)
+        self.dtype = np.dtype(dtype)
 
+    @profiled('transform.BarycentricTransform')
     def transform_non_affine(self, values):
         """Transform barycentric to Cartesian coordinates
 
@@ -287,10 +311,11 @@ class BarycentricTransform(Transform):
         -------
         (x, y) : Cartesian coordinates
         """
-        return (values / np.sum(values, axis=1)[:, None]) @ self.corners
+        corners = _cast(self.corners, values, self.dtype)
+        return (values / np.sum(values, axis=1)[:, None]) @ corners
 
     def inverted(self):
-        return InvertedBarycentricTransform(self.corners)
+        return InvertedBarycentricTransform(self.corners, dtype=self.dtype)
 
 
 class InvertedBarycentricTransform(Transform):
@@ -298,17 +323,19 @@ class InvertedBarycentricTransform(Transform):
     output_dims = 3
     has_inverse = True
 
-    def __init__(self, corners, *args, **kwargs):
+    def __init__(self, corners, *args, dtype=np.float64, **kwargs):
         super().__init__(*args, **kwargs)
         self.corners = np.asarray(corners, float)
+        self.dtype = np.dtype(dtype)
 
+    @profiled('transform.InvertedBarycentricTransform')
     def transform_non_affine(self, values):
-        xys = np.column_stack((values, np.ones(values.shape[0])))
+        xys = np.column_stack((values, np.ones(values.shape[0], values.dtype)))
         v = np.column_stack((self.corners, np.ones(3)))
-        return np.dot(xys, np.linalg.inv(v))
+        return np.dot(xys, _cast(np.linalg.inv(v), values, self.dtype))
 
     def inverted(self):
-        return BarycentricTransform(self.corners)
+        return BarycentricTransform(self.corners, dtype=self.dtype)
 
 
 class H2THeightTransform(Transform):
@@ -324,6 +351,7 @@ class H2THeightTransform(Transform):
         self.viewTernaryLims = viewTernaryLims
         self.index = index
 
+    @profiled('transform.H2THeightTransform')
     def transform_non_affine(self, values):
         """Transform scaled hexagonal-axis to ternary-axis coordinates
 
@@ -373,6 +401,7 @@ class T2HHeightTransform(Transform):
         self.viewTernaryLims = viewTernaryLims
         self.index = index
 
+    @profiled('transform.T2HHeightTransform')
     def transform_non_affine(self, values):
         """Transform scaled hexagonal-axis to ternary-axis coordinates
 
@@ -422,6 +451,7 @@ class T2HWidthTransform(Transform):
         self.viewTernaryLims = viewTernaryLims
         self.index = index
 
+    @profiled('transform.T2HWidthTransform')
     def transform_non_affine(self, values):
         """Transform ternary-axis to scaled hexagonal-axis coordinates
 
@@ -479,6 +509,7 @@ class H2TWidthTransform(Transform):
         self.viewTernaryLims = viewTernaryLims
         self.index = index
 
+    @profiled('transform.H2TWidthTransform')
     def transform_non_affine(self, values):
         """Transform scaled hexagonal-axis to ternary-axis coordinates
 
@@ -3,7 +3,8 @@ from typing import Sequence
 
 
 def calc_ternary_indices(t, l, r, gridsize: int, extent: Sequence[float]):
-    tmin, tmax, lmin, lmax, rmin, rmax = extent
+    # Python floats keep float32 for float32 `t`, `l`, `r`.
+    tmin, tmax, lmin, lmax, rmin, rmax = (float(_) for _ in extent)
 
     # side lengths along ternary axes
     st = (tmax - tmin) / gridsize
@@ -1,6 +1,7 @@
 import numpy as np
 
 import pytest
+import matplotlib.pyplot as plt
 from matplotlib.transforms import Affine2D
 from mpltern.ternary.axis import TernaryAxis
 from mpltern.ternary.transforms import BarycentricTransform
@@ -475,6 +476,28 @@ def test_get_label_position(mode, label_position, rotation, label_rotation_ref,
             ha == ha_ref and va == va_ref)
 
 
+@pytest.mark.parametrize("corners, rotation", [
+    (None, None),
+    (None, 45.0),
+    (((0.0, 0.0), (1.0, 0.0), (0.2, 0.9)), None),
+])
+def test_tick_spaces(corners, rotation):
+    """Test if the tick spaces for the three axes are computed correctly."""
+    fig = plt.figure()
+    ax = fig.add_subplot(
+        projection="ternary", corners=corners, rotation=rotation)
+    ax.set_ternary_lim(0.1, 0.8, 0.0, 0.7, 0.05, 0.6)
+    fig.canvas.draw()
+
+    vertices = ax._get_hexagonal_vertices()
+    points = ax._ternary2display_transform.transform(vertices)
+    transforms = [
+        ax._tlabel_s_transform, ax._llabel_s_transform, ax._rlabel_s_transform]
+    for trans, length in zip(transforms, ax._get_tick_spaces()):
+        p = trans.inverted().transform(points)
+        np.testing.assert_allclose(length, max(p[:, 1]) - min(p[:, 1]))
+
+
 def _create_references():
     for mode in ['axis', 'bottom']:
         for position in ['corner', 'tick1', 'tick2']:
@@ -0,0 +1,113 @@
+import json
+
+import numpy as np
+
+import pytest
+import matplotlib.image as mimage
+import matplotlib.pyplot as plt
+
+from mpltern.__main__ import main
+from mpltern.batch import (
+    create_frame, find_datasets, load_dataset, plot_dataset, render_batch)
+
+
+def _get_values(size=100):
+    np.random.seed(19680801)
+    tlr = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size)
+    return np.column_stack((tlr, tlr[:, 0]))
+
+
+def _write_datasets(path):
+    values = _get_values()
+    np.savetxt(path / 'a.csv', values, delimiter=',', header='t,l,r,C',
+               comments='')
+    np.save(path / 'b.npy', values[:, :3])
+    np.savez(path / 'c.npz', t=values[:, 0], l=values[:, 1], r=values[:, 2],
+             C=values[:, 3])
+    return values
+
+
+def test_load_dataset(tmp_path):
+    values = _write_datasets(tmp_path)
+    for name in ['a.csv', 'c.npz']:
+        t, l, r, C = load_dataset(tmp_path / name)
+        np.testing.assert_allclose(np.column_stack((t, l, r, C)), values)
+    t, l, r, C = load_dataset(tmp_path / 'b.npy')
+    np.testing.assert_allclose(np.column_stack((t, l, r)), values[:, :3])
+    assert C is None
+
+    np.save(tmp_path / 'd.npy', values[:, :2])
+    with pytest.raises(ValueError):
+        load_dataset(tmp_path / 'd.npy')
+    with pytest.raises(ValueError):
+        load_dataset(tmp_path / 'e.txt')
+
+
+def test_find_datasets(tmp_path):
+    _write_datasets(tmp_path)
+    (tmp_path / 'notes.txt').write_text('')
+    assert [_.name for _ in find_datasets(tmp_path)] == [
+        'a.csv', 'b.npy', 'c.npz']
+
+    manifest = tmp_path / 'manifest.txt'
+    manifest.write_text('# datasets\nc.npz\n\na.csv\n')
+    assert find_datasets(manifest) == [tmp_path / 'c.npz', tmp_path / 'a.csv']
+    assert find_datasets([tmp_path / 'b.npy', manifest])[0].name == 'b.npy'
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_render_batch(tmp_path, jobs):
+    _write_datasets(tmp_path)
+    spec = {'method': 'scatter', 'tlabel': 'Top', 'grid': True}
+    calls = []
+    stats = render_batch(
+        tmp_path, tmp_path / 'out', spec, jobs=jobs,
+        callback=lambda *args: calls.append(args))
+    assert stats['count'] == 3
+    assert sum(stats['workers'].values()) == 3
+    assert sorted(_[0] for _ in calls) == [1, 2, 3]
+
+    # Identical to the figure rendered from scratch
+    fig, ax = create_frame(spec)
+    plot_dataset(ax, *load_dataset(tmp_path / 'a.csv'), spec)
+    fig.canvas.draw()
+    expected = np.asarray(fig.canvas.buffer_rgba())
+    png = mimage.imread(tmp_path / 'out' / 'a.png')
+    np.testing.assert_array_equal(
+        (png * 255).round().astype(np.uint8), expected)
+    plt.close(fig)
+
+
+def test_invalid_spec(tmp_path):
+    _write_datasets(tmp_path)
+    with pytest.raises(ValueError):
+        render_batch(tmp_path, tmp_path, {'method': 'plot'}, jobs=1)
+    with pytest.raises(ValueError):
+        render_batch(tmp_path, tmp_path, {'color': 'k'}, jobs=1)
+    with pytest.raises(ValueError):
+        render_batch(tmp_path, tmp_path, fmt='jpg', jobs=1)
+    with pytest.raises(ValueError):  # no C in 'b.npy'
+        render_batch(tmp_path, tmp_path, {'method': 'tricontourf'}, jobs=1)
+
+
+def test_duplicate_outputs(tmp_path):
+    """Test if datasets giving the same output file are rejected."""
+    _write_datasets(tmp_path)
+    np.save(tmp_path / 'a.npy', _get_values()[:, :3])
+    with pytest.raises(ValueError, match='a.png'):
+        render_batch(tmp_path, tmp_path / 'out', jobs=1)
+    assert not (tmp_path / 'out').exists()
+
+
+def test_main(tmp_path):
+    _write_datasets(tmp_path)
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps({'method': 'scatter', 'kwargs': {'alpha': 1}}))
+    assert main([
+        str(tmp_path / 'a.csv'), str(tmp_path / 'c.npz'),
+        '-o', str(tmp_path / 'out'), '--spec', str(spec),
+        '--method', 'tribin', '--tlim', '0.1', '0.9', '--format', 'pdf',
+        '-j', '1', '-q',
+    ]) == 0
+    assert sorted(_.name for _ in (tmp_path / 'out').iterdir()) == [
+        'a.pdf', 'c.pdf']
@@ -0,0 +1,69 @@
+import numpy as np
+
+import pytest
+import matplotlib.pyplot as plt
+
+from mpltern.conversions import (
+    cartesian_to_ternary, get_corners, ternary_to_cartesian)
+
+
+def _get_points(size=100):
+    np.random.seed(19680801)
+    return np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'rotation': 30.0},
+    {'corners': ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)), 'ternary_sum': 100.0},
+    {'ternary_sum': -1.0},
+])
+def test_same_as_axes(kwargs):
+    """Test if the conversions are the same as the transforms of Axes."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary', **kwargs)
+    ternary_sum = kwargs.pop('ternary_sum', 1.0)
+    tlr = _get_points() * ternary_sum
+
+    xy = ternary_to_cartesian(tlr, **kwargs)
+    np.testing.assert_allclose(xy, ax.transProjection.transform(tlr))
+    np.testing.assert_allclose(ax.corners_data, get_corners(**kwargs))
+
+    tlr_back = cartesian_to_ternary(xy, ternary_sum=ternary_sum, **kwargs)
+    np.testing.assert_allclose(tlr_back, tlr, atol=1e-12 * abs(ternary_sum))
+    plt.close(fig)
+
+
+def test_out():
+    tlr = _get_points()
+    xy = np.empty((len(tlr), 2))
+    assert ternary_to_cartesian(tlr, out=xy) is xy
+    np.testing.assert_allclose(xy, ternary_to_cartesian(tlr))
+
+    tlr_back = np.empty_like(tlr)
+    assert cartesian_to_ternary(xy, out=tlr_back) is tlr_back
+    np.testing.assert_allclose(tlr_back, tlr, atol=1e-12)
+
+
+def test_float32():
+    tlr = _get_points().astype(np.float32)
+    xy = ternary_to_cartesian(tlr)
+    assert xy.dtype == np.float32
+    assert cartesian_to_ternary(xy).dtype == np.float32
+    np.testing.assert_allclose(
+        xy, ternary_to_cartesian(tlr.astype(float)), atol=1e-6)
+
+    # `out` determines the dtype.
+    xy = np.empty((len(tlr), 2), np.float32)
+    ternary_to_cartesian(tlr.astype(float), out=xy)
+    np.testing.assert_allclose(
+        xy, ternary_to_cartesian(tlr.astype(float)), atol=1e-6)
+
+
+def test_shapes():
+    """Test if the leading dimensions are kept."""
+    np.testing.assert_allclose(ternary_to_cartesian([2, 0, 0]), [0.0, 1.0])
+    assert ternary_to_cartesian([1, 1, 0]).shape == (2,)
+    tlr = _get_points(12).reshape(3, 4, 3)
+    assert ternary_to_cartesian(tlr).shape == (3, 4, 2)
+    assert cartesian_to_ternary(np.zeros((3, 4, 2))).shape == (3, 4, 3)
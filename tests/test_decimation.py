@@ -0,0 +1,126 @@
+import numpy as np
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.testing.decorators import check_figures_equal
+
+from mpltern.ternary.decimation import get_line_indices, get_point_indices
+
+
+def _get_points(size=10000):
+    np.random.seed(19680801)
+    return np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size).T
+
+
+def _get_trajectory(size=10000):
+    s = np.linspace(0.0, 8.0 * np.pi, size)
+    t = 0.3 + 0.2 * np.cos(s) * np.exp(-0.1 * s)
+    l = 0.3 + 0.2 * np.sin(s) * np.exp(-0.1 * s)
+    return t, l, 1.0 - t - l
+
+
+def test_line_indices():
+    xy = np.array([
+        [0.1, 0.1],
+        [0.2, 0.3],  # same cell
+        [1.5, 0.5],
+        [np.nan, np.nan],
+        [1.6, 0.6],
+        [1.7, 0.7],  # same cell
+        [1.8, 0.8],  # same cell but the last
+    ])
+    np.testing.assert_array_equal(get_line_indices(xy), [0, 2, 3, 4, 6])
+
+
+def test_point_indices():
+    xy = np.array([
+        [0.1, 0.1],
+        [1.5, 0.5],
+        [0.2, 0.3],  # same cell as the first, drawn on the top
+        [np.nan, 0.0],
+        [1.5, 1.5],
+    ])
+    np.testing.assert_array_equal(get_point_indices(xy), [1, 2, 4])
+
+
+def _get_indices(ax, artist, kind):
+    return ax._decimation._indices[artist][kind][2]
+
+
+def test_decimation():
+    """Test if the points are decimated only when passed to the renderer."""
+    t, l, r = _get_points()
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    ax.set_decimation(2.0)
+    assert ax.get_decimation() == 2.0
+    pc = ax.scatter(t, l, r, c=t, s=l)
+    offsets = pc.get_offsets()
+
+    fig.canvas.draw()
+    assert 0 < len(_get_indices(ax, pc, 'point')) < len(t)
+    assert pc.get_offsets() is offsets
+    np.testing.assert_array_equal(pc.get_array(), t)
+    np.testing.assert_array_equal(pc.get_sizes(), l)
+    # The indices of the picked points refer to the full data.
+    x, y = ax.transData.transform(offsets[-1])
+    event = MouseEvent('button_press_event', fig.canvas, x, y)
+    assert len(t) - 1 in pc.contains(event)[1]['ind']
+
+    ax.set_decimation(None)
+    assert ax.get_decimation() is None
+
+
+def test_zoom():
+    """Test if the decimation is redone after `set_ternary_lim`."""
+    t, l, r = _get_trajectory()
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    ax.set_decimation()
+    line, = ax.plot(t, l, r)
+    fig.canvas.draw()
+    n = len(_get_indices(ax, line, 'line'))
+    assert n < len(t)
+    assert len(line.get_xdata()) == len(t)
+
+    ax.set_ternary_lim(0.1, 0.5, 0.1, 0.5, 0.1, 0.5)
+    fig.canvas.draw()
+    assert len(_get_indices(ax, line, 'line')) > n
+
+
+def test_set_data():
+    """Test if the data given after a draw are decimated anew."""
+    t, l, r = _get_trajectory()
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    ax.set_decimation()
+    line, = ax.plot(t, l, r)
+    fig.canvas.draw()
+    line.set_data([0.0, 0.1], [0.2, 0.3])
+    fig.canvas.draw()
+    np.testing.assert_array_equal(_get_indices(ax, line, 'line'), [0, 1])
+    np.testing.assert_array_equal(line.get_xdata(), [0.0, 0.1])
+
+
+@check_figures_equal(extensions=("png",), tol=1.0)
+def test_decimated_plot(fig_test, fig_ref):
+    t, l, r = _get_trajectory()
+
+    ax = fig_test.add_subplot(projection="ternary")
+    ax.set_decimation()
+    ax.plot(t, l, r)
+
+    ax = fig_ref.add_subplot(projection="ternary")
+    ax.plot(t, l, r)
+
+
+@check_figures_equal(extensions=("png",))
+def test_decimated_scatter(fig_test, fig_ref):
+    t, l, r = _get_points(100)
+
+    ax = fig_test.add_subplot(projection="ternary")
+    ax.set_decimation()
+    ax.scatter(np.repeat(t, 10), np.repeat(l, 10), np.repeat(r, 10))
+
+    ax = fig_ref.add_subplot(projection="ternary")
+    ax.scatter(t, l, r)
@@ -1,9 +1,11 @@
 import numpy as np
 
+import pytest
 import matplotlib.pyplot as plt
 from matplotlib.testing.decorators import image_comparison, check_figures_equal
 from matplotlib.colors import LogNorm
 
+from mpltern import hexbin_helpers
 from mpltern.testing import tol
 
 
@@ -128,3 +130,124 @@ def test_ndarray_cast():
     fig = plt.figure()
     ax = fig.add_subplot(projection="ternary")
     ax.hexbin(tn0, tn1, tn2, gridsize=10, edgecolors="none")
+
+
+def test_keep_index():
+    """Test if the rows in each bin are kept correctly."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000).T
+    _, _, _, it, il, ir = hexbin_helpers.calc_ternary_indices(
+        t, l, r, 10, (0.0, 1.0, 0.0, 1.0, 0.0, 1.0))
+    indices = hexbin_helpers.ternary_to_serial(10, it, il, ir)
+
+    t[5] = np.nan  # deleted but counted in the rows
+    indices[5] = -1
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    collection = ax.hexbin(t, l, r, gridsize=10, mincnt=1, keep_index=True)
+    bin_index = collection.bin_index
+    for cell, count in enumerate(collection.get_array()):
+        rows = bin_index.get_cell_rows(cell)
+        assert len(rows) == count
+        np.testing.assert_array_equal(
+            rows, np.flatnonzero(indices == bin_index.serials[cell]))
+    plt.close(fig)
+
+
+def test_mincnt_polygons():
+    """Test if the bins are kept at their positions when filtered."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000).T
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    ref = ax.hexbin(t, l, r, gridsize=10)
+    test = ax.hexbin(t, l, r, C=t, gridsize=10, mincnt=1)
+    is_kept = ref.get_array() >= 1
+    np.testing.assert_allclose(
+        test.get_paths()[0].vertices, ref.get_paths()[0].vertices)
+    np.testing.assert_allclose(test.get_offsets(), ref.get_offsets()[is_kept])
+    plt.close(fig)
+
+
+def test_prebinned():
+    """Test if the pre-binned values give the same bins as the points."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000).T
+    _, _, _, it, il, ir = hexbin_helpers.calc_ternary_indices(
+        t, l, r, 10, (0.0, 1.0, 0.0, 1.0, 0.0, 1.0))
+    indices = hexbin_helpers.ternary_to_serial(10, it, il, ir)
+    serials, counts = np.unique(indices, return_counts=True)
+
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    ref = ax.hexbin(t, l, r, gridsize=10, mincnt=1)
+    # shuffled and split into duplicates
+    order = np.random.permutation(2 * len(serials))
+    tests = [
+        ax.hexbin_prebinned(serials, counts, gridsize=10),
+        ax.hexbin_prebinned(
+            np.tile(serials, 2)[order], np.tile(counts / 2, 2)[order],
+            gridsize=10),
+        ax.hexbin_prebinned(
+            *hexbin_helpers.serial_to_ternary(10, serials), counts,
+            gridsize=10),
+    ]
+    for test in tests:
+        np.testing.assert_allclose(test.get_array(), ref.get_array())
+        np.testing.assert_allclose(test.get_offsets(), ref.get_offsets())
+        np.testing.assert_allclose(
+            [_.vertices for _ in test.get_paths()],
+            [_.vertices for _ in ref.get_paths()])
+    plt.close(fig)
+
+
+def test_prebinned_invalid():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    with pytest.raises(TypeError):
+        ax.hexbin_prebinned([0, 1], gridsize=10)
+    with pytest.raises(ValueError):
+        ax.hexbin_prebinned([0, 1], [1.0], gridsize=10)
+    with pytest.raises(ValueError):
+        ax.hexbin_prebinned([0, 1000], [1.0, 1.0], gridsize=10)
+    with pytest.raises(ValueError):  # it + il + ir is inconsistent
+        ax.hexbin_prebinned([1], [1], [1], [1.0], gridsize=10)
+    with pytest.raises(ValueError):
+        ax.hexbin_prebinned([0.5], [1.0], gridsize=10)
+    plt.close(fig)
+
+
+def test_prebinned_empty():
+    """Test if empty pre-binned values are accepted like empty points."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    for args in [([], []), ([], [], [], [])]:
+        collection = ax.hexbin_prebinned(*args, gridsize=10)
+        assert len(collection.get_array()) == 0
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    'reduce_C_function', ['majority', 'purity', 'entropy'])
+def test_categorical(reduce_C_function):
+    """Test if the class labels are reduced correctly."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000).T
+    labels = np.array(['x', 'y', 'z'])[np.random.randint(3, size=1000)]
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    collection = ax.hexbin(t, l, r, C=labels, gridsize=5, keep_index=True,
+                           reduce_C_function=reduce_C_function)
+    np.testing.assert_array_equal(collection.categories, ['x', 'y', 'z'])
+    for cell, value in enumerate(collection.get_array()):
+        rows = collection.bin_index.get_cell_rows(cell)
+        counts = np.array([np.sum(labels[rows] == _) for _ in 'xyz'])
+        p = counts / counts.sum()
+        expected = {
+            'majority': np.argmax(counts),
+            'purity': np.max(p),
+            'entropy': -np.sum(p[p > 0] * np.log(p[p > 0])),
+        }[reduce_C_function]
+        assert value == pytest.approx(expected)
+    plt.close(fig)
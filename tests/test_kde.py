@@ -0,0 +1,60 @@
+"""Tests for the kernel density estimate"""
+import numpy as np
+import pytest
+
+from mpltern.datasets import get_dirichlet_pdfs, get_triangular_grid
+from mpltern.kde import ternary_kde
+
+
+def test_direct_evaluation():
+    """Test if the KDE agrees with the direct evaluation."""
+    np.random.seed(19680801)
+    points = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=300).T
+    h = 0.05
+    t, l, r, densities = ternary_kde(*points, gridsize=100, bandwidth=h)
+
+    dt = t[:, None] - points[0]
+    dr = r[:, None] - points[2]
+    d2 = dt ** 2 + dr ** 2 + dt * dr
+    densities_ref = np.exp(-0.5 * d2 / h ** 2).sum(axis=1)
+    # normalization on the (t, l) plane
+    densities_ref *= np.sqrt(3.0) / 2.0 / (2.0 * np.pi * h ** 2) / 300
+
+    np.testing.assert_allclose(
+        densities, densities_ref, atol=2e-3 * densities_ref.max())
+
+
+def test_dirichlet():
+    """Test if the KDE reproduces the Dirichlet distribution."""
+    np.random.seed(19680801)
+    alpha = (5.0, 5.0, 5.0)
+    points = np.random.dirichlet(alpha=alpha, size=100000).T
+    t, l, r, densities = ternary_kde(*points, gridsize=30, bandwidth=0.02)
+    pdfs = get_dirichlet_pdfs(n=31, alpha=alpha)[3]
+    is_inside = (t > 0.2) & (l > 0.2) & (r > 0.2)
+    np.testing.assert_allclose(densities[is_inside], pdfs[is_inside], rtol=0.1)
+
+
+def test_weights():
+    """Test if weights work in the same way as repeated points."""
+    np.random.seed(19680801)
+    points = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=100).T
+    weights = np.random.randint(1, 4, size=100)
+    repeated = np.repeat(points, weights, axis=1)
+    densities = ternary_kde(*points, weights=weights, bandwidth=0.05)[3]
+    densities_ref = ternary_kde(*repeated, bandwidth=0.05)[3]
+    np.testing.assert_allclose(densities, densities_ref, atol=1e-10)
+
+
+@pytest.mark.parametrize('gridsize', [10, 100])
+def test_on_nodes(gridsize):
+    """Test if points on the lattice nodes are binned only once."""
+    points = get_triangular_grid(n=11)
+    # The kernel is effectively the delta function.
+    t, l, r, densities = ternary_kde(*points, gridsize=gridsize,
+                                     bandwidth=1e-6)
+    masses = densities * len(points[0]) / gridsize ** 2
+    np.testing.assert_allclose(masses.sum(), len(points[0]))
+    is_node = np.isclose(t * 10, np.round(t * 10))
+    is_node &= np.isclose(r * 10, np.round(r * 10))
+    np.testing.assert_allclose(masses[is_node], 1.0)
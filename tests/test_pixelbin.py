@@ -0,0 +1,66 @@
+import numpy as np
+
+import pytest
+import matplotlib.pyplot as plt
+
+
+def _get_points(size=10000):
+    np.random.seed(19680801)
+    return np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size).T
+
+
+def test_counts():
+    """Test if all the points are counted."""
+    t, l, r = _get_points()
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    image = ax.pixelbin(t, l, r)
+    assert np.nansum(image.get_array()) == len(t)
+
+
+@pytest.mark.parametrize("reduce_C_function", ["mean", np.sum, np.amax])
+def test_reduce_C_function(reduce_C_function):
+    """Test if the values are reduced in the same way as the reference."""
+    t, l, r = _get_points(1000)
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    image = ax.pixelbin(
+        t, l, r, C=t, reduce_C_function=reduce_C_function, pixelsize=20.0)
+    accum = image.get_array()
+
+    ny, nx = accum.shape
+    xmin, xmax, ymin, ymax = image.get_extent()
+    x, y = ax.transProjection.transform(np.column_stack((t, l, r))).T
+    ix = np.floor((x - xmin) / (xmax - xmin) * nx).astype(int)
+    iy = np.floor((y - ymin) / (ymax - ymin) * ny).astype(int)
+    if isinstance(reduce_C_function, str):
+        reduce_C_function = getattr(np, reduce_C_function)
+    for j, i in zip(*np.nonzero(~accum.mask)):
+        expected = reduce_C_function(t[(ix == i) & (iy == j)])
+        np.testing.assert_allclose(accum[j, i], expected)
+
+
+def test_invalid_reduce_C_function():
+    t, l, r = _get_points(10)
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    with pytest.raises(ValueError):
+        ax.pixelbin(t, l, r, C=t, reduce_C_function=np.median)
+
+
+def test_reaggregation():
+    """Test if the points are aggregated again when the view is changed."""
+    t, l, r = _get_points()
+    fig = plt.figure(figsize=(4.0, 4.0))
+    ax = fig.add_subplot(projection="ternary")
+    image = ax.pixelbin(t, l, r)
+    shape = image.get_array().shape
+
+    fig.set_size_inches(8.0, 8.0)
+    fig.canvas.draw()
+    assert image.get_array().shape[0] > shape[0]
+
+    ax.set_ternary_lim(0.0, 0.5, 0.0, 1.0, 0.0, 1.0)
+    fig.canvas.draw()
+    assert np.nansum(image.get_array()) < len(t)
+    np.testing.assert_allclose(image.get_extent()[:2], ax.get_xlim())
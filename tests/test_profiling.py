@@ -0,0 +1,147 @@
+import logging
+import threading
+
+import numpy as np
+
+import pytest
+import matplotlib.artist as martist
+import matplotlib.pyplot as plt
+
+from mpltern.ternary import profiling
+
+
+def _get_points(size=1000):
+    np.random.seed(19680801)
+    return np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size).T
+
+
+class _FailingArtist(martist.Artist):
+    def draw(self, renderer):
+        raise RuntimeError
+
+
+def test_disabled():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary')
+    assert ax.get_profiler() is None
+    ax.plot(*_get_points(10))
+    fig.canvas.draw()
+    assert not profiling.is_active()
+
+
+def test_axes_profiling():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary')
+    ax.set_profiling(True)
+    profiler = ax.get_profiler()
+    t, l, r = _get_points()
+    ax.plot(t[:10], l[:10], r[:10])
+    ax.hexbin(t, l, r, gridsize=10)
+    ax.set_title('title')
+    fig.canvas.draw()
+    fig.canvas.draw()
+    report = profiler.report()
+    for name in [
+        'parse',
+        'hexbin',
+        'hexbin.binning',
+        'draw',
+        'draw.PolyCollection',
+        'draw.Line2D',
+        'title_position',
+        'ticks.label_position',
+        'ticks.update_position',
+        'text.layout',
+        'transform.BarycentricTransform',
+    ]:
+        assert name in report, name
+    assert report['draw']['calls'] == 2
+    assert report['hexbin']['calls'] == 1
+    # Phases are in the descending order of the time.
+    times = [_['time'] for _ in report.values()]
+    assert times == sorted(times, reverse=True)
+    assert not profiling.is_active()
+
+    ax.set_profiling(False)
+    assert ax.get_profiler() is None
+    fig.canvas.draw()
+    assert profiler.report()['draw']['calls'] == 2
+
+
+def test_profile():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary')
+    with profiling.profile() as profiler:
+        ax.tribin(*_get_points(), gridsize=10)
+        fig.canvas.draw()
+    assert not profiling.is_active()
+    report = profiler.report()
+    assert report['tribin']['calls'] == 1
+    assert report['tribin.binning']['calls'] == 1
+    assert report['draw']['calls'] == 1
+
+    # Records are not added outside the context.
+    fig.canvas.draw()
+    assert profiler.report()['draw']['calls'] == 1
+
+    profiler.reset()
+    assert profiler.report() == {}
+
+
+def test_nested():
+    """Test if a phase is recorded only once in nested profilers."""
+    outer = profiling.Profiler()
+    inner = profiling.Profiler()
+    with profiling.profile(outer):
+        with profiling.profile(inner), profiling.phase('a'):
+            pass
+        with profiling.phase('b', inner), profiling.phase('c'):
+            pass
+        with profiling.profile(outer), profiling.phase('d'):
+            pass
+    assert {_: v['calls'] for _, v in outer.report().items()} == {
+        'a': 1, 'b': 1, 'c': 1, 'd': 1}
+    assert sorted(inner.report()) == ['a', 'b', 'c']
+
+
+def test_threads():
+    """Test if a profiler records only the phases in its own thread."""
+    barrier = threading.Barrier(2)
+    profilers = []
+
+    def target(name):
+        with profiling.profile() as profiler:
+            barrier.wait()
+            with profiling.phase(name):
+                barrier.wait()
+        profilers.append(profiler)
+
+    threads = [threading.Thread(target=target, args=(_,)) for _ in 'ab']
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(list(_.report()) for _ in profilers) == [['a'], ['b']]
+    assert not profiling.is_active()
+
+
+def test_error():
+    """Test if the profiling is stopped after an error in a draw."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary')
+    ax.set_profiling(True)
+    ax.add_artist(_FailingArtist())
+    with pytest.raises(RuntimeError):
+        fig.canvas.draw()
+    assert not profiling.is_active()
+    assert 'draw._FailingArtist' in ax.get_profiler().report()
+
+
+def test_log(caplog):
+    profiler = profiling.Profiler()
+    profiler.add('draw', 0.5)
+    profiler.add('draw', 0.25)
+    with caplog.at_level(logging.INFO, logger='mpltern.ternary.profiling'):
+        profiler.log()
+    assert 'draw: 2 calls, 750.000 ms' in caplog.text
+    assert 'draw' in profiler.format()
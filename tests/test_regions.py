@@ -0,0 +1,63 @@
+"""Tests for the classification into regions"""
+import numpy as np
+
+import pytest
+import matplotlib.path as mpath
+from mpltern.datasets import get_triangular_grid, soil_texture_classes
+from mpltern.regions import TernaryRegionIndex
+
+
+def classify_reference(t, l, r, regions):
+    ids = np.full(len(t), -1)
+    points = np.column_stack((t, l)) / (t + l + r)[:, None]
+    for i, vertices in enumerate(regions.values()):
+        vertices = np.asarray(vertices, float)
+        vertices /= np.sum(vertices, axis=1)[:, None]
+        is_inside = mpath.Path(vertices[:, :2]).contains_points(points)
+        ids[(ids == -1) & is_inside] = i
+    return ids
+
+
+@pytest.mark.parametrize("gridsize", [1, 7, 128])
+def test_classify(gridsize):
+    """Test if points are classified in the same way as the reference."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(1.0, 1.0, 1.0), size=10000).T
+    index = TernaryRegionIndex(soil_texture_classes, gridsize=gridsize)
+    ids = index.classify(t, l, r)
+    ids_ref = classify_reference(t, l, r, soil_texture_classes)
+    np.testing.assert_array_equal(ids, ids_ref)
+
+
+def test_classify_grid():
+    """Test points on the lattice, on which bins and regions may meet."""
+    t, l, r = get_triangular_grid(n=101)
+    t, l, r = 100.0 * t, 100.0 * l, 100.0 * r
+    index = TernaryRegionIndex(soil_texture_classes, gridsize=50)
+    ids = index.classify(t, l, r)
+    ids_ref = classify_reference(t, l, r, soil_texture_classes)
+    np.testing.assert_array_equal(ids, ids_ref)
+
+
+def test_classify_shape():
+    """Test if the input is broadcast and scalars give a scalar."""
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(1.0, 1.0, 1.0), size=12).T
+    index = TernaryRegionIndex(soil_texture_classes)
+    ids = index.classify(t, l, r)
+    assert np.ndim(index.classify(20, 40, 40)) == 0
+    assert index.classify(t[0], l[0], r[0]) == ids[0]
+    ids_2d = index.classify(t.reshape(3, 4), l.reshape(3, 4), r[0])
+    assert ids_2d.shape == (3, 4)
+    np.testing.assert_array_equal(
+        ids_2d, index.classify(t, l, np.full(12, r[0])).reshape(3, 4))
+    assert index.count(20, 40, 40).sum() == 1
+
+
+def test_count():
+    np.random.seed(19680801)
+    t, l, r = np.random.dirichlet(alpha=(1.0, 1.0, 1.0), size=10000).T
+    regions = {"top": [[1, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5]]}
+    index = TernaryRegionIndex(regions)
+    counts = index.count(t, l, r)
+    assert counts.tolist() == [np.sum(t > 0.5)]
@@ -0,0 +1,95 @@
+import numpy as np
+
+import pytest
+from cycler import cycler
+import matplotlib.image as mimage
+import matplotlib.pyplot as plt
+
+from mpltern.rendering import TernaryTemplate
+
+
+def _create_frame():
+    fig = plt.figure(figsize=(4.0, 4.0))
+    ax = fig.add_subplot(projection='ternary')
+    ax.set_tlim(0.1, 0.9)
+    ax.set_tlabel('Top')
+    ax.set_title('Title')
+    ax.grid()
+    return fig, ax
+
+
+def _get_datasets():
+    np.random.seed(19680801)
+    return [np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=200).T
+            for _ in range(2)]
+
+
+def _render_fresh(plot):
+    fig, ax = _create_frame()
+    plot(ax)
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return rgba
+
+
+@pytest.mark.parametrize('method', ['plot', 'scatter', 'hexbin'])
+def test_identical_to_fresh(method):
+    """Test if the rendering is identical to that of a fresh figure."""
+    fig, ax = _create_frame()
+    template = TernaryTemplate(fig)
+    children = ax.get_children()
+    for tlr in _get_datasets():
+        def plot(ax):
+            getattr(ax, method)(*tlr)
+        np.testing.assert_array_equal(
+            template.render(plot), _render_fresh(plot))
+        assert ax.get_children() == children
+    plt.close(fig)
+
+
+def test_prop_cycle():
+    """Test if every dataset starts from the beginning of the cycle."""
+    fig, ax = _create_frame()
+    template = TernaryTemplate(fig, prop_cycle=cycler(color=['red', 'blue']))
+    colors = []
+
+    def plot(ax):
+        colors.extend(_.get_color() for _ in ax.plot(*_get_datasets()[0]))
+        colors.extend(_.get_color() for _ in ax.plot(*_get_datasets()[1]))
+
+    template.render(plot)
+    template.render(plot)
+    assert colors == ['red', 'blue', 'red', 'blue']
+    plt.close(fig)
+
+
+def test_fname(tmp_path):
+    fig, ax = _create_frame()
+    template = TernaryTemplate(fig)
+    rgba = template.render(lambda ax: ax.scatter(*_get_datasets()[0]),
+                           tmp_path / 'scatter.png')
+    png = mimage.imread(tmp_path / 'scatter.png')
+    np.testing.assert_array_equal((png * 255).round().astype(np.uint8), rgba)
+    plt.close(fig)
+
+
+def test_invalid():
+    fig = plt.figure()
+    fig.add_subplot()
+    with pytest.raises(ValueError):
+        TernaryTemplate(fig)
+    plt.close(fig)
+
+    fig, ax = _create_frame()
+    template = TernaryTemplate(fig)
+    children = ax.get_children()
+
+    def plot(ax):
+        ax.plot(*_get_datasets()[0])
+        ax.set_tlim(0.2, 0.8)
+
+    with pytest.raises(ValueError):
+        template.render(plot)
+    assert ax.get_children() == children
+    plt.close(fig)
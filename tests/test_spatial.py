@@ -0,0 +1,223 @@
+import numpy as np
+
+import pytest
+import matplotlib.path as mpath
+import matplotlib.pyplot as plt
+
+from mpltern.spatial import BinIndex, GridIndex
+
+
+def _get_points(size=1000):
+    np.random.seed(19680801)
+    return np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size)
+
+
+def _get_distances(xy, points):
+    return np.sqrt(np.sum((xy[None, :, :] - points[:, None, :]) ** 2, axis=2))
+
+
+class TestGridIndex:
+    def test_nearest(self):
+        xy = _get_points()[:, :2]
+        points = np.random.uniform(-0.5, 1.5, size=(100, 2))
+        indices, distances = GridIndex(xy).nearest(points)
+        expected = _get_distances(xy, points)
+        np.testing.assert_array_equal(indices, np.argmin(expected, axis=1))
+        np.testing.assert_allclose(distances, np.min(expected, axis=1))
+
+    def test_nearest_max_distance(self):
+        index = GridIndex([[0.0, 0.0], [1.0, 0.0]])
+        assert index.nearest([0.9, 0.0]) == pytest.approx((1, 0.1))
+        assert index.nearest([0.5, 2.0], max_distance=1.0) == (-1, np.inf)
+
+    def test_within(self):
+        xy = _get_points()[:, :2]
+        points = np.random.uniform(-0.1, 1.1, size=(20, 2))
+        index = GridIndex(xy)
+        expected = _get_distances(xy, points)
+        for point, d in zip(points, expected):
+            np.testing.assert_array_equal(
+                index.within(point, 0.05), np.flatnonzero(d <= 0.05))
+
+    def test_within_polygon(self):
+        xy = np.random.uniform(size=(10000, 2))
+        index = GridIndex(xy)
+        for _ in range(10):
+            # random star-shaped or self-intersecting polygons
+            n = np.random.randint(3, 50)
+            angles = np.random.uniform(0.0, 2.0 * np.pi, n)
+            if _ % 2:
+                angles.sort()
+            radii = np.random.uniform(0.05, 0.6, n)
+            vertices = 0.5 + radii[:, None] * np.column_stack(
+                (np.cos(angles), np.sin(angles)))
+            expected = mpath.Path(vertices).contains_points(xy)
+            np.testing.assert_array_equal(
+                index.within_polygon(vertices), np.flatnonzero(expected))
+        assert len(index.within_polygon([[2, 2], [3, 2], [3, 3]])) == 0
+        assert len(index.within_polygon([[0, 0], [1, 1]])) == 0
+
+    @pytest.mark.parametrize('xy', [
+        np.zeros((0, 2)),
+        np.zeros((5, 2)),
+        [[0.0, 0.0], [1.0, 0.0], [np.nan, 0.0]],
+    ])
+    def test_degenerate(self, xy):
+        index = GridIndex(xy)
+        expected = _get_distances(np.asarray(xy, float), np.ones((1, 2)))[0]
+        expected[np.isnan(expected)] = np.inf
+        i, d = index.nearest([1.0, 1.0])
+        assert i == (np.argmin(expected) if len(expected) else -1)
+        assert d == pytest.approx(np.min(expected, initial=np.inf))
+        np.testing.assert_array_equal(
+            index.within([1.0, 1.0], 1.0), np.flatnonzero(expected <= 1.0))
+
+
+class TestFind:
+    @pytest.mark.parametrize('corners', [None, ((0, 0), (1, 0), (0, 1))])
+    def test_ternary(self, corners):
+        fig = plt.figure()
+        ax = fig.add_subplot(
+            projection='ternary', ternary_sum=100.0, corners=corners)
+        tlr = _get_points() * 100.0
+        pc = ax.scatter(*tlr.T)
+        point = [30.0, 30.0, 40.0]
+        distances = np.linalg.norm(tlr - point, axis=1)
+        i, d = ax.find_nearest(pc, point)
+        assert i == np.argmin(distances)
+        assert d == pytest.approx(np.min(distances))
+        # not normalized
+        assert ax.find_nearest(pc, [3.0, 3.0, 4.0]) == (i, pytest.approx(d))
+        np.testing.assert_array_equal(
+            ax.find_within(pc, point, 5.0), np.flatnonzero(distances <= 5.0))
+        plt.close(fig)
+
+    def test_display(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        tlr = _get_points()
+        lines = ax.plot(*tlr.T)
+        fig.canvas.draw()
+        xy = ax.transData.transform(ax.transProjection.transform(tlr))
+        assert ax.find_nearest(lines[0], xy[7], coords='display')[0] == 7
+
+        # The index in the display coordinates follows the view.
+        ax.set_ternary_min(0.1, 0.1, 0.1)
+        xy = ax.transData.transform(ax.transProjection.transform(tlr))
+        np.testing.assert_array_equal(
+            ax.find_nearest(lines[0], xy[:5], coords='display')[0],
+            np.arange(5))
+        plt.close(fig)
+
+    def test_cache(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        tlr = _get_points()
+        pc = ax.scatter(*tlr.T)
+        index = ax._get_point_index(pc, 'ternary')
+        assert ax._get_point_index(pc, 'ternary') is index
+        ax.set_ternary_min(0.1, 0.1, 0.1)
+        assert ax._get_point_index(pc, 'ternary') is index
+        pc.set_offsets(pc.get_offsets()[:10])
+        assert ax._get_point_index(pc, 'ternary') is not index
+        assert ax.find_nearest(pc, tlr[20])[0] < 10
+        plt.close(fig)
+
+    def test_decimation(self):
+        """Test if the indices refer to the full data."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        ax.set_decimation(50.0)
+        tlr = _get_points()
+        pc = ax.scatter(*tlr.T)
+        fig.canvas.draw()
+        assert len(pc.get_offsets()) == len(tlr)
+        for i in [0, 500, 999]:
+            assert ax.find_nearest(pc, tlr[i])[0] == i
+        plt.close(fig)
+
+    def test_invalid(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        pc = ax.scatter(*_get_points().T)
+        with pytest.raises(ValueError):
+            ax.find_nearest(pc, [1, 1, 1], coords='data')
+        with pytest.raises(ValueError):
+            ax.find_nearest(ax.patch, [1, 1, 1])
+        lines = ax.plot([0, 1], [0, 1], transform=ax.transAxes)
+        with pytest.raises(ValueError):
+            ax.find_nearest(lines[0], [1, 1])
+        plt.close(fig)
+
+    @pytest.mark.parametrize('coords', ['ternary', 'display'])
+    def test_in_polygon(self, coords):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        tlr = _get_points()
+        pc = ax.scatter(*tlr.T)
+        vertices = [[0.1, 0.2, 0.7], [0.4, 0.1, 0.5], [0.2, 0.2, 0.6],
+                    [0.3, 0.5, 0.2]]
+        trans = ax.transProjection + ax.transData
+        path = mpath.Path(trans.transform(vertices))
+        expected = np.flatnonzero(path.contains_points(trans.transform(tlr)))
+        assert len(expected)
+        if coords == 'display':
+            vertices = trans.transform(vertices)
+        np.testing.assert_array_equal(
+            ax.find_in_polygon(pc, vertices, coords=coords), expected)
+        plt.close(fig)
+
+
+class TestBinIndex:
+    def test_rows(self):
+        indices = [2, -1, 0, 2, 2, 0]
+        bin_index = BinIndex(indices, 4, rows=np.arange(10, 16))
+        np.testing.assert_array_equal(bin_index.counts, [2, 0, 3, 0])
+        np.testing.assert_array_equal(bin_index.get_rows(0), [12, 15])
+        np.testing.assert_array_equal(bin_index.get_rows(1), [])
+        np.testing.assert_array_equal(bin_index.get_rows(2), [10, 13, 14])
+        bin_index.serials = np.array([0, 2])
+        np.testing.assert_array_equal(bin_index.get_cell_rows(1), [10, 13, 14])
+
+    def test_reduce(self):
+        indices = [2, -1, 0, 2, 2, 0]
+        C = [1.0, 100.0, 2.0, 3.0, 5.0, 4.0]
+        bin_index = BinIndex(indices, 4)
+        np.testing.assert_allclose(
+            bin_index.reduce(C, np.mean), [3.0, np.nan, 3.0, np.nan])
+        np.testing.assert_allclose(
+            bin_index.reduce(C, np.sum), [6.0, 0.0, 9.0, 0.0])
+        np.testing.assert_allclose(
+            bin_index.reduce(C, np.sum, mincnt=3),
+            [np.nan, np.nan, 9.0, np.nan])
+
+    @pytest.mark.parametrize('method', ['poisson', 'resample'])
+    def test_bootstrap(self, method):
+        """Test if the intervals agree with the standard errors."""
+        np.random.seed(19680801)
+        indices = np.repeat([0, 2], 2000)
+        C = np.random.normal(size=4000) * np.repeat([1.0, 2.0], 2000)
+        bin_index = BinIndex(indices, 3)
+        lower, upper = bin_index.bootstrap(
+            C, replicates=400, method=method, seed=0)
+        expected = 2.0 * 1.96 * np.array([1.0, 2.0]) / np.sqrt(2000)
+        np.testing.assert_allclose((upper - lower)[[0, 2]], expected, rtol=0.2)
+        assert np.isnan(lower[1]) and np.isnan(upper[1])
+
+        # reproducible with the seed
+        np.testing.assert_array_equal(
+            bin_index.bootstrap(C, replicates=10, method=method, seed=0),
+            bin_index.bootstrap(C, replicates=10, method=method, seed=0))
+
+        lower, upper = bin_index.bootstrap(replicates=100, method=method)
+        assert lower[1] == upper[1] == 0.0
+        assert lower[0] < 2000.0 < upper[0]
+
+    def test_bootstrap_invalid(self):
+        bin_index = BinIndex([0, 1], 2)
+        with pytest.raises(ValueError):
+            bin_index.bootstrap([1.0, 2.0], reduce='median')
+        with pytest.raises(ValueError):
+            bin_index.bootstrap(reduce='mean')
+        with pytest.raises(ValueError):
+            bin_index.bootstrap(method='jackknife')
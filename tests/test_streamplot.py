@@ -0,0 +1,119 @@
+import numpy as np
+
+import pytest
+import matplotlib.pyplot as plt
+from mpltern.datasets import get_triangular_grid
+
+
+def _rock_paper_scissors(t, l, r):
+    x = np.stack((t, l, r))
+    payoff_matrix = np.array([
+        [0.0, -1.0, 1.0],
+        [1.0, 0.0, -1.0],
+        [-1.0, 1.0, 0.0],
+    ])
+    fitness = payoff_matrix @ x
+    return (fitness - np.sum(fitness * x, axis=0)) * x
+
+
+def _to_the_top(t, l, r):
+    return 1.0 - t, -l, -r
+
+
+def _get_points(stream_container):
+    segments = stream_container.lines.get_segments()
+    return np.concatenate(segments)
+
+
+@pytest.mark.parametrize("ternary_sum", [1.0, 100.0])
+def test_inside(ternary_sum):
+    """Test if the streamlines are inside the triangle."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary", ternary_sum=ternary_sum)
+    sc = ax.streamplot(_rock_paper_scissors)
+    xy = _get_points(sc)
+    tlr = ax.transProjection.inverted().transform(xy)
+    assert np.all(tlr > -1e-9 * ternary_sum)
+    np.testing.assert_allclose(np.sum(tlr, axis=1), ternary_sum)
+    assert len(sc.arrows.get_paths()) == len(sc.lines.get_segments())
+
+
+def test_start_points():
+    """Test if the streamlines start from the given points."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    start_points = [[0.1, 0.3, 0.6], [0.2, 0.7, 0.1]]
+    sc = ax.streamplot(
+        _to_the_top, start_points=start_points,
+        integration_direction='forward')
+    segments = sc.lines.get_segments()
+    assert len(segments) == 2
+    for segment, tlr in zip(segments, start_points):
+        tlr_start, tlr_end = ax.transProjection.inverted().transform(
+            segment[[0, -1]])
+        np.testing.assert_allclose(tlr_start, tlr)
+        # The streamlines run straight toward the top corner.
+        assert tlr_end[0] > 0.95
+        np.testing.assert_allclose(tlr_end[1] / tlr_end[2], tlr[1] / tlr[2])
+
+
+def test_lattice():
+    """Test if the field on a lattice gives the same as the callable."""
+    t, l, r = get_triangular_grid(20)
+    dt, dl, dr = _to_the_top(t, l, r)
+    start_points = [[0.1, 0.3, 0.6]]
+
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    sc0 = ax.streamplot(_to_the_top, start_points=start_points)
+    sc1 = ax.streamplot(
+        t, l, r, dt, dl, dr, start_points=start_points,
+        color=np.hypot(dt, dl), linewidth=np.ones_like(t))
+    np.testing.assert_allclose(
+        _get_points(sc0)[[0, -1]], _get_points(sc1)[[0, -1]], atol=1e-6)
+    assert len(sc1.lines.get_array()) == len(sc1.lines.get_segments())
+
+
+def test_transform():
+    """Test if the ternary axes coordinates are projected as such."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary", ternary_sum=100.0)
+    ax.set_ternary_lim(10.0, 90.0, 0.0, 80.0, 10.0, 90.0)
+    start_points = [[0.1, 0.3, 0.6]]
+    sc = ax.streamplot(
+        _to_the_top, start_points=start_points,
+        integration_direction='forward', transform=ax.transTernaryAxes)
+    assert sc.lines.get_transform() == ax.transOuterAxes
+    xy = ax.transOuterAxes.transform(_get_points(sc)[[0]])
+    np.testing.assert_allclose(
+        ax.transTernaryAxes.inverted().transform(xy), start_points)
+
+
+@pytest.mark.parametrize(
+    "integration_direction", ['forward', 'backward', 'both'])
+def test_arrows(integration_direction):
+    """Test if the arrows point along the flow."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    sc = ax.streamplot(
+        _to_the_top, start_points=[[0.4, 0.3, 0.3]],
+        integration_direction=integration_direction)
+    segment, = sc.lines.get_segments()
+    # The top corner is upward on the figure.
+    assert segment[-1, 1] > segment[0, 1]
+    arrow, = ax.patches
+    (x0, y0), (x1, y1) = arrow._posA_posB
+    assert y1 > y0
+
+
+def test_invalid_arguments():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="ternary")
+    with pytest.raises(TypeError):
+        ax.streamplot([0.5], [0.5], [0.0])
+    with pytest.raises(ValueError):
+        ax.streamplot(_to_the_top, color=np.ones(3))
+    with pytest.raises(ValueError):
+        ax.streamplot(_to_the_top, integration_direction='upward')
+    with pytest.raises(ValueError):
+        ax.streamplot(_to_the_top, transform=ax.transProjection)
@@ -1,3 +1,4 @@
+import io
 import inspect
 import itertools
 
@@ -9,7 +10,7 @@ from matplotlib.testing.decorators import (
     image_comparison, check_figures_equal)
 import matplotlib.pyplot as plt
 from mpltern.datasets import (
-    get_spiral, get_scatter_points, get_triangular_grid)
+    get_spiral, get_scatter_points, get_shanon_entropies, get_triangular_grid)
 from mpltern.testing import tol
 
 
@@ -514,6 +515,43 @@ class TestSpans:
         with pytest.raises(ValueError):
             ax.axrline(0.5, transform=ax.transAxes)
 
+    @pytest.mark.parametrize('key', ['t', 'l', 'r'])
+    @check_figures_equal(extensions=('png',))
+    def test_lines_collection(self, fig_test, fig_ref, key):
+        """Test if `ax*lines` are the same as repeated `ax*line`."""
+        x = [0.1, 0.25, 0.6]
+        kwargs = dict(color='k', linewidth=2.0)
+
+        ax = fig_test.add_subplot(projection='ternary')
+        getattr(ax, f'ax{key}lines')(
+            x, ymin=[0.0, 0.2, 0.5], capstyle='projecting', **kwargs)
+
+        ax = fig_ref.add_subplot(projection='ternary')
+        for xi, ymin in zip(x, [0.0, 0.2, 0.5]):
+            getattr(ax, f'ax{key}line')(xi, ymin=ymin, **kwargs)
+
+    @pytest.mark.parametrize('key', ['t', 'l', 'r'])
+    @check_figures_equal(extensions=('png',))
+    def test_spans_collection(self, fig_test, fig_ref, key):
+        """Test if `ax*spans` are the same as repeated `ax*span`."""
+        xmin = [0.1, 0.5]
+        xmax = [0.2, 0.8]
+        kwargs = dict(fc='C0', ec='none', alpha=0.5)
+
+        ax = fig_test.add_subplot(projection='ternary')
+        getattr(ax, f'ax{key}spans')(xmin, xmax, ymax=0.7, **kwargs)
+
+        ax = fig_ref.add_subplot(projection='ternary')
+        for xi, xj in zip(xmin, xmax):
+            getattr(ax, f'ax{key}span')(xi, xj, ymax=0.7, **kwargs)
+
+    def test_axtlines_transform(self):
+        """Test if `axtlines` raises `ValueError` when getting `transform`"""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        with pytest.raises(ValueError):
+            ax.axtlines([0.5], transform=ax.transAxes)
+
 
 class TestTickDirection:
     directions = ['in', 'out', 'inout']
@@ -799,6 +837,97 @@ def test_tripcolor(fig_test, fig_ref):
     ax.set_fc("b")
 
 
+class TestTriangulationCache:
+    def test_reuse(self):
+        """Test if the same ternary data are triangulated only once."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        tn0, tn1, tn2, v = get_shanon_entropies(n=11)
+        cs0 = ax.tricontour(tn0, tn1, tn2, v)
+        cs1 = ax.tricontourf(tn0, tn1, tn2, -v)
+        ax.tripcolor(tn0, tn1, tn2, v)
+        assert len(ax._triangulation_cache) == 1
+        assert cs0._contour_generator is not None
+        assert cs1.levels[0] < 0.0
+
+    def test_modified_data(self):
+        """Test if the cache is not used when the data are modified."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        tn0, tn1, tn2, v = get_shanon_entropies(n=11)
+        ax.tricontour(tn0, tn1, tn2, v)
+        tn0[:], tn1[:] = tn1.copy(), tn0.copy()
+        ax.tricontour(tn0, tn1, tn2, v)
+        assert len(ax._triangulation_cache) == 2
+
+    def test_clear(self):
+        """Test if the cache is cleared by `clear`."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        tn0, tn1, tn2, v = get_shanon_entropies(n=11)
+        ax.tripcolor(tn0, tn1, tn2, v)
+        ax.clear()
+        assert len(ax._triangulation_cache) == 0
+
+    def test_precision(self):
+        """Test if the cache is not used when the precision is changed."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        tn0, tn1, tn2, v = get_shanon_entropies(n=11)
+        ax.tricontour(tn0, tn1, tn2, v)
+        ax.set_precision('float32')
+        ax.tricontour(tn0, tn1, tn2, v)
+        assert len(ax._triangulation_cache) == 2
+
+    @check_figures_equal(extensions=('png',))
+    def test_cached(self, fig_test, fig_ref):
+        """Test if the cached triangulation gives the same plots."""
+        tn0, tn1, tn2, v = get_shanon_entropies(n=11)
+
+        ax = fig_test.add_subplot(projection="ternary")
+        ax.tricontourf(tn0, tn1, tn2, -v)
+        ax.tricontour(tn0, tn1, tn2, v, colors="k")
+
+        ax = fig_ref.add_subplot(projection="ternary")
+        ax.tricontourf(tn0, tn1, tn2, -v)
+        ax._triangulation_cache.clear()
+        ax.tricontour(tn0, tn1, tn2, v, colors="k")
+
+
+class TestTrajectories:
+    @staticmethod
+    def _get_trajectories():
+        tn0, tn1, tn2 = get_spiral()
+        tlr = np.column_stack((tn0, tn1, tn2))
+        return [tlr, tlr[::-1, [1, 2, 0]], tlr[::2, [2, 0, 1]]]
+
+    @pytest.mark.parametrize('ragged', [True, False])
+    @check_figures_equal(extensions=('png',), tol=1.0)
+    def test_trajectories(self, fig_test, fig_ref, ragged):
+        """Test if the trajectories are plotted in the same way as `plot`."""
+        tlrs = self._get_trajectories()
+        if not ragged:
+            tlrs = np.array(tlrs[:2])
+        kwargs = dict(color='C0', linewidth=2.0)
+
+        ax = fig_test.add_subplot(projection='ternary')
+        ax.trajectories(
+            tlrs, capstyle='projecting', joinstyle='round', **kwargs)
+
+        ax = fig_ref.add_subplot(projection='ternary')
+        for tlr in tlrs:
+            ax.plot(*np.transpose(tlr), **kwargs)
+
+    def test_values(self):
+        """Test if the values are mapped to the trajectories."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        lc = ax.trajectories(self._get_trajectories(), C=[0.0, 1.0, 2.0])
+        assert len(lc.get_segments()) == 3
+        assert lc.norm.vmin == 0.0
+        assert lc.norm.vmax == 2.0
+
+
 @mpl.style.context("default")
 @check_figures_equal(extensions=('pdf',), tol=1.0)
 def test_triplot(fig_test, fig_ref):
@@ -834,6 +963,256 @@ def test_grid_both(fig_test, fig_ref):
     ax.grid(axis="r")
 
 
+class TestGridCollection:
+    @staticmethod
+    def _plot(ax):
+        ax.taxis.set_minor_locator(mpl.ticker.AutoMinorLocator(5))
+        ax.laxis.set_minor_locator(mpl.ticker.AutoMinorLocator(5))
+        ax.raxis.set_minor_locator(mpl.ticker.AutoMinorLocator(5))
+        ax.grid(which='major', color='k', linewidth=1.0)
+        ax.grid(which='minor', linestyle='--', linewidth=0.5)
+        ax.grid(axis='r', which='major', color='C1')
+        ax.grid(axis='l', which='minor', linestyle=(0, (5, 2, 1, 2)))
+
+    @check_figures_equal(extensions=('png', 'pdf'), tol=0.5)
+    def test_grid_collection(self, fig_test, fig_ref):
+        """Test if the gridlines are the same as drawn by the ticks."""
+        ax = fig_test.add_subplot(projection='ternary')
+        ax.set_grid_collection(True)
+        self._plot(ax)
+
+        ax = fig_ref.add_subplot(projection='ternary')
+        self._plot(ax)
+
+    def test_groups(self):
+        """Test if the gridlines are grouped by their styles."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        ax.set_grid_collection(True)
+        assert ax.get_grid_collection()
+        self._plot(ax)
+        fig.canvas.draw()
+        # major t and l, major r, minor t and r, and minor l
+        assert len(ax._grid_collections) == 4
+        assert all(_ in ax.get_children() for _ in ax._grid_collections)
+        # The gridlines of the ticks are restored after the draw.
+        ticks = ax.taxis.get_major_ticks()
+        assert all(_.gridline.get_visible() for _ in ticks)
+        assert not fig.stale
+
+
+class TestRasterizationThreshold:
+    @check_figures_equal(extensions=('pdf', 'svg'))
+    def test_rasterized(self, fig_test, fig_ref):
+        """Test if heavy collections are rasterized as set manually."""
+        t, l, r = get_scatter_points(1000)
+
+        ax = fig_test.add_subplot(projection='ternary')
+        ax.set_rasterization_threshold(100)
+        ax.scatter(t, l, r)
+        ax.tripcolor(t[:50], l[:50], r[:50], t[:50])
+
+        ax = fig_ref.add_subplot(projection='ternary')
+        ax.scatter(t, l, r, rasterized=True)
+        ax.tripcolor(t[:50], l[:50], r[:50], t[:50])
+
+    def test_threshold(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        assert ax.get_rasterization_threshold() is None
+        ax.set_rasterization_threshold(100)
+        assert ax.get_rasterization_threshold() == 100
+        t, l, r = get_scatter_points(1000)
+        sc = ax.scatter(t, l, r)
+        hb = ax.hexbin(t, l, r, gridsize=10)  # 66 bins
+        tc = ax.tricontourf(t, l, r, t)
+        with io.StringIO() as f:
+            fig.savefig(f, format='svg')
+            svg = f.getvalue()
+        assert svg.count('<image') == 2  # scatter and tricontourf
+        # Restored after the draw
+        assert not any(_.get_rasterized() for _ in (sc, hb, tc))
+
+    @pytest.mark.parametrize('fmt', ['pdf', 'svg'])
+    def test_grid_collection(self, fmt):
+        """Test if the gathered gridlines are kept vector."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        ax.set_grid_collection(True)
+        ax.minorticks_on()
+        ax.grid(which='both')
+        ax.set_rasterization_threshold(1)
+        with io.BytesIO() as f:
+            fig.savefig(f, format=fmt)
+            data = f.getvalue()
+        assert len(ax._grid_collections) > 0
+        assert b'<image' not in data and b'/Subtype /Image' not in data
+        plt.close(fig)
+
+
+class TestCompare:
+    @pytest.mark.parametrize('density', [False, True])
+    @pytest.mark.parametrize('method', ['hexbin', 'tribin'])
+    def test_compare(self, method, density):
+        """Test if the comparison is the same as that of two binnings."""
+        np.random.seed(19680801)
+        tlr1 = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000)
+        tlr2 = np.random.dirichlet(alpha=(2.0, 4.0, 6.0), size=2000)
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        n1 = getattr(ax, method)(*tlr1.T, gridsize=5).get_array()
+        n2 = getattr(ax, method)(*tlr2.T, gridsize=5).get_array()
+        is_shown = n1 + n2 > 0
+        n1 = n1[is_shown]
+        n2 = n2[is_shown]
+        N1, N2 = (len(tlr1), len(tlr2)) if density else (1, 1)
+        r1, r2 = n1 / len(tlr1), n2 / len(tlr2)
+        expected = {
+            'difference': n2 / N2 - n1 / N1,
+            'log_ratio': np.log(((n2 + 0.5) / N2) / ((n1 + 0.5) / N1)),
+            'significance': (r2 - r1) / np.sqrt(
+                r1 / len(tlr1) + r2 / len(tlr2)),
+        }
+        compare = getattr(ax, f'{method}_compare')
+        for statistic, values in expected.items():
+            collection = compare(
+                tlr1, tlr2, gridsize=5, statistic=statistic, density=density)
+            np.testing.assert_allclose(collection.get_array(), values)
+            assert collection.norm.vmin == -collection.norm.vmax
+
+        with pytest.raises(ValueError):
+            compare(tlr1, tlr2, statistic='ratio')
+        plt.close(fig)
+
+    @pytest.mark.parametrize('statistic',
+                             ['difference', 'log_ratio', 'significance'])
+    @pytest.mark.parametrize('method', ['hexbin', 'tribin'])
+    def test_empty(self, method, statistic):
+        """Test if empty datasets give an empty collection like binning."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        compare = getattr(ax, f'{method}_compare')
+        collection = compare(
+            np.empty((0, 3)), np.empty((0, 3)), statistic=statistic)
+        assert len(collection.get_array()) == 0
+        fig.canvas.draw()
+        plt.close(fig)
+
+    @pytest.mark.parametrize('method', ['hexbin', 'tribin'])
+    def test_profiling(self, method):
+        """Test if the binning is recorded under the name of the method."""
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        ax.set_profiling(True)
+        tlr = np.column_stack(get_scatter_points(100))
+        getattr(ax, f'{method}_compare')(tlr, tlr, gridsize=5)
+        assert f'{method}_compare.binning' in ax.get_profiler().report()
+        plt.close(fig)
+
+
+class TestBootstrap:
+    @pytest.mark.parametrize('method', ['hexbin', 'tribin'])
+    def test_bootstrap(self, method):
+        np.random.seed(19680801)
+        t, l, r = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=1000).T
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="ternary")
+        binning = getattr(ax, method)
+        collection = binning(
+            t, l, r, C=t, gridsize=5, bootstrap=50, bootstrap_seed=0)
+        widths = collection.interval_widths
+        assert widths.shape == collection.get_array().shape
+        assert np.all(widths >= 0.0)
+        collection.set_alpha(1.0 - widths / widths.max())
+        fig.canvas.draw()
+
+        # reproduced by the same seed, with the data kept as they are
+        collection = binning(
+            t, l, r, C=t, gridsize=5, bootstrap=50, bootstrap_seed=0)
+        np.testing.assert_array_equal(collection.interval_widths, widths)
+
+        with pytest.raises(ValueError):
+            binning(t, l, r, C=t, reduce_C_function=np.median, bootstrap=50)
+        plt.close(fig)
+
+
+class TestPrecision:
+    """Test the float32 mode against the float64 one."""
+    @staticmethod
+    def _get_points(size=100000):
+        np.random.seed(19680801)
+        tlr = np.random.dirichlet(alpha=(2.0, 4.0, 8.0), size=size)
+        return tlr.astype(np.float32).T
+
+    def test_precision(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary')
+        assert ax.get_precision() == 'float64'
+        ax.set_precision('float32')
+        assert ax.get_precision() == 'float32'
+        with pytest.raises(ValueError):
+            ax.set_precision('float16')
+        plt.close(fig)
+
+    @pytest.mark.parametrize('rotation', [None, 30.0])
+    def test_transforms(self, rotation):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='ternary', ternary_sum=100.0,
+                             rotation=rotation)
+        tlr = np.column_stack(self._get_points()) * np.float32(100.0)
+        expected = ax.transProjection.transform(tlr)
+        assert expected.dtype == np.float64
+        ax.set_precision('float32')
+        xy = ax.transProjection.transform(tlr)
+        assert xy.dtype == np.float32
+        np.testing.assert_allclose(xy, expected, atol=4 * 2 ** -23)
+        tlr_back = ax.transProjection.inverted().transform(xy)
+        assert tlr_back.dtype == np.float32
+        np.testing.assert_allclose(tlr_back, tlr, atol=100.0 * 8 * 2 ** -23)
+        plt.close(fig)
+
+    def test_scatter(self):
+        t, l, r = self._get_points(1000)
+        offsets = []
+        for precision in ['float64', 'float32']:
+            fig = plt.figure()
+            ax = fig.add_subplot(projection='ternary')
+            ax.set_precision(precision)
+            offsets.append(ax.scatter(t, l, r).get_offsets())
+            plt.close(fig)
+        np.testing.assert_allclose(*offsets, atol=4 * 2 ** -23)
+
+    @pytest.mark.parametrize('method', ['hexbin', 'tribin'])
+    def test_binning(self, method):
+        """Test if only few points near the boundaries change the bins."""
+        t, l, r = self._get_points()
+        arrays = []
+        for precision in ['float64', 'float32']:
+            fig = plt.figure()
+            ax = fig.add_subplot(projection='ternary')
+            ax.set_precision(precision)
+            collection = getattr(ax, method)(t, l, r, gridsize=50)
+            arrays.append(collection.get_array())
+            plt.close(fig)
+        moved = np.sum(np.abs(arrays[0] - arrays[1])) / 2
+        assert moved <= len(t) * 50 * 2 ** -23 * 10
+
+    def test_pixelbin(self):
+        t, l, r = self._get_points()
+        images = []
+        for precision in ['float64', 'float32']:
+            fig = plt.figure()
+            ax = fig.add_subplot(projection='ternary')
+            ax.set_precision(precision)
+            image = ax.pixelbin(t, l, r)
+            assert image._xy.dtype == precision
+            fig.canvas.draw()
+            images.append(image.get_array().filled(0.0))
+            plt.close(fig)
+        moved = np.sum(np.abs(images[0] - images[1])) / 2
+        assert moved <= len(t) * 1e-4
+
+
 @image_comparison(baseline_images=['legend'], extensions=['pdf'],
                   tol=max(tol, 0.3), style='mpl20')
 def test_legend():
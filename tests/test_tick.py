@@ -1,6 +1,7 @@
 import numpy as np
 
 import pytest
+import matplotlib.pyplot as plt
 from matplotlib.transforms import Affine2D
 from mpltern.ternary.tick import TernaryTick
 
@@ -492,5 +493,23 @@ def _create_references():
                     '"' + va+ '"'))
 
 
+@pytest.mark.parametrize('rotation', [0.0, 30.0])
+def test_cached_angles(rotation):
+    """Test if the cached angles are updated when the triangle is changed."""
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='ternary', rotation=rotation)
+    fig.canvas.draw()
+    fig.set_size_inches(2.0, 6.0)
+    fig.canvas.draw()
+    for axis in [ax.taxis, ax.laxis, ax.raxis]:
+        tick = axis.get_major_ticks()[0]
+        angles = (
+            tick.get_tick_angle(),
+            tick.get_axis1_angle(),
+            tick.get_axis2_angle(),
+        )
+        np.testing.assert_allclose(tick._get_angles(), angles)
+
+
 if __name__ == '__main__':
     _create_references()